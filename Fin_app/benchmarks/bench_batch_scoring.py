@@ -0,0 +1,80 @@
+"""Columnar risk and health scoring of a client book against the scalar functions.
+
+Scores PROFILES synthetic profiles with the trained model (the default) and
+with the hand-weighted score, and checks a sample of the hand-weighted rows
+against score_risk() and health_score(), which must agree exactly.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_batch_scoring
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.batch_scoring import score_profiles
+from core.financial_metrics import health_score
+from core.predictor import RISK_FACTORS, score_risk
+
+PROFILES = 1_000_000
+CHECK_SAMPLE = 50_000
+
+
+def synthetic_profiles(size, seed=42):
+    """Client book with integer rupee amounts, edge cases included (zero income, zero expenses)"""
+    rng = np.random.default_rng(seed)
+    income = rng.integers(0, 400_000, size)
+    income[::101] = 0
+    expenses = (income * rng.uniform(0.3, 1.2, size)).astype(np.int64)
+    expenses[::103] = 0
+    return pd.DataFrame({
+        'age': rng.integers(18, 80, size),
+        'monthly_income': income,
+        'current_savings': rng.integers(0, 5_000_000, size),
+        'total_debt': rng.integers(0, 10_000_000, size),
+        'investment_experience': rng.integers(0, 16, size),
+        'total_expenses': expenses,
+        'investment_percentage': rng.integers(0, 51, size),
+        'financial_goals': rng.integers(0, 6, size)
+    })
+
+
+def scalar_scores(row):
+    income, expenses = row.monthly_income, row.total_expenses
+    risk = score_risk(row.age, income, row.current_savings, row.total_debt,
+                      row.investment_experience, row.financial_goals)
+    savings_rate = ((income - expenses) / income) * 100 if income > 0 else 0
+    emergency_months = row.current_savings / expenses if expenses > 0 else 0
+    return risk, health_score(savings_rate, emergency_months, row.investment_percentage)
+
+
+def main():
+    profiles = synthetic_profiles(PROFILES)
+    # The hand-weighted run goes last: its scores are the ones checked below
+    for label, hand_weighted in (('trained model', False), ('hand-weighted', True)):
+        start = time.perf_counter()
+        scores = score_profiles(profiles, hand_weighted=hand_weighted)
+        elapsed = time.perf_counter() - start
+        print(f"score_profiles, {label}: {PROFILES:,} profiles in {elapsed:.2f}s "
+              f"({PROFILES / elapsed / 1e6:.2f}M profiles/s)")
+
+    sample = profiles.iloc[:CHECK_SAMPLE]
+    start = time.perf_counter()
+    expected = [scalar_scores(row) for row in sample.itertuples(index=False)]
+    scalar_rate = CHECK_SAMPLE / (time.perf_counter() - start)
+    print(f"scalar functions: {scalar_rate / 1e3:.0f}k profiles/s (~{PROFILES / scalar_rate:.0f}s extrapolated)")
+
+    got = scores.iloc[:CHECK_SAMPLE]
+    mismatches = 0
+    for (risk, health), row in zip(expected, got.itertuples(index=False)):
+        if (risk.profile != row.risk_profile or risk.allocation != row.allocation or risk.score != row.risk_score
+                or health != row.health_score
+                or any(risk.factors[name] != value for name, value in zip(RISK_FACTORS, row[3:-1]))):
+            mismatches += 1
+    print(f"  rows checked against the scalar functions: {CHECK_SAMPLE:,}, mismatches: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Start-up time of a worker that imports the headless engines, checked against a budget.
+
+Each sample is a fresh interpreter that imports the engine modules and exits;
+the wall time of the whole process is what a batch job or service worker pays
+before doing any work. Streamlit, pandas and reportlab must not be loaded:
+CSV/NAV parsing and PDF rendering import them on first use.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_core_import
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+FIN_APP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLES = 7
+BUDGET_MS = 200
+
+ENGINES = [
+    'core.predictor', 'core.tax', 'core.quiz', 'core.education', 'core.integrations',
+    'core.financial_metrics', 'core.projection', 'core.montecarlo', 'core.snapshot_graph'
+]
+HEAVY = ['streamlit', 'pandas', 'reportlab']
+
+PROBE = r'''
+import importlib, json, sys, time
+start = time.perf_counter()
+for module in {engines!r}:
+    importlib.import_module(module)
+print(json.dumps({{'import_ms': (time.perf_counter() - start) * 1000,
+                   'loaded': [name for name in {heavy!r} if name in sys.modules]}}))
+'''
+
+
+def sample():
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', PROBE.format(engines=ENGINES, heavy=HEAVY)],
+                            cwd=FIN_APP, capture_output=True, text=True, check=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    return dict(json.loads(result.stdout), wall_ms=wall_ms)
+
+
+def main():
+    samples = [sample() for _ in range(SAMPLES)]
+    wall = sorted(s['wall_ms'] for s in samples)[SAMPLES // 2]
+    imports = sorted(s['import_ms'] for s in samples)[SAMPLES // 2]
+    loaded = sorted({name for s in samples for name in s['loaded']})
+    print(f"Engines: {', '.join(ENGINES)}")
+    print(f"  process start to engines imported: {wall:.0f} ms (budget {BUDGET_MS} ms), imports alone {imports:.0f} ms")
+    print(f"  heavy modules loaded: {', '.join(loaded) or 'none'}")
+    sys.exit(1 if wall > BUDGET_MS or loaded else 0)
+
+
+if __name__ == '__main__':
+    main()
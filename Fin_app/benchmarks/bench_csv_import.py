@@ -0,0 +1,150 @@
+"""CSV holdings import: original iterrows loop vs the vectorized/streaming reader.
+
+Peak RSS is measured on the app's own upload path, each variant in a fresh
+process since the peak only ever rises.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_csv_import [rows]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.csv_import import COLUMN_MAPPINGS, import_holdings, iter_holdings
+from core.integrations import PortfolioIntegrator
+from core.storage import SQLiteStorage
+
+ROWS = 1_000_000
+ITERROWS_SAMPLE = 20_000
+
+
+def write_export(path, rows, header):
+    rng = np.random.default_rng(7)
+    pd.DataFrame({
+        header[0]: np.char.add('STOCK', rng.integers(0, 5000, rows).astype(str)),
+        header[1]: rng.integers(1, 500, rows),
+        header[2]: rng.uniform(10, 5000, rows).round(2),
+        header[3]: rng.uniform(10, 5000, rows).round(2)
+    }).to_csv(path, index=False)
+
+
+def iterrows_import(path):
+    """The pre-vectorization process_csv_upload loop (lower-case headers only)"""
+    df = pd.read_csv(path)
+    processed_holdings = []
+    for _, row in df.iterrows():
+        holding = {}
+        for field, key in (('stock_name', 'name'), ('quantity', 'quantity'),
+                           ('avg_price', 'avg_price'), ('current_price', 'current_price')):
+            for possible_col in COLUMN_MAPPINGS[field]:
+                if possible_col in df.columns.str.lower():
+                    holding[key] = row[possible_col] if key == 'name' else float(row[possible_col])
+                    break
+        if 'name' in holding and 'quantity' in holding:
+            price = holding.get('current_price', holding.get('avg_price', 0))
+            processed_holdings.append({'name': holding['name'], 'amount': holding['quantity'] * price,
+                                       'category': 'Stocks', 'quantity': holding['quantity'],
+                                       'source': 'CSV Import'})
+    return processed_holdings
+
+
+def list_of_dicts(path):
+    """The previous read_holdings: every chunk collected into one list of dicts"""
+    holdings = []
+    for frame in iter_holdings(path):
+        holdings.extend(frame.to_dict('records'))
+    return holdings
+
+
+# Upload paths compared for peak RSS: name -> fn(export path, scratch directory) -> holdings read
+UPLOAD_PATHS = {
+    'list of dicts': lambda path, tmp: len(list_of_dicts(path)),
+    'process_csv_upload': lambda path, tmp: len(PortfolioIntegrator().process_csv_upload(path)),
+    'preview_csv_upload': lambda path, tmp: PortfolioIntegrator().preview_csv_upload(path).count,
+    'import_holdings (sqlite)': lambda path, tmp: import_holdings(path, SQLiteStorage(os.path.join(tmp, 'bench.db')))
+}
+
+
+def _max_rss_mb():
+    # ru_maxrss survives fork/exec on Linux and would start at the parent's peak; VmHWM is per address space
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024 / 1e6
+    except OSError:
+        pass
+    scale = 1 if sys.platform == 'darwin' else 1024  # bytes on macOS, KiB elsewhere
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+
+
+def measure(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def measure_rss(name, path, tmp):
+    """Holdings read, seconds, process RSS before the upload and peak RSS, from a fresh interpreter"""
+    output = subprocess.run([sys.executable, '-m', 'benchmarks.bench_csv_import', '--rss', name, path, tmp],
+                            capture_output=True, text=True, check=True).stdout
+    count, elapsed, before, peak = output.split()
+    return int(count), float(elapsed), float(before), float(peak)
+
+
+def _rss_child(name, path, tmp):
+    before = _max_rss_mb()
+    count, elapsed = measure(lambda: UPLOAD_PATHS[name](path, tmp))
+    print(count, elapsed, before, _max_rss_mb())
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        sample_path = os.path.join(tmp, 'sample.csv')
+        write_export(sample_path, ITERROWS_SAMPLE, ['symbol', 'quantity', 'avg price', 'ltp'])
+        export_path = os.path.join(tmp, 'export.csv')
+        write_export(export_path, rows, ['Symbol', 'Quantity', 'Average Price', 'LTP'])
+        print(f"Synthetic export: {rows:,} rows, {os.path.getsize(export_path) / 1e6:.1f} MB")
+
+        _, elapsed = measure(lambda: iterrows_import(sample_path))
+        print(f"  iterrows loop:        {ITERROWS_SAMPLE / elapsed:>12,.0f} rows/s "
+              f"(~{rows / (ITERROWS_SAMPLE / elapsed):,.0f}s extrapolated for {rows:,} rows)")
+
+        def consume(**kwargs):
+            return sum(len(frame) for frame in iter_holdings(export_path, **kwargs))
+
+        count, elapsed = measure(lambda: consume(chunk_threshold_bytes=float('inf')))
+        print(f"  vectorized, one read: {count / elapsed:>12,.0f} rows/s in {elapsed:.2f}s")
+        count, elapsed = measure(lambda: consume(chunk_threshold_bytes=0, chunksize=100_000))
+        print(f"  vectorized, chunked:  {count / elapsed:>12,.0f} rows/s in {elapsed:.2f}s")
+
+        print("Upload path peak RSS (growth over the process before the upload):")
+        for name in UPLOAD_PATHS:
+            count, elapsed, before, peak = measure_rss(name, export_path, tmp)
+            print(f"  {name:<25} {count:>10,} holdings in {elapsed:.2f}s, "
+                  f"peak {peak:,.0f} MB (+{peak - before:,.0f} MB)")
+
+        # Same data in a registered broker layout: declared dtypes, no inference
+        export_path = os.path.join(tmp, 'kite.csv')
+        write_export(export_path, rows, ['Instrument', 'Qty.', 'Avg. cost', 'LTP'])
+        with open(export_path) as f:
+            lines = f.readlines()
+        with open(export_path, 'w') as f:
+            f.write('Instrument,Qty.,Avg. cost,LTP,Cur. val,P&L,Net chg.,Day chg.\n')
+            f.writelines(line.rstrip('\n') + ',0,0,0,0\n' for line in lines[1:])
+        count, elapsed = measure(lambda: consume(chunk_threshold_bytes=float('inf')))
+        print(f"  registered layout:    {count / elapsed:>12,.0f} rows/s in {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--rss']:
+        _rss_child(*sys.argv[2:5])
+    else:
+        main()
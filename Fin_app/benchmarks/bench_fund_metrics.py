@@ -0,0 +1,57 @@
+"""Fund metrics over the whole NAV store vs a per-fund pandas loop.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_fund_metrics
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_nav_store import DAYS, SCHEMES, build_store
+from core.fund_metrics import compute_metrics
+from core.nav_store import NavStore
+
+LOOP_SAMPLE = 50
+
+
+def per_fund_loop(store, codes):
+    """Straightforward per-scheme pandas version of the same metrics"""
+    rows = []
+    for code in codes:
+        dates, navs = store.history(code)
+        series = pd.Series(navs, index=pd.DatetimeIndex(dates))
+        row = {'Scheme Code': code}
+        for years in (1, 3, 5, 10):
+            past = series.asof(series.index - pd.DateOffset(days=int(round(years * 365.25))))
+            cagr = ((series.to_numpy() / past.to_numpy()) ** (1 / years) - 1) * 100
+            row[f'{years}Y CAGR Median'] = np.nanmedian(cagr) if np.isfinite(cagr).any() else np.nan
+        returns = np.log(series).diff().dropna()
+        row['Volatility'] = returns.std(ddof=0) * np.sqrt(252) * 100
+        row['Max Drawdown'] = (series / series.cummax() - 1).min() * 100
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = build_store(os.path.join(tmp, 'store'))
+        store = NavStore(os.path.join(tmp, 'store'))
+        print(f"NAV store: {rows:,} rows, {SCHEMES:,} schemes x {DAYS:,} days")
+
+        codes = np.unique(np.asarray(store.keys[::DAYS]) >> 20)[:LOOP_SAMPLE]
+        start = time.perf_counter()
+        per_fund_loop(store, codes)
+        per_scheme = (time.perf_counter() - start) / len(codes)
+        print(f"  per-fund pandas loop: {per_scheme * 1000:.0f} ms/scheme "
+              f"(~{per_scheme * SCHEMES:.0f}s extrapolated for all schemes)")
+
+        start = time.perf_counter()
+        table = compute_metrics(store)
+        print(f"  vectorized pass:      {time.perf_counter() - start:.1f}s for {len(table):,} schemes")
+
+
+if __name__ == '__main__':
+    main()
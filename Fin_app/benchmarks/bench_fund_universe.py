@@ -0,0 +1,79 @@
+"""Fund universe: projected load and indexed selection vs boolean-mask filtering.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_fund_universe
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.fund_universe import FUND_COLUMNS, FundUniverse, read_fund_table
+
+FUNDS = 8_000
+EXTRA_METRICS = 60
+RERUNS = 500
+
+
+def write_universe(path):
+    rng = np.random.default_rng(2)
+    categories = np.array(['Large Cap', 'Mid Cap', 'Small Cap', 'Flexi Cap', 'ELSS', 'Debt', 'Hybrid', 'Index'])
+    table = pd.DataFrame({
+        'Category': categories[rng.integers(0, len(categories), FUNDS)],
+        'Fund Name': [f'Fund {i:05d}' for i in range(FUNDS)],
+        '1Y Return': rng.normal(14, 8, FUNDS).round(1),
+        '3Y CAGR': rng.normal(13, 6, FUNDS).round(1),
+        '5Y CAGR': rng.normal(12, 5, FUNDS).round(1),
+        'Risk': rng.choice(['Low', 'Moderate', 'High', 'Very High'], FUNDS),
+        'Rating': rng.integers(1, 6, FUNDS),
+        'Expense Ratio': rng.uniform(0.1, 2.0, FUNDS).round(2)
+    })
+    for i in range(EXTRA_METRICS):
+        table[f'Metric {i}'] = rng.normal(size=FUNDS)
+    table.to_csv(path, index=False)
+
+
+def per_rerun(fn):
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        fn()
+    return (time.perf_counter() - start) / RERUNS * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'universe.csv')
+        write_universe(path)
+        print(f"Universe: {FUNDS:,} funds x {len(FUND_COLUMNS) + EXTRA_METRICS} columns, "
+              f"{os.path.getsize(path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        pd.read_csv(path)
+        print(f"  full read:      {(time.perf_counter() - start) * 1000:.1f} ms")
+        start = time.perf_counter()
+        read_fund_table(path)
+        print(f"  projected read: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        df = read_fund_table(path)
+        universe = FundUniverse(df)
+        names = df['Fund Name'].to_numpy()
+
+        def masks():
+            category = df['Category'].iloc[0]
+            funds_filtered = df[df['Category'] == category]
+            list(funds_filtered['Fund Name'])
+            df[df['Fund Name'] == names[0]].iloc[0]
+
+        def indexed():
+            category = universe.categories[0]
+            universe.funds_in(category)
+            universe.fund(names[0])
+
+        print(f"  selection per rerun, boolean masks: {per_rerun(masks):.3f} ms")
+        print(f"  selection per rerun, indexes:       {per_rerun(indexed) * 1000:.3f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Old vs new regime income tax over a client book.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_income_tax
+"""
+import time
+
+import numpy as np
+
+from core.income_tax import TAX_YEARS, break_even_deductions, compare_regimes
+
+CLIENTS = 1_000_000
+BREAK_EVEN_CLIENTS = 100_000
+
+
+def synthetic_book(size, seed=3):
+    rng = np.random.default_rng(seed)
+    income = np.round(rng.lognormal(np.log(1_200_000), 0.8, size), -3)
+    age = rng.integers(22, 85, size)
+    deductions = {
+        'section_80c': rng.uniform(0, 200_000, size),
+        'section_80ccd_1b': rng.uniform(0, 50_000, size) * (rng.random(size) < 0.3),
+        'section_80d': rng.uniform(0, 60_000, size),
+        'hra_exemption': rng.uniform(0, 300_000, size) * (rng.random(size) < 0.4),
+        'home_loan_interest': rng.uniform(0, 300_000, size) * (rng.random(size) < 0.3)
+    }
+    return income, deductions, age
+
+
+def main():
+    income, deductions, age = synthetic_book(CLIENTS)
+    for year in TAX_YEARS:
+        start = time.perf_counter()
+        comparison = compare_regimes(income, deductions, age, year)
+        elapsed = time.perf_counter() - start
+        print(f"{year}: {CLIENTS:,} clients, both regimes in {elapsed * 1000:.0f} ms "
+              f"({CLIENTS / elapsed / 1e6:.1f}M clients/s); old regime better for "
+              f"{(comparison.better == 'old').mean():.1%}, mean saving {comparison.saving.mean():,.0f}")
+
+    start = time.perf_counter()
+    break_even = break_even_deductions(income[:BREAK_EVEN_CLIENTS], age[:BREAK_EVEN_CLIENTS])
+    print(f"break_even_deductions: {BREAK_EVEN_CLIENTS:,} clients in {(time.perf_counter() - start) * 1000:.0f} ms, "
+          f"median {np.median(break_even[np.isfinite(break_even)]):,.0f}")
+
+
+if __name__ == '__main__':
+    main()
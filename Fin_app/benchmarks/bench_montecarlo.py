@@ -0,0 +1,47 @@
+"""Monte Carlo goal engine: 100k paths x 360 months x 10 goals on one core.
+
+Run from the Fin_app directory (pin BLAS to one thread for a one-core figure):
+    OMP_NUM_THREADS=1 OPENBLAS_NUM_THREADS=1 python -m benchmarks.bench_montecarlo
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+from core.montecarlo import simulate_goals
+
+GOALS = 10
+PATHS = 100_000
+YEARS = 30
+REPEATS = 3
+
+
+def main():
+    targets = np.linspace(1e6, 5e6, GOALS)
+    returns = np.linspace(6, 15, GOALS)
+    args = (targets, YEARS, returns, 10_000, 50_000)
+    simulate_goals(*args, n_paths=2_000)  # warm-up
+
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        simulation = simulate_goals(*args, n_paths=PATHS)
+        timings.append(time.perf_counter() - start)
+
+    print(f"{PATHS:,} paths x {YEARS * 12} months x {GOALS} goals")
+    print(f"  best {min(timings):.3f}s, mean {np.mean(timings):.3f}s over {REPEATS} runs")
+    print(f"  success probabilities: {np.round(simulation.probability, 4)}")
+
+    result_bytes = simulation.terminal_wealth.nbytes + simulation.shortfall.nbytes
+    print(f"  result arrays (terminal wealth + shortfall): {result_bytes / 1e6:.1f} MB")
+    for chunk_size in (512, 4096, 16384):
+        tracemalloc.start()
+        simulate_goals(*args, n_paths=PATHS, chunk_size=chunk_size)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  chunk_size={chunk_size:>6,}: peak traced memory {peak / 1e6:.1f} MB "
+              f"(working set {(peak - result_bytes) / 1e6:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""NAV store: text ingest throughput and lookup latency over ~20M rows.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_nav_store
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from core.nav_store import NavStore, ingest, pack_keys, publish, to_days
+
+SCHEMES = 4_000
+DAYS = 5_000          # ~20M rows in total
+TEXT_ROWS = 500_000   # rows written as an AMFI history dump to time parsing
+LOOKUPS = 200
+
+
+def write_history_dump(path, rows):
+    rng = np.random.default_rng(3)
+    codes = rng.integers(100_000, 100_000 + SCHEMES, rows)
+    dates = (np.datetime64('2012-01-01') + rng.integers(0, DAYS, rows)).astype('datetime64[D]')
+    with open(path, 'w') as f:
+        f.write('Scheme Code;Scheme Name;ISIN Div Payout/ISIN Growth;ISIN Div Reinvestment;'
+                'Net Asset Value;Repurchase Price;Sale Price;Date\n\nOpen Ended Schemes ( Equity Scheme )\n\n')
+        for code, date, nav in zip(codes, dates.astype(object), rng.uniform(10, 500, rows)):
+            f.write(f"{code};Scheme {code};INF{code};;{nav:.4f};;;{date:%d-%b-%Y}\n")
+
+
+def build_store(store_dir):
+    """Write SCHEMES x DAYS rows straight into the columnar format"""
+    codes = np.repeat(np.arange(100_000, 100_000 + SCHEMES), DAYS)
+    days = np.tile(to_days(np.datetime64('2012-01-01')) + np.arange(DAYS), SCHEMES)
+    publish(store_dir, pack_keys(codes, days), np.random.default_rng(5).uniform(10, 500, len(codes)),
+            {c: {'name': f'Scheme {c}', 'isins': [f'INF{c}']} for c in range(100_000, 100_000 + SCHEMES)})
+    return len(codes)
+
+
+def timed(fn, repeats=LOOKUPS):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        dump = os.path.join(tmp, 'history.txt')
+        write_history_dump(dump, TEXT_ROWS)
+        start = time.perf_counter()
+        ingest([dump], os.path.join(tmp, 'parsed'))
+        elapsed = time.perf_counter() - start
+        print(f"Ingest of a {TEXT_ROWS:,}-row AMFI dump: {elapsed:.2f}s ({TEXT_ROWS / elapsed:,.0f} rows/s)")
+
+        rows = build_store(os.path.join(tmp, 'store'))
+        start = time.perf_counter()
+        store = NavStore(os.path.join(tmp, 'store'))
+        print(f"Store with {rows:,} rows opened in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        rng = np.random.default_rng(11)
+        date = np.datetime64('2020-06-15')
+        for holdings in (10, 1_000, 100_000):
+            codes = rng.integers(100_000, 100_000 + SCHEMES, holdings)
+            print(f"  point-in-time NAV for {holdings:>7,} holdings: {timed(lambda: store.nav_on(codes, date)):.3f} ms")
+        code = 100_000 + SCHEMES // 2
+        print(f"  1-year range for one scheme:        {timed(lambda: store.history(code, '2019-01-01', '2019-12-31')):.3f} ms")
+        print(f"  full history for one scheme:        {timed(lambda: store.history(code)):.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Inference latency of the trained risk-tolerance model.
+
+Reports the one-off artifact load, per-call latency of predict_risk() for a
+single snapshot (the interactive path) and throughput of the batched
+RiskModel.predict() over a client book.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_risk_model
+"""
+import time
+
+import numpy as np
+
+from core.predictor import predict_risk
+from core.risk_model import RiskModel, load_risk_model, risk_features
+
+SINGLE_CALLS = 5_000
+BATCH_SIZES = [1_000, 100_000, 1_000_000]
+
+
+def main():
+    start = time.perf_counter()
+    RiskModel.load()
+    print(f"Artifact load: {(time.perf_counter() - start) * 1000:.2f} ms (once per process)")
+    load_risk_model()
+
+    rng = np.random.default_rng(3)
+    latencies = []
+    for age, income in zip(rng.integers(21, 66, SINGLE_CALLS), rng.integers(10_000, 400_000, SINGLE_CALLS)):
+        start = time.perf_counter()
+        predict_risk(int(age), int(income), income * 10, income * 24, 3)
+        latencies.append(time.perf_counter() - start)
+    p50, p99 = np.percentile(np.array(latencies) * 1e6, [50, 99])
+    print(f"predict_risk, one snapshot: p50 {p50:.0f} us | p99 {p99:.0f} us")
+
+    model = load_risk_model()
+    for size in BATCH_SIZES:
+        features = risk_features(rng.integers(21, 66, size), rng.integers(10_000, 400_000, size),
+                                 rng.integers(0, 5_000_000, size), rng.integers(0, 10_000_000, size),
+                                 rng.integers(0, 16, size), rng.integers(0, 6, size))
+        start = time.perf_counter()
+        model.predict(features)
+        elapsed = time.perf_counter() - start
+        print(f"RiskModel.predict, {size:>9,} profiles: {elapsed * 1000:8.1f} ms ({size / elapsed / 1e6:.2f}M profiles/s)")
+
+
+if __name__ == '__main__':
+    main()
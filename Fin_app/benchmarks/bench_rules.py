@@ -0,0 +1,62 @@
+"""Recommendation rules over a client book and for a single user.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_rules
+"""
+import time
+
+import numpy as np
+
+from core.rules import evaluate_rules, recommendations, rule_engine, rule_inputs
+
+USERS = 1_000_000
+SINGLE_CALLS = 5_000
+
+
+def synthetic_columns(size, seed=11):
+    rng = np.random.default_rng(seed)
+    income = rng.integers(0, 300_000, size).astype(np.float64)
+    return {
+        'savings_rate': rng.uniform(-20, 60, size),
+        'emergency_months': rng.uniform(0, 12, size),
+        'investment_percentage': rng.integers(0, 41, size),
+        'dining_ratio': rng.uniform(0, 0.4, size),
+        'age': rng.integers(18, 80, size),
+        'annual_income': income * 12,
+        'half_year_income': income * 6,
+        'goals_count': rng.integers(0, 4, size),
+        'goals_total': rng.integers(0, 10_000_000, size),
+        'portfolio_count': rng.integers(0, 3, size),
+        'portfolio_total': rng.integers(0, 2_000_000, size),
+        'home_goals': rng.integers(0, 2, size)
+    }
+
+
+def main():
+    engine = rule_engine()
+    print(f"{len(engine.rules)} rules compiled to {len(engine.predicates)} predicates")
+
+    columns = synthetic_columns(USERS)
+    start = time.perf_counter()
+    results = evaluate_rules(columns)
+    elapsed = time.perf_counter() - start
+    print(f"evaluate_rules: {USERS:,} users in {elapsed * 1000:.0f} ms ({USERS / elapsed / 1e6:.1f}M users/s), "
+          f"{results.fired.sum() / USERS:.1f} rules fired per user")
+
+    row = {name: values[0].item() for name, values in columns.items()}
+    row['home_goal_names'] = ['Dream Home'] * int(row['home_goals'])
+    for surface in ('app', 'pdf', 'tax'):
+        print(f"  row 0, {surface}: {len(engine.phrase(results, surface, row))} messages")
+
+    inputs = rule_inputs({'monthly_income': 90_000, 'age': 31, 'current_savings': 250_000, 'investment_percentage': 12,
+                          'expenses': {'Rent/EMI': 25_000, 'Dining & Entertainment': 9_000}},
+                         [{'name': 'Home', 'amount': 3_000_000, 'years': 6}])
+    for surface in ('app', 'pdf', 'tax'):
+        start = time.perf_counter()
+        for _ in range(SINGLE_CALLS):
+            recommendations(inputs, surface)
+        print(f"recommendations(one user, {surface!r}): {(time.perf_counter() - start) / SINGLE_CALLS * 1e6:.0f} us")
+
+
+if __name__ == '__main__':
+    main()
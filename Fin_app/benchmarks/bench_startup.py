@@ -0,0 +1,122 @@
+"""Cold-start and per-rerun script time of the Streamlit app, checked against a budget.
+
+Each page is opened in a fresh interpreter (cold start: first script run,
+including every import it triggers) and then rerun RERUNS times (warm
+reruns). Only the script's own execution is timed, not the test harness.
+The budgets are the figures measured on the single-file app.py before it
+was split into lazily imported page modules. Cold starts have to beat them
+outright; warm reruns are dominated by widget work that the split does not
+change, so they only have to stay within RERUN_TOLERANCE of the old time.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_startup
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+RERUNS = 20
+COLD_SAMPLES = 5
+
+PAGES = ["📊 Snapshot", "📈 Dashboard", "💹 Investment Center", "📥 Export"]
+
+# A filled-in profile so every page renders its full content
+SNAPSHOT = {
+    'monthly_income': 80000.0, 'current_savings': 300000.0, 'investment_percentage': 20, 'age': 32,
+    'investment_experience': 3,
+    'expenses': {'Rent/EMI': 20000.0, 'Groceries': 8000.0, 'Utilities': 3000.0, 'Transportation': 4000.0,
+                 'Dining & Entertainment': 9000.0, 'Miscellaneous': 2000.0},
+    'assets': {'Cash': 100000.0, 'Stocks/MF': 200000.0, 'Property': 0.0},
+    'liabilities': {'Home Loan': 1500000.0, 'Personal Loan': 100000.0, 'Other Debt': 0.0}
+}
+GOALS = [{'name': 'Dream House', 'amount': 5000000.0, 'years': 10, 'return': 10, 'created_date': '2024-01-01'},
+         {'name': 'Car', 'amount': 800000.0, 'years': 3, 'return': 8, 'created_date': '2024-01-01'}]
+PORTFOLIO = [{'name': 'Nifty ETF', 'amount': 100000.0, 'category': 'Stocks'},
+             {'name': 'Axis Bluechip Fund', 'amount': 50000.0, 'category': 'Mutual Funds'}]
+
+# Milliseconds measured on the monolithic app.py (medians of four runs, one core)
+BUDGET_MS = {
+    'cold': {"📊 Snapshot": 730, "📈 Dashboard": 880, "💹 Investment Center": 785, "📥 Export": 730},
+    'rerun': {"📊 Snapshot": 14.0, "📈 Dashboard": 65.0, "💹 Investment Center": 48.0, "📥 Export": 9.5},
+}
+# Run-to-run noise allowed on warm reruns
+RERUN_TOLERANCE = 0.15
+
+# Streamlit compiles the main script once and execs the cached code object on
+# every rerun; this wrapper does the same and times only the exec
+WRAPPER = r'''
+import builtins, sys, time
+app = {app!r}
+cache = builtins.__dict__.setdefault('_bench_state', {{'times': []}})
+if 'code' not in cache:
+    with open(app) as f:
+        cache['code'] = compile(f.read(), app, 'exec')
+start = time.perf_counter()
+exec(cache['code'], {{'__name__': '__main__', '__file__': app}})
+cache['times'].append((time.perf_counter() - start) * 1000)
+'''
+
+# Executed in a fresh interpreter per sample; prints a JSON line with the timings
+PROBE = r'''
+import builtins, json, os, sys
+sys.path.insert(0, os.path.dirname({app!r}))
+from streamlit.testing.v1 import AppTest
+from core.storage import get_storage
+storage = get_storage()
+storage.save_snapshot({snapshot!r})
+for goal in {goals!r}:
+    storage.add_goal(goal)
+storage.add_holdings({portfolio!r})
+del sys.modules['core.storage'], sys.modules['core']
+at = AppTest.from_file('wrapper.py', default_timeout=120)
+at.session_state['current_page'] = {page!r}
+for run in range({reruns} + 1):
+    at.run()
+    assert not at.exception, [e.message for e in at.exception]
+times = builtins._bench_state['times']
+print(json.dumps({{'cold': times[0], 'rerun': sorted(times[1:])[len(times[1:]) // 2],
+                   'reportlab': 'reportlab' in sys.modules}}))
+'''
+
+
+def probe(page):
+    with tempfile.TemporaryDirectory() as workdir:
+        with open(os.path.join(workdir, 'wrapper.py'), 'w') as f:
+            f.write(WRAPPER.format(app=APP))
+        result = subprocess.run(
+            [sys.executable, '-c', PROBE.format(app=APP, reruns=RERUNS, page=page, snapshot=SNAPSHOT,
+                                                goals=GOALS, portfolio=PORTFOLIO)],
+            cwd=workdir, capture_output=True, text=True, check=True
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(page):
+    """Median cold start and median warm rerun over COLD_SAMPLES fresh interpreters"""
+    samples = [probe(page) for _ in range(COLD_SAMPLES)]
+    return {
+        'cold': sorted(s['cold'] for s in samples)[COLD_SAMPLES // 2],
+        'rerun': sorted(s['rerun'] for s in samples)[COLD_SAMPLES // 2],
+        'reportlab': samples[0]['reportlab']
+    }
+
+
+def main():
+    failures = 0
+    print(f"{'Page':<22} {'cold ms':>9} {'budget':>8} {'rerun ms':>9} {'budget':>8}  reportlab loaded")
+    for page in PAGES:
+        timing = measure(page)
+        over = [kind for kind, slack in (('cold', 1.0), ('rerun', 1 + RERUN_TOLERANCE))
+                if timing[kind] > BUDGET_MS[kind][page] * slack]
+        failures += bool(over)
+        print(f"{page:<22} {timing['cold']:>9.0f} {BUDGET_MS['cold'][page]:>8} "
+              f"{timing['rerun']:>9.1f} {BUDGET_MS['rerun'][page]:>8}  {timing['reportlab']!s:<6}"
+              f"{'  OVER BUDGET: ' + ', '.join(over) if over else ''}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Write latency of a single holding add: legacy save_json vs the SQLite backend.
+
+Run from the Fin_app directory:
+    python -m benchmarks.bench_storage
+"""
+import os
+import statistics
+import tempfile
+import time
+
+from core.storage import SQLiteStorage, save_json
+
+SIZES = [10, 1000, 10000, 50000]
+REPEATS = 50
+
+
+def make_holding(i):
+    return {'name': f'Holding {i}', 'amount': 1000.0 + i, 'category': 'Stocks',
+            'quantity': float(i % 100), 'source': 'CSV Import'}
+
+
+def bench_json(tmp, size):
+    path = os.path.join(tmp, f'portfolio_{size}.json')
+    portfolio = [make_holding(i) for i in range(size)]
+    timings = []
+    for i in range(REPEATS):
+        portfolio.append(make_holding(size + i))
+        start = time.perf_counter()
+        save_json(path, portfolio)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_sqlite(tmp, size):
+    store = SQLiteStorage(os.path.join(tmp, f'portfolio_{size}.db'))
+    store.add_holdings([make_holding(i) for i in range(size)])
+    timings = []
+    for i in range(REPEATS):
+        holding = make_holding(size + i)
+        start = time.perf_counter()
+        store.add_holding(holding)
+        timings.append(time.perf_counter() - start)
+    store.close()
+    return timings
+
+
+def main():
+    print(f"{'Rows':>8} | {'save_json p50 (ms)':>19} | {'SQLite p50 (ms)':>16} | {'Speedup':>8}")
+    print('-' * 62)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in SIZES:
+            json_ms = statistics.median(bench_json(tmp, size)) * 1000
+            sqlite_ms = statistics.median(bench_sqlite(tmp, size)) * 1000
+            print(f"{size:>8,} | {json_ms:>19.3f} | {sqlite_ms:>16.3f} | {json_ms / sqlite_ms:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+"""Streamlit-free building blocks used by the AI Financial Advisor app."""
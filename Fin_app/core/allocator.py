@@ -0,0 +1,142 @@
+"""Split one monthly surplus across competing goals.
+
+Terminal wealth on a simulated path is linear in the goal's SIP:
+W_p(s) = initial * G_p + s * B_p, where G_p is the path's growth of one rupee
+invested today and B_p the value of one rupee a month. Two runs of
+simulate_goals (unit initial amount, unit SIP) on the same seeded draws give
+G and B for every goal and path, and from them each path's break-even SIP
+s*_p = (target - initial * G_p) / B_p. With paths sorted by s*_p:
+
+- success probability at SIP s is the share of paths with s*_p <= s
+  (one searchsorted per goal for a whole grid of SIP levels);
+- expected shortfall at s is sum over paths with s*_p > s of B_p * (s*_p - s),
+  read from suffix sums.
+
+The budget is divided into equal increments and the objective is separable
+across goals, so the best split on that grid is an exact max-plus dynamic
+programme over goals (one (increments x increments) array operation per
+goal). Unlike greedy-on-marginal-probability it is not misled by the
+S-shaped probability curves, where a single increment often gains nothing.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from core.montecarlo import simulate_goals
+
+GoalCurves = namedtuple('GoalCurves', [
+    'targets', 'break_even',  # (goals, paths) break-even SIP per path, sorted ascending
+    'tail_weight',            # (goals, paths + 1) suffix sums of B over the sorted paths
+    'tail_value'              # (goals, paths + 1) suffix sums of B * break-even
+])
+Allocation = namedtuple('Allocation', [
+    'sip',                 # (goals,) monthly amount given to each goal
+    'probability',         # (goals,) success probability at that SIP
+    'expected_shortfall',  # (goals,) mean rupee shortfall at that SIP
+    'expected_goals_met',  # sum of probabilities
+    'weighted_shortfall',  # sum of weight * expected_shortfall / target
+    'levels', 'curve'      # SIP grid and (goals, levels) objective value at each level
+])
+
+OBJECTIVES = ('goals_met', 'shortfall')
+
+
+def goal_curves(targets, years, annual_returns, initial=0.0, n_paths=10_000, seed=42):
+    """Break-even SIP distribution of every goal from two batched simulations on common draws"""
+    targets = np.atleast_1d(np.asarray(targets, dtype=float))
+    growth = simulate_goals(targets, years, annual_returns, 0.0, 1.0, n_paths=n_paths, seed=seed,
+                            percentile_sample=1).terminal_wealth
+    per_rupee = simulate_goals(targets, years, annual_returns, 1.0, 0.0, n_paths=n_paths, seed=seed,
+                               percentile_sample=1).terminal_wealth
+    initial = np.broadcast_to(np.asarray(initial, dtype=float), targets.shape)
+    break_even = np.maximum((targets[:, None] - initial[:, None] * growth) / per_rupee, 0.0)
+    order = np.argsort(break_even, axis=1)
+    break_even = np.take_along_axis(break_even, order, axis=1)
+    per_rupee = np.take_along_axis(per_rupee, order, axis=1)
+    zeros = np.zeros((len(targets), 1))
+    tail_weight = np.hstack([np.cumsum(per_rupee[:, ::-1], axis=1)[:, ::-1], zeros])
+    tail_value = np.hstack([np.cumsum((per_rupee * break_even)[:, ::-1], axis=1)[:, ::-1], zeros])
+    return GoalCurves(targets, break_even, tail_weight, tail_value)
+
+
+def _first_above(curves, sips):
+    """Index of the first sorted path whose break-even exceeds each SIP; sips is (goals, levels)"""
+    return np.stack([np.searchsorted(row, level, side='right') for row, level in zip(curves.break_even, sips)])
+
+
+def success_probability(curves, sips):
+    """Probability of reaching each target at the given SIPs, shape (goals,) or (goals, levels)"""
+    sips = np.asarray(sips, dtype=float)
+    probability = _first_above(curves, sips.reshape(len(curves.targets), -1)) / curves.break_even.shape[1]
+    return probability.reshape(sips.shape)
+
+
+def expected_shortfall(curves, sips):
+    """Mean rupee shortfall at the given SIPs, shape (goals,) or (goals, levels)"""
+    sips = np.asarray(sips, dtype=float)
+    grid = sips.reshape(len(curves.targets), -1)
+    first = _first_above(curves, grid)
+    tail_value = np.take_along_axis(curves.tail_value, first, axis=1)
+    tail_weight = np.take_along_axis(curves.tail_weight, first, axis=1)
+    return ((tail_value - grid * tail_weight) / curves.break_even.shape[1]).reshape(sips.shape)
+
+
+def allocate_increments(values, steps):
+    """Increments per goal maximising sum_g values[g, k_g] with sum_g k_g == steps; values is (goals, steps + 1)"""
+    goals = values.shape[0]
+    budget = np.arange(steps + 1)
+    give = budget[:, None] - budget[None, :]  # give[b, r]: increments to this goal when r go to the earlier ones
+    feasible = give >= 0
+    best = values[0].astype(float)
+    choice = np.empty((goals, steps + 1), dtype=int)
+    choice[0] = budget
+    for g in range(1, goals):
+        # best over the first g goals for every budget b: max over r <= b of best[r] + values[g, b - r]
+        candidates = np.where(feasible, best[None, :] + values[g, np.where(feasible, give, 0)], -np.inf)
+        rest = candidates.argmax(axis=1)
+        choice[g] = budget - rest
+        best = candidates[budget, rest]
+
+    counts = np.zeros(goals, dtype=int)
+    # best[b] is the optimum spending exactly b; the curves never fall, so spending everything loses nothing
+    remaining = steps
+    for g in range(goals - 1, -1, -1):
+        counts[g] = choice[g, remaining]
+        remaining -= counts[g]
+    return counts
+
+
+def allocate_surplus(targets, years, annual_returns, budget, initial=0.0, weights=1.0,
+                     objective='goals_met', steps=200, n_paths=10_000, seed=42):
+    """Monthly split of budget across goals maximising expected goals met or minimising weighted shortfall"""
+    return allocate_from_curves(goal_curves(targets, years, annual_returns, initial, n_paths, seed), budget,
+                                weights, objective, steps)
+
+
+def allocate_from_curves(curves, budget, weights=1.0, objective='goals_met', steps=200):
+    """allocate_surplus() on curves already built by goal_curves(), e.g. cached across reruns"""
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {OBJECTIVES}, got {objective!r}")
+    goals = len(curves.targets)
+    weights = np.broadcast_to(np.asarray(weights, dtype=float), (goals,))
+    levels = np.linspace(0.0, max(float(budget), 0.0), steps + 1)
+    grid = np.broadcast_to(levels, (goals, steps + 1))
+    if objective == 'goals_met':
+        curve = weights[:, None] * success_probability(curves, grid)
+    else:
+        curve = -weights[:, None] * expected_shortfall(curves, grid) / np.maximum(curves.targets[:, None], 1)
+    sip = levels[allocate_increments(curve, steps)] if budget > 0 else np.zeros(goals)
+    return _summary(curves, sip, weights, levels, curve)
+
+
+def evaluate_split(curves, sip, weights=1.0):
+    """Allocation summary for a given split, e.g. an equal split to compare against"""
+    weights = np.broadcast_to(np.asarray(weights, dtype=float), (len(curves.targets),))
+    return _summary(curves, np.asarray(sip, dtype=float), weights, None, None)
+
+
+def _summary(curves, sip, weights, levels, curve):
+    probability = success_probability(curves, sip)
+    shortfall = expected_shortfall(curves, sip)
+    return Allocation(sip, probability, shortfall, float(probability.sum()),
+                      float((weights * shortfall / np.maximum(curves.targets, 1)).sum()), levels, curve)
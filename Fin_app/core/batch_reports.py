@@ -0,0 +1,104 @@
+"""Headless batch rendering of PDF reports for many client profiles.
+
+Input is either a directory of *.json files or a JSONL file; every record is
+an object with optional keys snapshot, goals, portfolio, quiz, ml_insights and
+id (used for the output file name). Reports are rendered across a process pool
+and written straight to the output directory by the workers.
+
+Run from the Fin_app directory:
+    python -m core.batch_reports profiles.jsonl --out reports/ --workers 8
+"""
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+_generator = None
+
+
+def _init_worker():
+    """Build the stylesheet and custom ParagraphStyles once per worker process"""
+    global _generator
+    from core.reports import PDFReportGenerator
+    _generator = PDFReportGenerator()
+
+
+def iter_records(source):
+    """Yield (name, record) pairs from a directory of JSON files or a JSONL file"""
+    if os.path.isdir(source):
+        for filename in sorted(os.listdir(source)):
+            if filename.endswith('.json'):
+                with open(os.path.join(source, filename)) as f:
+                    record = json.load(f)
+                yield str(record.get('id', filename[:-len('.json')])), record
+    else:
+        with open(source) as f:
+            for line_number, line in enumerate(f, 1):
+                if line.strip():
+                    record = json.loads(line)
+                    yield str(record.get('id', f'record_{line_number:06d}')), record
+
+
+def _safe_filename(name):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', name) or 'report'
+
+
+def render_report(task):
+    """Worker: render one record to <out_dir>/<name>.pdf and return (name, seconds, bytes)"""
+    name, record, out_dir = task
+    start = time.perf_counter()
+    pdf_data = _generator.create_comprehensive_pdf(
+        record.get('snapshot', {}),
+        record.get('goals', []),
+        record.get('portfolio', []),
+        record.get('quiz'),
+        record.get('ml_insights')
+    )
+    with open(os.path.join(out_dir, _safe_filename(name) + '.pdf'), 'wb') as f:
+        f.write(pdf_data)
+    return name, time.perf_counter() - start, len(pdf_data)
+
+
+def generate_reports(source, out_dir, workers=None, chunksize=16):
+    """Render every record in source; returns per-report latencies and throughput stats"""
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = ((name, record, out_dir) for name, record in iter_records(source))
+    latencies = []
+    total_bytes = 0
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        for _, seconds, size in executor.map(render_report, tasks, chunksize=chunksize):
+            latencies.append(seconds)
+            total_bytes += size
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        'reports': len(latencies),
+        'seconds': elapsed,
+        'reports_per_second': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'latency_ms': dict(zip(('p50', 'p90', 'p99', 'max'),
+                               np.percentile(latencies_ms, [50, 90, 99, 100]) if latencies else [0.0] * 4)),
+        'bytes': total_bytes
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Render month-end PDF reports for a batch of client profiles')
+    parser.add_argument('source', help='Directory of *.json profiles or a JSONL file')
+    parser.add_argument('--out', default='reports', help='Output directory for the PDFs')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--chunksize', type=int, default=16, help='Records handed to a worker at a time')
+    args = parser.parse_args()
+
+    stats = generate_reports(args.source, args.out, args.workers, args.chunksize)
+    latency = stats['latency_ms']
+    print(f"Rendered {stats['reports']:,} reports in {stats['seconds']:.2f}s "
+          f"({stats['reports_per_second']:.1f} reports/s, {stats['bytes'] / 1e6:.1f} MB)")
+    print(f"Per-report latency: p50 {latency['p50']:.1f} ms | p90 {latency['p90']:.1f} ms | "
+          f"p99 {latency['p99']:.1f} ms | max {latency['max']:.1f} ms")
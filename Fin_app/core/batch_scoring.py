@@ -0,0 +1,134 @@
+"""Columnar risk-tolerance and health scoring for a whole client book.
+
+score_profiles() takes a DataFrame or structured NumPy array with one profile
+per row and scores every row at once. By default the risk columns come from
+the trained risk model (core.risk_model), as they do for a single snapshot in
+predict_risk(); predict_profiles() is that path, scoring the whole book in
+one batched predict().
+
+hand_weighted_profiles() (hand_weighted=True, or --hand-weighted on the
+command line) is the batch form of score_risk(): broadcasting and np.select
+over the same RISK_WEIGHTS table and risk bands, so each row matches the
+scalar result exactly. Health scores always use the health bands of
+health_score().
+
+Profile columns: age, monthly_income, current_savings, total_debt,
+investment_experience, total_expenses and investment_percentage;
+financial_goals is optional (default 0).
+
+Run from the Fin_app directory:
+    python -m core.batch_scoring profiles.csv --out scores.csv [--hand-weighted]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.financial_metrics import HEALTH_BANDS
+from core.predictor import RISK_FACTORS, RISK_PROFILES, weighted_risk_factors
+from core.risk_model import load_risk_model, risk_features
+
+REQUIRED_COLUMNS = ['age', 'monthly_income', 'current_savings', 'total_debt', 'investment_experience',
+                    'total_expenses', 'investment_percentage']
+OPTIONAL_COLUMNS = {'financial_goals': 0}
+
+
+def _columns(profiles):
+    """Float64 arrays for every profile column, from a DataFrame or a structured array"""
+    names = profiles.columns if isinstance(profiles, pd.DataFrame) else (profiles.dtype.names or ())
+    missing = [name for name in REQUIRED_COLUMNS if name not in names]
+    if missing:
+        raise ValueError(f"Profiles are missing columns {missing}")
+    columns = {name: np.asarray(profiles[name], dtype=np.float64) for name in REQUIRED_COLUMNS}
+    size = len(columns['age'])
+    for name, default in OPTIONAL_COLUMNS.items():
+        columns[name] = (np.asarray(profiles[name], dtype=np.float64) if name in names
+                         else np.full(size, default, dtype=np.float64))
+    return columns
+
+
+def _ratio(numerator, denominator):
+    """numerator / denominator where the denominator is positive, else 0 (as the scalar metrics do)"""
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+
+def risk_factors(columns):
+    """Each factor's contribution per profile, in RISK_FACTORS order"""
+    return weighted_risk_factors(columns)
+
+
+def health_scores(savings_rate, emergency_months, investment_percentage):
+    """health_score() over arrays: np.select picks the first band each value reaches"""
+    values = {'savings_rate': savings_rate, 'emergency_months': emergency_months,
+              'investment_percentage': investment_percentage}
+    score = sum(np.select([values[name] >= threshold for threshold, _ in bands],
+                          [points for _, points in bands], default=0)
+                for name, bands in HEALTH_BANDS.items())
+    return np.minimum(score, 100)
+
+
+def _health(columns):
+    monthly_savings = columns['monthly_income'] - columns['total_expenses']
+    return health_scores(
+        _ratio(monthly_savings, columns['monthly_income']) * 100,
+        _ratio(columns['current_savings'], columns['total_expenses']),
+        columns['investment_percentage']
+    )
+
+
+def _table(profiles, bands, risk_score, factors, health):
+    return pd.DataFrame({
+        'risk_profile': pd.Categorical.from_codes(bands, [profile for _, profile, _, _ in RISK_PROFILES]),
+        'allocation': np.array([allocation for _, _, allocation, _ in RISK_PROFILES])[bands],
+        'risk_score': risk_score,
+        **dict(zip(RISK_FACTORS, factors)),
+        'health_score': health
+    }, index=profiles.index if isinstance(profiles, pd.DataFrame) else None)
+
+
+def hand_weighted_profiles(profiles):
+    """Risk profile, equity allocation, risk score and factor contributions from the hand-weighted score, plus health"""
+    columns = _columns(profiles)
+    factors = risk_factors(columns)
+    # Summed left to right like the scalar expression, so the floats are bit-identical
+    risk_score = factors[0]
+    for factor in factors[1:]:
+        risk_score = risk_score + factor
+
+    bands = np.select([risk_score < upper for upper, *_ in RISK_PROFILES[:-1]],
+                      np.arange(len(RISK_PROFILES) - 1), default=len(RISK_PROFILES) - 1)
+    return _table(profiles, bands, risk_score, factors, _health(columns))
+
+
+def predict_profiles(profiles, model=None):
+    """Risk profile, equity allocation, risk score and factor contributions from the trained model, plus health"""
+    columns = _columns(profiles)
+    prediction = (model or load_risk_model()).predict(risk_features(
+        columns['age'], columns['monthly_income'], columns['current_savings'], columns['total_debt'],
+        columns['investment_experience'], columns['financial_goals']))
+    return _table(profiles, prediction.band, prediction.score, prediction.contributions.T, _health(columns))
+
+
+def score_profiles(profiles, hand_weighted=False, model=None):
+    """Score every profile with the trained model, or with the hand-weighted score when hand_weighted is set"""
+    if hand_weighted:
+        return hand_weighted_profiles(profiles)
+    return predict_profiles(profiles, model)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Score risk tolerance and financial health for a CSV of profiles')
+    parser.add_argument('profiles', help=f"CSV with columns {', '.join(REQUIRED_COLUMNS)} (and optionally financial_goals)")
+    parser.add_argument('--out', default='scores.csv', help='Output CSV, one row per profile')
+    parser.add_argument('--hand-weighted', action='store_true',
+                        help='Risk columns from the hand-weighted score instead of the trained model')
+    args = parser.parse_args()
+
+    profiles = pd.read_csv(args.profiles)
+    start = time.perf_counter()
+    scores = score_profiles(profiles, hand_weighted=args.hand_weighted)
+    elapsed = time.perf_counter() - start
+    scores.to_csv(args.out, index=False)
+    print(f"Scored {len(scores):,} profiles in {elapsed:.2f}s -> {args.out}")
+    print(scores['risk_profile'].value_counts().to_string())
@@ -0,0 +1,201 @@
+"""Vectorized, streaming import of broker/bank holdings exports"""
+import io
+import os
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from core.csv_parsers import NA_VALUES, REGISTRY, TEXT, Schema, fingerprint, read_header, resolve_schema
+
+# Common column mappings for different brokers/banks (matched case-insensitively)
+COLUMN_MAPPINGS = {
+    'stock_name': ['stock', 'company', 'symbol', 'security', 'instrument'],
+    'quantity': ['qty', 'quantity', 'units', 'shares'],
+    'avg_price': ['avg price', 'average price', 'cost price', 'purchase price'],
+    'current_price': ['current price', 'ltp', 'last price', 'market price'],
+    'isin': ['isin', 'isin code']
+}
+
+# Files above this size are read in CHUNKSIZE-row batches to keep memory flat
+CHUNK_THRESHOLD_BYTES = 32 * 1024 * 1024
+CHUNKSIZE = 200_000
+# Imports always stream, in smaller batches since each row becomes a dict on its way to storage
+IMPORT_CHUNKSIZE = 50_000
+# Rows of the first chunk kept for an upload preview
+PREVIEW_ROWS = 10
+
+HoldingsPreview = namedtuple('HoldingsPreview', ['count', 'head'])  # total holdings, first PREVIEW_ROWS of them
+
+
+def resolve_columns(header, column_mappings=COLUMN_MAPPINGS):
+    """Map each logical field to the file's own header name, once per file"""
+    by_lower = {}
+    for column in header:
+        by_lower.setdefault(str(column).strip().lower(), column)
+    resolved = {}
+    for field, candidates in column_mappings.items():
+        for candidate in candidates:
+            if candidate in by_lower:
+                resolved[field] = by_lower[candidate]
+                break
+    return resolved
+
+
+def generic_schema(header, column_mappings=COLUMN_MAPPINGS):
+    """Fallback Schema for layouts without a registered parser; dtypes are inferred"""
+    columns = resolve_columns(header, column_mappings)
+    if 'stock_name' not in columns or 'quantity' not in columns:
+        return None
+    return Schema(None, columns, list(dict.fromkeys(columns.values())), None, 'Stocks')
+
+
+def detect_schema(source, column_mappings=COLUMN_MAPPINGS):
+    """Schema for an export: a registered parser if the header matches one, else the generic mapping"""
+    header = read_header(source)
+    if column_mappings is not COLUMN_MAPPINGS and fingerprint(header) not in REGISTRY:
+        # The fingerprint cache holds default-mapping schemas; custom mappings resolve afresh
+        return generic_schema(header, column_mappings)
+    return resolve_schema(header, generic_schema)
+
+
+def holdings_from_frame(df, columns, category='Stocks'):
+    """Column-wise conversion of raw export rows into holdings"""
+    names = df[columns['stock_name']]
+    if 'amount' in columns:
+        # Deposit statements carry the value directly; one unit per deposit
+        amount = pd.to_numeric(df[columns['amount']], errors='coerce').to_numpy(dtype=float)
+        valid = names.notna().to_numpy() & ~np.isnan(amount)
+        return _with_isin(pd.DataFrame({
+            'name': names.to_numpy()[valid],
+            'amount': amount[valid],
+            'category': category,
+            'quantity': 1.0,
+            'source': 'CSV Import'
+        }), df, columns, valid)
+
+    quantity = pd.to_numeric(df[columns['quantity']], errors='coerce').to_numpy(dtype=float)
+
+    price = np.zeros(len(df))
+    have_price = np.zeros(len(df), dtype=bool)
+    # Prefer the current price, fall back to the average price row by row
+    for field in ('current_price', 'avg_price'):
+        if field in columns:
+            values = pd.to_numeric(df[columns[field]], errors='coerce').to_numpy(dtype=float)
+            fill = ~have_price & ~np.isnan(values)
+            price[fill] = values[fill]
+            have_price |= fill
+
+    valid = names.notna().to_numpy() & ~np.isnan(quantity)
+    return _with_isin(pd.DataFrame({
+        'name': names.to_numpy()[valid],
+        'amount': (quantity * price)[valid],
+        'category': category,
+        'quantity': quantity[valid],
+        'source': 'CSV Import'
+    }), df, columns, valid)
+
+
+def _with_isin(holdings, df, columns, valid):
+    """Carry the ISIN through when the export has one, for NAV revaluation"""
+    if 'isin' in columns:
+        isin = df[columns['isin']].to_numpy(dtype=object)[valid]
+        holdings['isin'] = pd.Series(np.where(pd.isna(isin), None, isin), dtype=object)
+    return holdings
+
+
+def _file_size(source):
+    size = getattr(source, 'size', None)
+    if size is not None:
+        return size
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    position = source.tell()
+    source.seek(0, io.SEEK_END)
+    size = source.tell()
+    source.seek(position)
+    return size
+
+
+def _rewind(source):
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+
+def _read_frames(source, schema, chunksize=None):
+    """Raw export rows, in chunksize-row frames when chunksize is set.
+
+    A cell in a declared numeric column that is not a number (nor an NA
+    placeholder) makes the typed read fail; the rest of the file is then
+    re-read with those columns as text and coerced, so only the rows with bad
+    cells are lost.
+    """
+    thousands = schema.parser.thousands if schema.parser is not None else ','
+    read_kwargs = {'usecols': schema.usecols, 'thousands': thousands, 'na_values': NA_VALUES, 'engine': 'c'}
+    rows_read = 0
+    try:
+        # Registered layouts declare their dtypes, so the C engine skips type inference
+        if chunksize is None:
+            yield pd.read_csv(source, dtype=schema.dtype, **read_kwargs)
+            return
+        for chunk in pd.read_csv(source, dtype=schema.dtype, chunksize=chunksize, **read_kwargs):
+            yield chunk
+            rows_read += len(chunk)
+    except ValueError:
+        if schema.dtype is None:
+            raise
+    else:
+        return
+    _rewind(source)
+    text = {column: TEXT for column in schema.usecols}
+    remaining = pd.read_csv(source, dtype=text, skiprows=range(1, rows_read + 1), chunksize=chunksize, **read_kwargs)
+    for frame in [remaining] if chunksize is None else remaining:
+        yield _coerce_numbers(frame, schema, thousands)
+
+
+def _coerce_numbers(frame, schema, thousands):
+    """Declared numeric columns read as text back to floats; cells that are not numbers become NaN"""
+    for column, kind in schema.dtype.items():
+        if kind is not TEXT:
+            frame[column] = pd.to_numeric(frame[column].str.replace(thousands, '', regex=False), errors='coerce')
+    return frame
+
+
+def iter_holdings(source, chunk_threshold_bytes=CHUNK_THRESHOLD_BYTES, chunksize=CHUNKSIZE,
+                  column_mappings=COLUMN_MAPPINGS):
+    """Yield DataFrames of holdings; large files are streamed in chunksize-row batches"""
+    schema = detect_schema(source, column_mappings)
+    _rewind(source)
+    if schema is None:
+        return
+    chunked = _file_size(source) > chunk_threshold_bytes
+    for frame in _read_frames(source, schema, chunksize if chunked else None):
+        yield holdings_from_frame(frame, schema.columns, schema.category)
+
+
+def read_holdings(source, **kwargs):
+    """All holdings in an export as one DataFrame"""
+    frames = list(iter_holdings(source, **kwargs))
+    if not frames:
+        return pd.DataFrame(columns=['name', 'amount', 'category', 'quantity', 'source'])
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+def preview_holdings(source, rows=PREVIEW_ROWS, chunksize=IMPORT_CHUNKSIZE, **kwargs):
+    """Count an export's holdings in one streamed pass, keeping only the first rows of the first chunk"""
+    _rewind(source)
+    count, head = 0, None
+    for frame in iter_holdings(source, chunk_threshold_bytes=0, chunksize=chunksize, **kwargs):
+        if head is None:
+            head = frame.head(rows).reset_index(drop=True)
+        count += len(frame)
+    return HoldingsPreview(count, head)
+
+
+def import_holdings(source, storage, chunksize=IMPORT_CHUNKSIZE, **kwargs):
+    """Stream an export into storage chunk by chunk; returns the number of holdings added"""
+    _rewind(source)
+    added = 0
+    for frame in iter_holdings(source, chunk_threshold_bytes=0, chunksize=chunksize, **kwargs):
+        added += len(storage.add_holdings(frame.to_dict('records')))
+    return added
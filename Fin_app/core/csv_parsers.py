@@ -0,0 +1,168 @@
+"""Per-institution CSV parsers selected by a fingerprint of the header row.
+
+Each parser declares the exact export header of a broker or bank, the column
+that feeds each holding field and the dtype of every column it reads, so
+pandas can parse known layouts with the C engine and no type inference.
+Each header layout is resolved to a Schema once per process; repeat uploads of
+the same layout skip detection.
+"""
+import csv
+import hashlib
+import io
+import os
+from collections import namedtuple
+
+BrokerParser = namedtuple('BrokerParser', ['key', 'name', 'header', 'columns', 'dtype', 'category', 'thousands'],
+                          defaults=(',',))
+
+# Resolved read plan for one header layout; parser is None for the generic fallback
+Schema = namedtuple('Schema', ['parser', 'columns', 'usecols', 'dtype', 'category'])
+
+# Plain object columns: without pyarrow the 'string' dtype parses several times slower
+TEXT = object
+NUMBER = 'float64'
+# Placeholders exports put in empty numeric cells; read as NaN so the row is dropped, not the file
+NA_VALUES = ['-', '--', 'N/A', 'NA', 'n/a', '']
+
+# --- Registry ---
+# Keys match PortfolioIntegrator.supported_brokers / supported_banks. Fields:
+# stock_name, quantity, avg_price, current_price, optionally isin and, for deposit
+# statements, amount. thousands is the digit-group separator of the export's numbers.
+PARSERS = [
+    BrokerParser(
+        'zerodha', 'Zerodha Kite',
+        ['Instrument', 'Qty.', 'Avg. cost', 'LTP', 'Cur. val', 'P&L', 'Net chg.', 'Day chg.'],
+        {'stock_name': 'Instrument', 'quantity': 'Qty.', 'avg_price': 'Avg. cost', 'current_price': 'LTP'},
+        {'Instrument': TEXT, 'Qty.': NUMBER, 'Avg. cost': NUMBER, 'LTP': NUMBER},
+        'Stocks'
+    ),
+    BrokerParser(
+        'angelone', 'Angel One',
+        ['Symbol', 'ISIN', 'Quantity', 'Avg Price', 'LTP', 'Current Value', 'P&L', 'P&L %'],
+        {'stock_name': 'Symbol', 'quantity': 'Quantity', 'avg_price': 'Avg Price', 'current_price': 'LTP', 'isin': 'ISIN'},
+        {'Symbol': TEXT, 'Quantity': NUMBER, 'Avg Price': NUMBER, 'LTP': NUMBER, 'ISIN': TEXT},
+        'Stocks'
+    ),
+    BrokerParser(
+        'icici_direct', 'ICICI Direct',
+        ['Stock Symbol', 'Company Name', 'ISIN Code', 'Qty', 'Average Cost Price',
+         'Current Market Price', 'Value At Cost', 'Value At Market Price', 'Unrealized Profit/Loss'],
+        {'stock_name': 'Company Name', 'quantity': 'Qty', 'avg_price': 'Average Cost Price',
+         'current_price': 'Current Market Price', 'isin': 'ISIN Code'},
+        {'Company Name': TEXT, 'Qty': NUMBER, 'Average Cost Price': NUMBER, 'Current Market Price': NUMBER,
+         'ISIN Code': TEXT},
+        'Stocks'
+    ),
+    BrokerParser(
+        'hdfc_sec', 'HDFC Securities',
+        ['Stock Name', 'ISIN', 'Quantity', 'Avg Cost', 'Market Price', 'Market Value', 'Unrealised P/L'],
+        {'stock_name': 'Stock Name', 'quantity': 'Quantity', 'avg_price': 'Avg Cost', 'current_price': 'Market Price', 'isin': 'ISIN'},
+        {'Stock Name': TEXT, 'Quantity': NUMBER, 'Avg Cost': NUMBER, 'Market Price': NUMBER, 'ISIN': TEXT},
+        'Stocks'
+    ),
+    BrokerParser(
+        'kotak_sec', 'Kotak Securities',
+        ['Scrip Name', 'ISIN', 'Quantity', 'Avg Price', 'Market Rate', 'Market Value', 'Gain/Loss'],
+        {'stock_name': 'Scrip Name', 'quantity': 'Quantity', 'avg_price': 'Avg Price', 'current_price': 'Market Rate', 'isin': 'ISIN'},
+        {'Scrip Name': TEXT, 'Quantity': NUMBER, 'Avg Price': NUMBER, 'Market Rate': NUMBER, 'ISIN': TEXT},
+        'Stocks'
+    ),
+    BrokerParser(
+        'axis_sec', 'Axis Securities',
+        ['Scrip Name', 'ISIN', 'Quantity', 'Buy Avg', 'LTP', 'Current Value', 'Unrealised P&L'],
+        {'stock_name': 'Scrip Name', 'quantity': 'Quantity', 'avg_price': 'Buy Avg', 'current_price': 'LTP', 'isin': 'ISIN'},
+        {'Scrip Name': TEXT, 'Quantity': NUMBER, 'Buy Avg': NUMBER, 'LTP': NUMBER, 'ISIN': TEXT},
+        'Stocks'
+    ),
+    # Bank exports are deposit summaries: one row per FD/RD with its principal
+    BrokerParser(
+        'hdfc_bank', 'HDFC Bank',
+        ['Deposit No.', 'Deposit Type', 'Principal Amount', 'Interest Rate', 'Start Date',
+         'Maturity Date', 'Maturity Amount'],
+        {'stock_name': 'Deposit Type', 'amount': 'Principal Amount'},
+        {'Deposit Type': TEXT, 'Principal Amount': NUMBER},
+        'FD/RD'
+    ),
+    BrokerParser(
+        'icici_bank', 'ICICI Bank',
+        ['Deposit Number', 'Deposit Type', 'Principal', 'Rate of Interest', 'Open Date',
+         'Maturity Date', 'Maturity Value'],
+        {'stock_name': 'Deposit Type', 'amount': 'Principal'},
+        {'Deposit Type': TEXT, 'Principal': NUMBER},
+        'FD/RD'
+    ),
+    BrokerParser(
+        'sbi_bank', 'State Bank of India',
+        ['Account No', 'Scheme', 'Deposit Amount', 'ROI', 'Deposit Date', 'Maturity Date', 'Maturity Amount'],
+        {'stock_name': 'Scheme', 'amount': 'Deposit Amount'},
+        {'Scheme': TEXT, 'Deposit Amount': NUMBER},
+        'FD/RD'
+    ),
+    BrokerParser(
+        'axis_bank', 'Axis Bank',
+        ['FD Number', 'Product', 'Principal Amount', 'Interest Rate (%)', 'Value Date',
+         'Maturity Date', 'Maturity Amount'],
+        {'stock_name': 'Product', 'amount': 'Principal Amount'},
+        {'Product': TEXT, 'Principal Amount': NUMBER},
+        'FD/RD'
+    ),
+    BrokerParser(
+        'kotak_bank', 'Kotak Mahindra Bank',
+        ['Deposit Account No', 'Deposit Type', 'Deposit Amount', 'Interest Rate', 'Booking Date',
+         'Maturity Date', 'Maturity Amount'],
+        {'stock_name': 'Deposit Type', 'amount': 'Deposit Amount'},
+        {'Deposit Type': TEXT, 'Deposit Amount': NUMBER},
+        'FD/RD'
+    ),
+]
+
+
+def _normalize(header):
+    return tuple(str(column).strip().lower() for column in header)
+
+
+def fingerprint(header):
+    """Stable hash of a header row, insensitive to case and surrounding whitespace"""
+    return hashlib.blake2b('\x1f'.join(_normalize(header)).encode(), digest_size=16).hexdigest()
+
+
+REGISTRY = {fingerprint(parser.header): parser for parser in PARSERS}
+_schema_cache = {}
+
+
+def read_header(source):
+    """The first row of a CSV path or file-like object, leaving file-likes rewound"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline='', encoding='utf-8-sig') as f:
+            line = f.readline()
+    else:
+        source.seek(0)
+        line = source.readline()
+        source.seek(0)
+        if isinstance(line, bytes):
+            line = line.decode('utf-8-sig')
+    return next(csv.reader(io.StringIO(line)), [])
+
+
+def resolve_schema(header, fallback):
+    """Schema for a header row; fallback(header) builds the generic one for unknown layouts.
+
+    Results are cached per exact header row, so detection runs once per layout.
+    Returns None when the layout has no usable name and quantity/amount columns.
+    """
+    key = tuple(header)
+    if key not in _schema_cache:
+        parser = REGISTRY.get(fingerprint(header))
+        if parser is None:
+            _schema_cache[key] = fallback(header)
+        else:
+            # Map declared names onto the file's own spelling of the header
+            actual = dict(zip(_normalize(parser.header), header))
+            columns = {field: actual[column.lower()] for field, column in parser.columns.items()}
+            dtype = {actual[column.lower()]: kind for column, kind in parser.dtype.items()}
+            _schema_cache[key] = Schema(parser, columns, list(dtype), dtype, parser.category)
+    return _schema_cache[key]
+
+
+def clear_schema_cache():
+    _schema_cache.clear()
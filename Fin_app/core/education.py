@@ -0,0 +1,109 @@
+"""Educational content and tooltips for financial concepts"""
+
+
+class FinancialEducator:
+    def __init__(self):
+        self.concepts = {
+            'behavioral_finance': {
+                'title': '🧠 Behavioral Finance',
+                'content': """
+                **Understanding Your Money Psychology**
+                
+                Behavioral finance studies how psychological influences affect financial decisions. Key concepts:
+                
+                • **Loss Aversion**: Feeling the pain of losses more strongly than pleasure from gains
+                • **Anchoring**: Relying too heavily on first piece of information
+                • **Herd Mentality**: Following what everyone else is doing
+                • **Overconfidence**: Overestimating your investment knowledge
+                
+                **Why it matters**: Understanding these biases helps you make rational financial decisions.
+                """,
+                'tip': 'Regularly review decisions to identify your behavioral patterns.'
+            },
+            'risk_profile': {
+                'title': '🎯 Risk Profile Analysis',
+                'content': """
+                **Finding Your Investment Comfort Zone**
+                
+                Your risk profile determines suitable investments based on:
+                
+                • **Risk Capacity**: How much risk you can afford to take
+                • **Risk Tolerance**: How much risk you're comfortable with
+                • **Risk Requirement**: How much risk you need to achieve goals
+                
+                **Risk Categories**:
+                - **Conservative**: Prefer safety over returns (FDs, Debt funds)
+                - **Moderate**: Balance between safety and growth (Balanced funds)
+                - **Aggressive**: Seek maximum growth (Equity, Small caps)
+                
+                **Tip**: Your risk profile should align with your financial goals and time horizon.
+                """,
+                'tip': 'Rebalance portfolio annually to maintain your target risk level.'
+            },
+            'sip_vs_lumpsum': {
+                'title': '💰 SIP vs Lump Sum Investing',
+                'content': """
+                **Choosing the Right Investment Approach**
+                
+                **SIP (Systematic Investment Plan)**:
+                • Invest fixed amount regularly
+                • Benefits from rupee cost averaging
+                • Reduces impact of market timing
+                • Ideal for salaried individuals
+                
+                **Lump Sum Investing**:
+                • Invest large amount at once
+                • Better if markets are rising
+                • Requires market timing skills
+                • Suitable for bonuses/inheritance
+                
+                **Recommendation**: For most investors, SIP works better due to discipline and averaging benefits.
+                """,
+                'tip': 'Start with SIP for discipline, add lump sum during market corrections.'
+            },
+            'asset_allocation': {
+                'title': '📊 Asset Allocation Strategy',
+                'content': """
+                **The Foundation of Smart Investing**
+                
+                Asset allocation means dividing investments among different categories:
+                
+                • **Equity**: Stocks, mutual funds (high growth, high risk)
+                • **Debt**: Bonds, FDs (stable returns, low risk)
+                • **Gold**: Commodity (inflation hedge, medium risk)
+                • **Real Estate**: Property (long-term, illiquid)
+                
+                **Golden Rule**: Your age in percentage should be in debt instruments.
+                
+                **Example**: If you're 30 years old, 30% in debt, 70% in equity.
+                """,
+                'tip': 'Diversification is the only free lunch in investing.'
+            },
+            'tax_planning': {
+                'title': '🏦 Smart Tax Planning',
+                'content': """
+                **Save Tax, Build Wealth**
+                
+                **Key Tax Saving Instruments**:
+                
+                • **ELSS**: Equity funds with 3-year lock-in (Best returns)
+                • **PPF**: 15-year government scheme (Safe returns)
+                • **NPS**: Pension scheme with extra ₹50,000 deduction
+                • **Health Insurance**: Premiums deductible under Section 80D
+                
+                **Important Sections**:
+                - **80C**: ₹1.5 lakh deduction (ELSS, PPF, Insurance)
+                - **80D**: Health insurance premiums
+                - **24(b)**: Home loan interest (up to ₹2 lakh)
+                - **10(14)**: HRA exemption
+                
+                **Strategy**: Start tax planning early in financial year.
+                """,
+                'tip': 'ELSS gives triple benefits: Tax saving, equity growth, shortest lock-in.'
+            }
+        }
+    
+    def get_tooltip(self, concept_key):
+        """Get educational tooltip for financial concepts"""
+        concept = self.concepts.get(concept_key, {})
+        return concept.get('tip', 'Learn more about this concept in our educational section.')
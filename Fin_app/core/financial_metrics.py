@@ -0,0 +1,148 @@
+"""Derived financial metrics shared by every page, memoised by a content hash of the inputs.
+
+Savings rate, emergency cover, net worth and the health score used to be
+recomputed inline by each page, the predictor and the PDF report. They are
+now derived once per distinct (snapshot, goals, portfolio) and kept in a
+bounded LRU keyed by a canonical hash of that content, so navigating between
+pages with unchanged data is a lookup.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict, namedtuple
+
+FinancialMetrics = namedtuple('FinancialMetrics', [
+    'monthly_income', 'total_expenses', 'monthly_savings', 'savings_rate', 'current_savings',
+    'emergency_months', 'investment_percentage', 'total_assets', 'total_liabilities', 'net_worth',
+    'goals_count', 'goals_total', 'portfolio_total', 'health_score'
+])
+
+CACHE_SIZE = 256
+
+# Points for each input, as (minimum value, points) from the highest band down:
+# savings rate max 40, emergency fund max 30, investment commitment max 30
+HEALTH_BANDS = {
+    'savings_rate': [(20, 40), (15, 30), (10, 20), (5, 10)],
+    'emergency_months': [(6, 30), (4, 20), (2, 10)],
+    'investment_percentage': [(20, 30), (15, 20), (10, 10)]
+}
+
+
+def content_hash(user_data, goals=(), portfolio=()):
+    """Canonical hash of the inputs: key order and container identity do not matter"""
+    payload = json.dumps([user_data, list(goals), list(portfolio)], sort_keys=True,
+                         separators=(',', ':'), default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# --- Formulas, shared with the snapshot graph's nodes (argument names are the node names) ---
+
+def monthly_savings(monthly_income, total_expenses):
+    return monthly_income - total_expenses
+
+
+def savings_rate(monthly_income, monthly_savings):
+    """Share of income saved, in percent"""
+    return (monthly_savings / monthly_income) * 100 if monthly_income > 0 else 0
+
+
+def emergency_months(current_savings, total_expenses):
+    """Months of expenses covered by savings"""
+    return current_savings / total_expenses if total_expenses > 0 else 0
+
+
+def dining_ratio(dining_entertainment, total_expenses):
+    """Dining & Entertainment as a fraction of expenses"""
+    return dining_entertainment / total_expenses if total_expenses > 0 else 0
+
+
+def net_worth(total_assets, total_liabilities):
+    return total_assets - total_liabilities
+
+
+def health_score(savings_rate, emergency_months, investment_percentage):
+    """Financial health score out of 100 from savings, emergency cover and investing"""
+    values = {'savings_rate': savings_rate, 'emergency_months': emergency_months,
+              'investment_percentage': investment_percentage}
+    score = sum(next((points for threshold, points in bands if values[name] >= threshold), 0)
+                for name, bands in HEALTH_BANDS.items())
+    return min(score, 100)
+
+
+def derive_metrics(user_data, goals=(), portfolio=()):
+    """Compute every derived metric from the raw snapshot, goals and holdings"""
+    income = user_data.get('monthly_income', 0)
+    expenses = sum(user_data.get('expenses', {}).values())
+    savings = monthly_savings(income, expenses)
+    rate = savings_rate(income, savings)
+    cushion = user_data.get('current_savings', 0)
+    cover = emergency_months(cushion, expenses)
+    investing = user_data.get('investment_percentage', 0)
+    assets = sum(user_data.get('assets', {}).values())
+    liabilities = sum(user_data.get('liabilities', {}).values())
+    return FinancialMetrics(
+        monthly_income=income,
+        total_expenses=expenses,
+        monthly_savings=savings,
+        savings_rate=rate,
+        current_savings=cushion,
+        emergency_months=cover,
+        investment_percentage=investing,
+        total_assets=assets,
+        total_liabilities=liabilities,
+        net_worth=net_worth(assets, liabilities),
+        goals_count=len(goals),
+        goals_total=sum(goal.get('amount', 0) for goal in goals),
+        portfolio_total=sum(holding.get('amount', 0) for holding in portfolio),
+        health_score=health_score(rate, cover, investing)
+    )
+
+
+class MetricsCache:
+    """Bounded LRU of FinancialMetrics by content hash, safe to share between sessions"""
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_data, goals=(), portfolio=()):
+        key = content_hash(user_data, goals, portfolio)
+        with self._lock:
+            metrics = self._entries.get(key)
+            if metrics is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return metrics
+            self.misses += 1
+        metrics = derive_metrics(user_data, goals, portfolio)
+        with self._lock:
+            self._entries[key] = metrics
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return metrics
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_cache = MetricsCache()
+
+
+def financial_metrics(user_data, goals=(), portfolio=()):
+    """FinancialMetrics for the inputs, from the process-wide cache when seen before"""
+    return _cache.get(user_data, goals, portfolio)
+
+
+def metrics_cache_stats():
+    """Hit/miss counters and occupancy of the process-wide cache"""
+    return _cache.stats()
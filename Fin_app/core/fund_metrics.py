@@ -0,0 +1,179 @@
+"""Return and risk metrics for every scheme in the NAV store.
+
+All schemes are processed together on the store's flat, (code, day)-sorted
+columns using cumulative log NAV L = log(nav):
+
+- rolling N-year CAGR at date t is exp((L_t - L_{t-N}) / N) - 1, where
+  L_{t-N} is the latest NAV on or before t - N years (one searchsorted),
+  with per-scheme quantiles taken from one global sort;
+- volatility, Sharpe and Sortino come from per-scheme sums of daily log
+  returns (np.add.reduceat over scheme segments);
+- drawdowns use a running maximum of L that is made to restart at each
+  scheme by offsetting every segment above all previous ones.
+
+The table is materialised next to the store and rebuilt only when an ingest
+changes the NAV files.
+
+Run from the Fin_app directory:
+    python -m core.fund_metrics
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.nav_store import DAY_BITS, DAY_MASK, NAV_STORE_DIR, NavStore, store_version
+
+ROLLING_YEARS = (1, 3, 5, 10)
+TRADING_DAYS = 252
+RISK_FREE_RATE = 6.5  # annual %, roughly the 91-day T-bill yield
+METRICS_FILE = 'fund_metrics.csv'
+# Rolling-return distributions use every 5th NAV (~weekly); overlapping windows add little
+SAMPLE_STEP = 5
+
+
+def _segments(codes):
+    """Start offset of each scheme's run in the sorted code column"""
+    return np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+
+
+def rolling_cagr(keys, log_nav, rows, years):
+    """N-year CAGR (%) ending at each of rows; NaN where the history is shorter than N years"""
+    lookback = int(round(years * 365.25))
+    ends = keys[rows]
+    starts = np.searchsorted(keys, ends - lookback, side='right') - 1
+    safe = np.maximum(starts, 0)
+    valid = (starts >= 0) & ((keys[safe] >> DAY_BITS) == (ends >> DAY_BITS))
+    # Starting NAVs more than a week older than the window would overstate the period
+    valid &= (ends - keys[safe]) <= lookback + 7
+    return np.where(valid, np.expm1((log_nav[rows] - log_nav[safe]) / years) * 100, np.nan)
+
+
+def segment_quantiles(values, segments, n_segments, quantiles):
+    """Linear-interpolated quantiles of values per segment id, NaN-free input"""
+    result = np.full((len(quantiles), n_segments), np.nan)
+    if not len(values):
+        return result
+    # Offset each segment above the previous ones so one global sort groups and orders them
+    span = values.max() - values.min() + 1.0
+    ordered = np.sort(values + segments * span) - np.sort(segments) * span
+    counts = np.bincount(segments, minlength=n_segments)
+    offsets = np.r_[0, np.cumsum(counts)[:-1]]
+    present = counts > 0
+    for i, quantile in enumerate(quantiles):
+        position = quantile * (counts[present] - 1)
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, counts[present] - 1)
+        weight = position - low
+        base = offsets[present]
+        result[i, present] = ordered[base + low] * (1 - weight) + ordered[base + high] * weight
+    return result
+
+
+def compute_metrics(store, rolling_years=ROLLING_YEARS, risk_free_rate=RISK_FREE_RATE, sample_step=SAMPLE_STEP):
+    """One row per scheme: latest and distribution of rolling CAGRs plus risk metrics"""
+    keys = np.asarray(store.keys)
+    navs = np.asarray(store.navs)
+    positive = navs > 0
+    keys, navs = keys[positive], navs[positive]
+    if not len(keys):
+        return pd.DataFrame()
+
+    codes = keys >> DAY_BITS
+    log_nav = np.log(navs)
+    starts = _segments(codes)
+    ends = np.r_[starts[1:], len(keys)] - 1
+    segment_of = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(keys)]))
+    first_day = keys[starts] & DAY_MASK
+    last_day = keys[ends] & DAY_MASK
+
+    table = pd.DataFrame({
+        'Scheme Code': codes[starts],
+        'Scheme Name': [store.schemes.get(int(code), {}).get('name', '') for code in codes[starts]],
+        'Start': first_day.astype('datetime64[D]'),
+        'End': last_day.astype('datetime64[D]'),
+        'Years': (last_day - first_day) / 365.25
+    })
+
+    # --- Rolling CAGR distributions ---
+    # Sampled every sample_step observations counting back from each scheme's latest NAV
+    from_end = np.repeat(ends, np.diff(np.r_[starts, len(keys)])) - np.arange(len(keys))
+    sampled = np.flatnonzero(from_end % sample_step == 0)
+    for years in rolling_years:
+        cagr = rolling_cagr(keys, log_nav, sampled, years)
+        label = f'{years}Y CAGR'
+        table[f'{label} Latest'] = cagr[np.searchsorted(sampled, ends)]
+        observed = ~np.isnan(cagr)
+        p5, median, p95 = segment_quantiles(cagr[observed], segment_of[sampled][observed], len(starts),
+                                            (0.05, 0.5, 0.95))
+        table[f'{label} P5'] = p5
+        table[f'{label} Median'] = median
+        table[f'{label} P95'] = p95
+
+    # --- Volatility, Sharpe, Sortino ---
+    returns = np.diff(log_nav, prepend=log_nav[0])
+    returns[starts] = 0.0
+    counts = np.maximum(np.diff(np.r_[starts, len(keys)]) - 1, 1)
+    mean = np.add.reduceat(returns, starts) / counts
+    deviation = returns - mean[segment_of]
+    deviation[starts] = 0.0
+    volatility = np.sqrt(np.add.reduceat(deviation ** 2, starts) / counts * TRADING_DAYS)
+    daily_rf = np.log1p(risk_free_rate / 100) / TRADING_DAYS
+    excess = returns - daily_rf
+    excess[starts] = 0.0
+    downside = np.sqrt(np.add.reduceat(np.minimum(excess, 0) ** 2, starts) / counts * TRADING_DAYS)
+    annual_excess = (mean - daily_rf) * TRADING_DAYS
+    table['Volatility'] = volatility * 100
+    table['Sharpe'] = np.divide(annual_excess, volatility, out=np.full(len(starts), np.nan), where=volatility > 1e-9)
+    table['Sortino'] = np.divide(annual_excess, downside, out=np.full(len(starts), np.nan), where=downside > 1e-9)
+
+    # --- Max drawdown ---
+    # Lift each segment above everything before it so one running max restarts per scheme
+    span = log_nav.max() - log_nav.min() + 1.0
+    lifted = log_nav + segment_of * span
+    drawdown = lifted - np.maximum.accumulate(lifted)
+    table['Max Drawdown'] = np.expm1(np.minimum.reduceat(drawdown, starts)) * 100
+    return table
+
+
+def metrics_table(store_dir=NAV_STORE_DIR, store=None):
+    """Materialised metrics for the store, recomputed only when the NAV files change"""
+    version = store_version(store_dir)
+    if version is None:
+        return pd.DataFrame()
+    path = os.path.join(store_dir, METRICS_FILE)
+    stamp = path + '.version'
+    if os.path.exists(path) and os.path.exists(stamp):
+        with open(stamp) as f:
+            if f.read().strip() == str(version):
+                return pd.read_csv(path, parse_dates=['Start', 'End'])
+
+    table = compute_metrics(store or NavStore(store_dir))
+    table.to_csv(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+    with open(stamp, 'w') as f:
+        f.write(str(version))
+    return table
+
+
+def fund_metrics(table, fund_names):
+    """Rows of the metrics table for the given funds, matched by exact scheme name"""
+    index = pd.Index(list(fund_names), name='Fund Name')
+    if table.empty:
+        return pd.DataFrame(index=index)
+    by_name = dict(zip(table['Scheme Name'].str.strip().str.lower()[::-1], table.index[::-1]))
+    rows = [by_name.get(str(name).strip().lower()) for name in fund_names]
+    return table.reindex(rows).set_index(index)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the fund metrics table from the NAV store')
+    parser.add_argument('--store-dir', default=NAV_STORE_DIR)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    table = metrics_table(args.store_dir)
+    print(f"Metrics for {len(table):,} schemes in {time.perf_counter() - start:.1f}s "
+          f"-> {os.path.join(args.store_dir, METRICS_FILE)}")
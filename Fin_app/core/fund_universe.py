@@ -0,0 +1,57 @@
+"""Mutual fund universe loaded from a local Parquet or CSV file and indexed for lookups"""
+import os
+
+import pandas as pd
+
+FUND_UNIVERSE_FILE = os.environ.get(
+    'FIN_APP_FUND_UNIVERSE',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'fund_universe.csv')
+)
+
+# Only these columns are read; wide universe files carry many more metrics
+FUND_COLUMNS = ['Category', 'Fund Name', '1Y Return', '3Y CAGR', '5Y CAGR', 'Risk', 'Rating', 'Expense Ratio']
+FUND_DTYPES = {
+    'Category': object, 'Fund Name': object, 'Risk': object,
+    '1Y Return': 'float64', '3Y CAGR': 'float64', '5Y CAGR': 'float64',
+    'Rating': 'float64', 'Expense Ratio': 'float64'
+}
+
+
+def file_version(path=FUND_UNIVERSE_FILE):
+    """(mtime_ns, size) of the universe file, used as the cache key"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_fund_table(path=FUND_UNIVERSE_FILE, columns=FUND_COLUMNS):
+    """Read only the requested columns from a .parquet or .csv universe file"""
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path, columns=columns)
+    dtype = {column: FUND_DTYPES[column] for column in columns if column in FUND_DTYPES}
+    return pd.read_csv(path, usecols=columns, dtype=dtype, engine='c')
+
+
+class FundUniverse:
+    """Fund table with category and fund-name indexes built once per file version"""
+
+    def __init__(self, table):
+        self.table = table.reset_index(drop=True)
+        self.categories = list(pd.unique(self.table['Category']))
+        self.funds_by_category = {
+            category: list(names) for category, names in self.table.groupby('Category', sort=False)['Fund Name']
+        }
+        self.rows = dict(zip(self.table['Fund Name'], self.table.to_dict('records')))
+
+    @classmethod
+    def load(cls, path=FUND_UNIVERSE_FILE, columns=FUND_COLUMNS):
+        return cls(read_fund_table(path, columns))
+
+    def __len__(self):
+        return len(self.table)
+
+    def funds_in(self, category):
+        return self.funds_by_category.get(category, [])
+
+    def fund(self, name):
+        """Row for one fund as a dict"""
+        return self.rows[name]
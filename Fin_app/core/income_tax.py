@@ -0,0 +1,188 @@
+"""Slab-accurate Indian income tax under the old and new regimes.
+
+Each financial year in TAX_YEARS has a Regime per regime: slab upper bounds
+and rates, the standard deduction, the Section 87A rebate, surcharge bands
+and which Chapter VI-A deductions it allows. Every function takes scalars or
+arrays (one value per client) and broadcasts, so a whole client book is taxed
+in one pass: slab tax is the tax due at the lower bound of each client's slab
+plus the slab rate on the income above it, found with one searchsorted per
+age group (the old regime raises the first bound for senior citizens).
+
+Tax = slab tax - 87A rebate (with marginal relief where the regime has it)
++ surcharge (with marginal relief at each band) + 4% health and education
+cess, rounded to the rupee. Salary income is assumed, so the standard
+deduction always applies.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+Regime = namedtuple('Regime', [
+    'slabs',                   # ((upper bound, rate %), ...), last bound inf
+    'standard_deduction',
+    'rebate_limit', 'rebate_max',
+    'rebate_marginal_relief',  # tax above the limit capped at the income above it
+    'surcharge',               # ((income above, rate %), ...)
+    'deductions',              # allows 80C, 80CCD(1B), 80D, HRA and Section 24
+    'senior_exemptions'        # ((minimum age, exempt amount), ...) replacing the first slab bound
+])
+TaxBreakdown = namedtuple('TaxBreakdown', ['taxable_income', 'slab_tax', 'rebate', 'surcharge', 'cess', 'total'])
+RegimeComparison = namedtuple('RegimeComparison', [
+    'old', 'new',  # TaxBreakdown
+    'better',      # 'old' or 'new' per client; the new regime on a tie
+    'saving'       # tax saved by the better regime over the other
+])
+
+INF = float('inf')
+CESS = 0.04
+SURCHARGE = ((5_000_000, 10), (10_000_000, 15), (20_000_000, 25), (50_000_000, 37))
+NEW_REGIME_SURCHARGE = SURCHARGE[:3]  # capped at 25%
+OLD_REGIME = Regime(((250_000, 0), (500_000, 5), (1_000_000, 20), (INF, 30)), 50_000, 500_000, 12_500, False,
+                    SURCHARGE, True, ((60, 300_000), (80, 500_000)))
+
+TAX_YEARS = {
+    'FY2023-24': {
+        'old': OLD_REGIME,
+        'new': Regime(((300_000, 0), (600_000, 5), (900_000, 10), (1_200_000, 15), (1_500_000, 20), (INF, 30)),
+                      50_000, 700_000, 25_000, True, NEW_REGIME_SURCHARGE, False, ())
+    },
+    'FY2024-25': {
+        'old': OLD_REGIME,
+        'new': Regime(((300_000, 0), (700_000, 5), (1_000_000, 10), (1_200_000, 15), (1_500_000, 20), (INF, 30)),
+                      75_000, 700_000, 25_000, True, NEW_REGIME_SURCHARGE, False, ())
+    },
+    'FY2025-26': {
+        'old': OLD_REGIME,
+        'new': Regime(((400_000, 0), (800_000, 5), (1_200_000, 10), (1_600_000, 15), (2_000_000, 20),
+                       (2_400_000, 25), (INF, 30)),
+                      75_000, 1_200_000, 60_000, True, NEW_REGIME_SURCHARGE, False, ())
+    }
+}
+LATEST_YEAR = max(TAX_YEARS)
+REGIMES = ('old', 'new')
+
+# Chapter VI-A and house property caps under the old regime; None is uncapped
+DEDUCTION_LIMITS = {
+    'section_80c': 150_000,
+    'section_80ccd_1b': 50_000,
+    'section_80d': 25_000,           # 50,000 when the client is a senior citizen
+    'hra_exemption': None,
+    'home_loan_interest': 200_000    # Section 24(b), self-occupied
+}
+SENIOR_80D_LIMIT = 50_000
+
+
+def hra_exemption(basic_salary, hra_received, rent_paid, metro=False):
+    """Section 10(13A): least of HRA received, rent over 10% of basic, and 50% (metro) or 40% of basic"""
+    basic_salary = np.asarray(basic_salary, dtype=float)
+    share = np.where(metro, 0.5, 0.4)
+    return np.maximum(np.minimum.reduce([np.broadcast_to(hra_received, basic_salary.shape).astype(float),
+                                         np.asarray(rent_paid, dtype=float) - 0.1 * basic_salary,
+                                         share * basic_salary]), 0.0)
+
+
+def allowed_deductions(deductions, age=30):
+    """Total capped deductions per client under the old regime; deductions maps DEDUCTION_LIMITS keys to amounts"""
+    unknown = set(deductions) - set(DEDUCTION_LIMITS)
+    if unknown:
+        raise ValueError(f"Unknown deductions {sorted(unknown)}; expected keys of DEDUCTION_LIMITS")
+    total = 0.0
+    for name, amount in deductions.items():
+        amount = np.maximum(np.asarray(amount, dtype=float), 0.0)
+        limit = DEDUCTION_LIMITS[name]
+        if name == 'section_80d':
+            limit = np.where(np.asarray(age) >= 60, SENIOR_80D_LIMIT, limit)
+        total = total + (amount if limit is None else np.minimum(amount, limit))
+    return total
+
+
+def _slab_table(regime, first_bound):
+    """Slab upper bounds, lower bounds, rates and tax due at each lower bound for one first bound"""
+    uppers = np.array([upper for upper, _ in regime.slabs], dtype=float)
+    uppers[0] = first_bound
+    uppers = np.maximum.accumulate(uppers)
+    lowers = np.concatenate([[0.0], uppers[:-1]])
+    rates = np.array([rate for _, rate in regime.slabs], dtype=float) / 100
+    due = np.concatenate([[0.0], np.cumsum(rates[:-1] * (uppers[:-1] - lowers[:-1]))])
+    return uppers, lowers, rates, due
+
+
+def slab_tax(taxable_income, regime, age=30):
+    """Tax on taxable income from the regime's slabs alone"""
+    taxable_income, age = np.broadcast_arrays(np.asarray(taxable_income, dtype=float), np.asarray(age, dtype=float))
+    # Age groups differ only in the first bound: 0 below every senior age, then one group per exemption
+    first_bounds = [regime.slabs[0][0]] + [exempt for _, exempt in regime.senior_exemptions]
+    group = np.searchsorted([minimum_age for minimum_age, _ in regime.senior_exemptions], age, side='right')
+    tax = np.empty(taxable_income.shape)
+    for g, first_bound in enumerate(first_bounds):
+        members = group == g
+        if not members.any():
+            continue
+        uppers, lowers, rates, due = _slab_table(regime, first_bound)
+        income = taxable_income[members]
+        # Slab holding each income: lower < income <= upper
+        slab = np.minimum(np.searchsorted(uppers, income, side='left'), len(uppers) - 1)
+        tax[members] = due[slab] + rates[slab] * (income - lowers[slab])
+    return tax
+
+
+def _surcharge(taxable_income, tax, regime, age):
+    """Surcharge with marginal relief: tax plus surcharge rises no faster than income above each band"""
+    surcharge = np.zeros(tax.shape)
+    previous_rate = 0.0
+    for threshold, rate in regime.surcharge:
+        above = taxable_income > threshold
+        if not above.any():
+            break
+        income, due = taxable_income[above], tax[above]
+        at_threshold = slab_tax(threshold, regime, age[above]) * (1 + previous_rate)
+        surcharge[above] = np.minimum(due * rate / 100, at_threshold + (income - threshold) - due)
+        previous_rate = rate / 100
+    return surcharge
+
+
+def _tax(gross_income, rules, claimed, age):
+    taxable, age = np.broadcast_arrays(np.maximum(gross_income - rules.standard_deduction - claimed, 0.0), age)
+    tax = slab_tax(taxable, rules, age)
+    within_limit = taxable <= rules.rebate_limit
+    rebate = np.where(within_limit, np.minimum(tax, rules.rebate_max), 0.0)
+    if rules.rebate_marginal_relief:
+        # Just above the limit, tax cannot exceed the income above the limit
+        rebate = np.where(within_limit, rebate, np.maximum(tax - (taxable - rules.rebate_limit), 0.0))
+    surcharge = _surcharge(taxable, tax - rebate, rules, age)
+    cess = (tax - rebate + surcharge) * CESS
+    return TaxBreakdown(taxable, tax, rebate, surcharge, cess, np.round(tax - rebate + surcharge + cess))
+
+
+def income_tax(gross_income, regime='new', deductions=None, age=30, year=LATEST_YEAR):
+    """TaxBreakdown for gross salary income under one regime; deductions count only where the regime allows them"""
+    rules = TAX_YEARS[year][regime]
+    gross_income, age = np.asarray(gross_income, dtype=float), np.asarray(age, dtype=float)
+    claimed = allowed_deductions(deductions, age) if deductions and rules.deductions else 0.0
+    return _tax(gross_income, rules, claimed, age)
+
+
+def compare_regimes(gross_income, deductions=None, age=30, year=LATEST_YEAR):
+    """Tax under both regimes and the cheaper one for every client"""
+    old = income_tax(gross_income, 'old', deductions, age, year)
+    new = income_tax(gross_income, 'new', deductions, age, year)
+    better = np.where(old.total < new.total, 'old', 'new')
+    return RegimeComparison(old, new, better, np.abs(old.total - new.total))
+
+
+def break_even_deductions(gross_income, age=30, year=LATEST_YEAR):
+    """Old-regime deductions from which the old regime costs no more than the new one (inf when it never does)"""
+    gross_income, age = np.broadcast_arrays(np.atleast_1d(np.asarray(gross_income, dtype=float)),
+                                            np.asarray(age, dtype=float))
+    new_total = income_tax(gross_income, 'new', age=age, year=year).total
+    old = TAX_YEARS[year]['old']
+    # Old-regime tax only falls as deductions rise, so bisect on whole rupees: low is too little, high enough
+    low, high = np.full(gross_income.shape, -1.0), np.maximum(gross_income - old.standard_deduction, 0.0)
+    for _ in range(int(np.ceil(np.log2(max(high.max(), 1.0)))) + 1):
+        middle = np.floor((low + high) / 2)
+        cheaper = _tax(gross_income, old, np.maximum(middle, 0.0), age).total <= new_total
+        searching = high - low > 1
+        low = np.where(searching & ~cheaper, middle, low)
+        high = np.where(searching & cheaper, middle, high)
+    reachable = _tax(gross_income, old, high, age).total <= new_total
+    return np.where(reachable, high, np.inf)
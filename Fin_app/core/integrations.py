@@ -0,0 +1,102 @@
+"""Broker/bank integration instructions and CSV holdings import"""
+
+
+class CSVImportError(ValueError):
+    """An uploaded holdings file could not be parsed"""
+
+
+class PortfolioIntegrator:
+    def __init__(self):
+        self.supported_brokers = {
+            'zerodha': {'name': 'Zerodha Kite', 'type': 'broker'},
+            'angelone': {'name': 'Angel One', 'type': 'broker'},
+            'icici_direct': {'name': 'ICICI Direct', 'type': 'broker'},
+            'hdfc_sec': {'name': 'HDFC Securities', 'type': 'broker'},
+            'kotak_sec': {'name': 'Kotak Securities', 'type': 'broker'},
+            'axis_sec': {'name': 'Axis Securities', 'type': 'broker'}
+        }
+        
+        self.supported_banks = {
+            'hdfc_bank': {'name': 'HDFC Bank', 'type': 'bank'},
+            'icici_bank': {'name': 'ICICI Bank', 'type': 'bank'},
+            'sbi_bank': {'name': 'State Bank of India', 'type': 'bank'},
+            'axis_bank': {'name': 'Axis Bank', 'type': 'bank'},
+            'kotak_bank': {'name': 'Kotak Mahindra Bank', 'type': 'bank'}
+        }
+    
+    def get_integration_instructions(self, platform_type, platform_name):
+        """Provide instructions for manual integration"""
+        instructions = {
+            'broker': f"""
+            ### 📊 {platform_name} Integration Instructions
+            
+            **🔒 Privacy-First Approach**: For maximum security, we recommend manual CSV import:
+            
+            1. **Login to your {platform_name} account**
+            2. **Navigate to Portfolio/Holdings section**
+            3. **Export as CSV/Excel file**
+            4. **Upload the file here for automatic processing**
+            
+            **Supported Data**:
+            - Stocks & Equity Holdings
+            - Mutual Fund Investments  
+            - ETF Holdings
+            - Cash Balance
+            
+            **Security Note**: Your data never leaves your device. All processing happens locally.
+            """,
+            
+            'bank': f"""
+            ### 🏦 {platform_name} Integration Instructions
+            
+            **🔒 Secure Manual Integration**:
+            
+            1. **Login to {platform_name} Net Banking**
+            2. **Go to Investments/Portfolio section**
+            3. **Download investment statement (CSV/PDF)**
+            4. **Upload here for local processing**
+            
+            **Supported Investments**:
+            - Fixed Deposits (FDs)
+            - Recurring Deposits (RDs)  
+            - Mutual Funds via bank
+            - Bonds & Debentures
+            
+            **Privacy Guarantee**: All data processing occurs 100% locally on your device.
+            """
+        }
+        return instructions.get(platform_type, "")
+    
+    # core.csv_import pulls in pandas, so it is imported on the first upload rather than with the engine
+    def detect_csv_format(self, uploaded_file):
+        """Name of the institution whose export layout matches the file, if any"""
+        from core.csv_import import detect_schema
+        try:
+            schema = detect_schema(uploaded_file)
+        except Exception:
+            return None
+        return schema.parser.name if schema is not None and schema.parser is not None else None
+    
+    def process_csv_upload(self, uploaded_file):
+        """Holdings DataFrame from an uploaded CSV file; raises CSVImportError when it cannot be read"""
+        from core.csv_import import read_holdings
+        try:
+            return read_holdings(uploaded_file)
+        except Exception as e:
+            raise CSVImportError(f"Error processing CSV file: {str(e)}") from e
+    
+    def preview_csv_upload(self, uploaded_file):
+        """Holdings count and first rows of an uploaded CSV file, streamed rather than loaded whole"""
+        from core.csv_import import preview_holdings
+        try:
+            return preview_holdings(uploaded_file)
+        except Exception as e:
+            raise CSVImportError(f"Error processing CSV file: {str(e)}") from e
+    
+    def import_csv_upload(self, uploaded_file, storage):
+        """Add an uploaded CSV file's holdings to storage a chunk at a time; returns how many were added"""
+        from core.csv_import import import_holdings
+        try:
+            return import_holdings(uploaded_file, storage)
+        except Exception as e:
+            raise CSVImportError(f"Error importing CSV file: {str(e)}") from e
@@ -0,0 +1,170 @@
+"""Loan amortization and snowball vs avalanche prepayment.
+
+emi_schedule() builds the contractual EMI schedule of every loan at once from
+the closed-form outstanding balance
+B_t = P(1+r)^t - EMI((1+r)^t - 1)/r over a (loans, months) grid.
+
+prepayment_sweep() compares payoff strategies for many extra-payment amounts
+in one pass. The monthly budget is the sum of every loan's EMI plus the extra
+amount; each month every open loan accrues interest and gets its EMI, and
+whatever is left (the extra plus the EMIs of loans already cleared) goes to
+loans in the strategy's priority order: snowball clears the smallest balance
+first, avalanche the highest rate first. The month loop runs over
+(strategies, extra amounts, loans) arrays, with loans pre-sorted into each
+strategy's priority order so the cascade is a cumulative sum.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# Snapshot liability -> (annual rate %, remaining months) assumed until the user enters their own terms
+LOAN_TERMS = {
+    'Home Loan': (8.5, 240),
+    'Personal Loan': (13.0, 36),
+    'Other Debt': (18.0, 24)
+}
+STRATEGIES = ('avalanche', 'snowball')
+MAX_MONTHS = 600
+CLEARED = 0.5  # rupees; a balance below this counts as paid off
+
+EmiSchedule = namedtuple('EmiSchedule', [
+    'month',                           # (months,) 1-based
+    'payment', 'interest', 'balance',  # (loans, months); zero after payoff
+    'payoff_month',                    # (loans,) inf when the EMI does not cover the interest
+    'total_interest'                   # (loans,)
+])
+PrepaymentSweep = namedtuple('PrepaymentSweep', [
+    'extras', 'strategies',
+    'total_interest',    # (strategies, extras)
+    'interest_saved',    # (strategies, extras) against the contractual schedules
+    'payoff_month',      # (strategies, extras, loans) in the input loan order
+    'debt_free_month',   # (strategies, extras)
+    'baseline'           # EmiSchedule with no extra payments and no rollover
+])
+PayoffTimeline = namedtuple('PayoffTimeline', ['month', 'payment', 'interest', 'balance'])  # (months, loans) arrays
+
+
+def emi(principal, annual_rate, months):
+    """Monthly instalment that clears principal in months at annual_rate %"""
+    r = np.asarray(annual_rate, dtype=float) / 100 / 12
+    months = np.asarray(months, dtype=float)
+    safe_r = np.where(r > 0, r, 1.0)
+    return np.where(r > 0, principal * safe_r / (1 - (1 + safe_r) ** -months), principal / months)
+
+
+def snapshot_loans(user_data, terms=LOAN_TERMS):
+    """Loans from the snapshot liabilities with the assumed terms; zero balances are left out"""
+    loans = []
+    for name, balance in user_data.get('liabilities', {}).items():
+        if balance > 0 and name in terms:
+            rate, months = terms[name]
+            loans.append({'name': name, 'balance': float(balance), 'rate': rate,
+                          'emi': float(np.round(emi(balance, rate, months), 0))})
+    return loans
+
+
+def _loan_arrays(loans):
+    return (np.array([loan['balance'] for loan in loans], dtype=float),
+            np.array([loan['rate'] for loan in loans], dtype=float) / 100 / 12,
+            np.array([loan['emi'] for loan in loans], dtype=float))
+
+
+def emi_schedule(loans, max_months=MAX_MONTHS):
+    """Contractual schedule of every loan with no prepayment"""
+    balance, r, instalment = _loan_arrays(loans)
+    t = np.arange(max_months + 1, dtype=float)
+    growth = (1 + r[:, None]) ** t
+    safe_r = np.where(r > 0, r, 1.0)[:, None]
+    annuity = np.where(r[:, None] > 0, (growth - 1) / safe_r, t)
+    outstanding = np.maximum(balance[:, None] * growth - instalment[:, None] * annuity, 0.0)
+    outstanding[outstanding < CLEARED] = 0.0
+    opening = outstanding[:, :-1]
+    interest = opening * r[:, None]
+    payment = opening + interest - outstanding[:, 1:]
+    cleared = outstanding[:, 1:] == 0
+    payoff = np.where(cleared.any(axis=1), cleared.argmax(axis=1) + 1.0, np.inf)
+    return EmiSchedule(t[1:].astype(int), payment, interest, outstanding[:, 1:], payoff, interest.sum(axis=1))
+
+
+def priority_order(loans, strategy):
+    """Loan indices in the order a strategy sends spare money to them"""
+    balance, r, _ = _loan_arrays(loans)
+    if strategy == 'snowball':
+        return np.lexsort((-r, balance))
+    if strategy == 'avalanche':
+        return np.lexsort((balance, -r))
+    raise ValueError(f"strategy must be one of {STRATEGIES}, got {strategy!r}")
+
+
+def _simulate(balance, r, instalment, extras, max_months, record=False):
+    """Month loop over (..., loans) arrays already in priority order; returns interest, payoff month and history"""
+    shape = np.broadcast_shapes(balance.shape, r.shape, instalment.shape, np.shape(extras) + (1,))
+    n_loans = shape[-1]
+    balance, r, instalment = (np.broadcast_to(v, shape).reshape(-1, n_loans) for v in (balance, r, instalment))
+    budget = instalment.sum(axis=1) + np.broadcast_to(extras, shape[:-1]).reshape(-1)
+    payoff = np.full(balance.shape, np.inf)
+    total_interest = np.zeros(balance.shape)
+    # Rows still paying, with their running totals; finished rows are written out and dropped
+    # so the late months only touch the slow ones
+    active = np.arange(len(balance))
+    row_payoff, row_interest = payoff.copy(), total_interest.copy()
+    history = []
+    for month in range(1, max_months + 1):
+        opening = balance
+        interest = balance * r
+        balance = balance + interest
+        minimum = np.minimum(instalment, balance)
+        balance = balance - minimum
+        # Spare money cascades down the priority order: each loan takes what is left after the ones before it
+        spare = (budget - minimum.sum(axis=1))[:, None]
+        ahead = np.cumsum(balance, axis=1) - balance
+        balance = balance - np.clip(spare - ahead, 0.0, balance)
+        balance[balance < CLEARED] = 0.0
+        row_interest += interest
+        row_payoff[(balance == 0) & np.isinf(row_payoff)] = month
+        if record:
+            history.append((opening + interest - balance, interest, balance))
+        paying = balance.any(axis=1)
+        if not paying.all():
+            done = ~paying
+            payoff[active[done]], total_interest[active[done]] = row_payoff[done], row_interest[done]
+            active, balance, r, instalment, budget, row_payoff, row_interest = (
+                v[paying] for v in (active, balance, r, instalment, budget, row_payoff, row_interest))
+            if not len(active):
+                break
+    payoff[active], total_interest[active] = row_payoff, row_interest
+    return total_interest.reshape(shape), payoff.reshape(shape), history
+
+
+def prepayment_sweep(loans, extras, strategies=STRATEGIES, max_months=MAX_MONTHS):
+    """Interest and payoff months of each strategy for every extra monthly payment in extras"""
+    extras = np.atleast_1d(np.asarray(extras, dtype=float))
+    balance, r, instalment = _loan_arrays(loans)
+    orders = np.stack([priority_order(loans, strategy) for strategy in strategies])  # (strategies, loans)
+    total_interest, payoff, _ = _simulate(
+        np.broadcast_to(balance[orders][:, None, :], (len(strategies), len(extras), len(loans))),
+        r[orders][:, None, :], instalment[orders][:, None, :], extras[None, :], max_months)
+    # Back to the input loan order
+    payoff = np.take_along_axis(payoff, np.argsort(orders, axis=1)[:, None, :], axis=2)
+    baseline = emi_schedule(loans, max_months)
+    total = total_interest.sum(axis=2)
+    return PrepaymentSweep(extras, tuple(strategies), total, baseline.total_interest.sum() - total,
+                           payoff, payoff.max(axis=2), baseline)
+
+
+def payoff_timeline(loans, extra, strategy, max_months=MAX_MONTHS):
+    """Month-by-month payment, interest and balance of every loan (input order) under one strategy"""
+    balance, r, instalment = _loan_arrays(loans)
+    order = priority_order(loans, strategy)
+    _, _, history = _simulate(balance[order], r[order], instalment[order], float(extra), max_months, record=True)
+    restore = np.argsort(order)
+    payment, interest, remaining = (np.concatenate(column)[:, restore] for column in zip(*history))
+    return PayoffTimeline(np.arange(1, len(history) + 1), payment, interest, remaining)
+
+
+def month_label(months_ahead, start):
+    """'Mon YYYY' months_ahead months after the date start; 'Never' for inf"""
+    if not np.isfinite(months_ahead):
+        return 'Never'
+    index = start.year * 12 + start.month - 1 + int(months_ahead)
+    return f"{['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][index % 12]} {index // 12}"
@@ -0,0 +1,136 @@
+"""Seeded Monte Carlo simulation of goal-based SIP portfolios.
+
+Each goal starts from its current savings and receives a fixed SIP at the end
+of every month while the balance compounds at a stochastic monthly return:
+
+    log(1 + R_t) ~ Normal(log1p(r / 12) - sigma_m ** 2 / 2, sigma_m)
+
+so the expected monthly growth equals the deterministic 1 + r / 12 used by
+core.projection. All goals are evaluated against the same random draws
+(common random numbers): per chunk of paths, the cumulative sum of standard
+normals C_t is generated once, half of it as antithetic mirror paths, and
+each goal's log-balance is the affine transform S_t = mu * t + sigma * C_t.
+Terminal wealth then reduces to
+
+    W_n = exp(S_n) * (initial + sip * sum_{t=1..n} exp(-S_t))
+
+where the inner sum is a single matrix-vector product per goal.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+SHORTFALL_QUANTILES = (50, 75, 90, 95, 99)
+
+GoalSimulation = namedtuple('GoalSimulation', [
+    'probability',       # (goals,) share of paths that reach the target
+    'terminal_wealth',   # (goals, paths) balance at each goal's horizon
+    'shortfall',         # (goals, paths) max(target - terminal wealth, 0)
+    'percentiles',       # percentile levels used for percentile_paths
+    'path_months',       # month index of each percentile_paths column
+    'percentile_paths',  # (goals, len(percentiles), len(path_months)); NaN past a goal's horizon
+])
+
+
+def default_volatility(annual_return):
+    """Annual volatility assumed for an expected return: riskier mixes earn more"""
+    return np.clip(np.asarray(annual_return, dtype=float) / 100 * 1.25, 0.01, 0.35)
+
+
+def simulate_goals(targets, years, annual_returns, monthly_contribution, initial_savings=0.0,
+                   volatility=None, n_paths=100_000, seed=42, chunk_size=512,
+                   percentiles=DEFAULT_PERCENTILES, path_step=12, percentile_sample=4096):
+    """Simulate every goal at once and return a GoalSimulation.
+
+    Goal arguments broadcast to one value per goal. Paths are simulated in
+    chunks of chunk_size so peak memory stays around 2 * chunk_size * months
+    float32 values regardless of n_paths. Percentile paths are sampled every
+    path_step months from the first percentile_sample paths.
+    """
+    targets, years, annual_returns, monthly_contribution, initial_savings = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float))
+          for v in (targets, years, annual_returns, monthly_contribution, initial_savings))
+    )
+    n_goals = targets.shape[0]
+    months = np.maximum(np.floor(years * 12).astype(int), 1)
+    horizon = int(months.max())
+
+    if volatility is None:
+        volatility = default_volatility(annual_returns)
+    sigma_m = np.broadcast_to(np.asarray(volatility, dtype=float), (n_goals,)) / np.sqrt(12)
+    mu_m = np.log1p(annual_returns / 100 / 12) - sigma_m ** 2 / 2
+    t = np.arange(1, horizon + 1, dtype=np.float64)
+    path_months = np.arange(0, horizon + 1, path_step)
+
+    rng = np.random.Generator(np.random.SFC64(seed))
+    terminal = np.empty((n_goals, n_paths), dtype=np.float64)
+    percentile_paths = np.full((n_goals, len(percentiles), len(path_months)), np.nan)
+    sample_size = min(percentile_sample, n_paths)
+    sampled_balances = np.empty((n_goals, sample_size, len(path_months) - 1))
+    chunk_size = min(chunk_size, n_paths)
+    cum_normals = np.empty(((chunk_size + 1) // 2, horizon), dtype=np.float32)
+    work = np.empty((chunk_size, horizon), dtype=np.float32)
+
+    for start in range(0, n_paths, chunk_size):
+        size = min(chunk_size, n_paths - start)
+        # Only the first half of the chunk is drawn; the other half mirrors it (C -> -C)
+        half = (size + 1) // 2
+        mirror = size - half
+        chunk = cum_normals[:half]
+        rng.standard_normal((half, horizon), dtype=np.float32, out=chunk)
+        np.cumsum(chunk, axis=1, out=chunk)
+
+        for g in range(n_goals):
+            n = months[g]
+            block = work[:size, :n]
+            # exp(-sigma * C_t) on the shared draws; the drift term exp(-mu * t)
+            # is applied as weights of the matrix-vector product below. Python
+            # float keeps the multiply in float32 (a NumPy float64 would upcast),
+            # and mirrored rows are exp(+sigma * C_t), i.e. the reciprocal.
+            np.multiply(chunk[:, :n], -float(sigma_m[g]), out=block[:half])
+            np.exp(block[:half], out=block[:half])
+            np.reciprocal(block[:mirror], out=block[half:])
+            discounted_sum = block @ np.exp(-mu_m[g] * t[:n]).astype(np.float32)
+            last = chunk[:, n - 1].astype(np.float64)
+            log_growth = mu_m[g] * n + sigma_m[g] * np.concatenate([last, -last[:mirror]])
+            terminal[g, start:start + size] = np.exp(log_growth) * (
+                initial_savings[g] + monthly_contribution[g] * discounted_sum
+            )
+
+            if start < sample_size:
+                # block still holds exp(-sigma * C_t) (mirrored rows exp(+sigma * C_t)); the drift
+                # exp(-mu * t) enters through weights. With S_t = mu * t + sigma * C_t the balance
+                # at a sampled month m is exp(S_m) * (initial + sip * sum_{t<=m} exp(-S_t)), the
+                # partial sums taken for all sampled months at once through a weighted 0/1 step matrix.
+                rows = min(size, sample_size - start)
+                sampled = path_months[1:][path_months[1:] <= n]
+                weights = np.exp(-mu_m[g] * t[:n])
+                steps = (np.arange(n)[:, None] < sampled[None, :]) * weights[:, None]
+                partial_sums = block[:rows] @ steps.astype(np.float32)
+                discount_at = block[:rows, sampled - 1] * weights[sampled - 1]
+                sampled_balances[g, start:start + rows, :len(sampled)] = (
+                    initial_savings[g] + monthly_contribution[g] * partial_sums
+                ) / discount_at
+
+    for g in range(n_goals):
+        columns = int(np.sum(path_months[1:] <= months[g]))
+        percentile_paths[g, :, 0] = initial_savings[g]
+        percentile_paths[g, :, 1:columns + 1] = np.percentile(sampled_balances[g, :, :columns], percentiles, axis=0)
+
+    shortfall = np.maximum(targets[:, None] - terminal, 0.0)
+    probability = (terminal >= targets[:, None]).mean(axis=1)
+    return GoalSimulation(probability, terminal, shortfall, tuple(percentiles), path_months, percentile_paths)
+
+
+def shortfall_summary(simulation, quantiles=SHORTFALL_QUANTILES):
+    """Expected shortfall and shortfall quantiles per goal"""
+    shortfall = simulation.shortfall
+    return {
+        'expected': shortfall.mean(axis=1),
+        'expected_when_missed': np.divide(
+            shortfall.sum(axis=1), (shortfall > 0).sum(axis=1),
+            out=np.zeros(shortfall.shape[0]), where=(shortfall > 0).any(axis=1)
+        ),
+        'quantiles': dict(zip(quantiles, np.percentile(shortfall, quantiles, axis=1)))
+    }
@@ -0,0 +1,274 @@
+"""Offline NAV history store built from AMFI NAVAll.txt and historical NAV dumps.
+
+Rows are kept as two memory-mapped .npy columns sorted by a packed
+(scheme code, day) int64 key, so a point-in-time lookup for any number of
+schemes is one np.searchsorted call and a date range is a contiguous slice.
+Scheme names and ISINs live alongside in schemes.json for joining holdings.
+Each ingest writes all three files into a fresh version directory and then
+swaps the CURRENT pointer file in one rename, so readers never see columns
+from two different ingests.
+
+Run from the Fin_app directory:
+    python -m core.nav_store ingest NAVAll.txt history/*.txt
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from core.storage import DATA_DIR
+
+NAV_STORE_DIR = os.path.join(DATA_DIR, 'nav_store')
+
+CURRENT_FILE = 'CURRENT'  # names the version directory readers open
+VERSION_PREFIX = 'v'
+STORE_FILES = ('keys.npy', 'navs.npy', 'schemes.json')
+
+# Days since 1970-01-01 occupy the low DAY_BITS of each key, the scheme code the rest
+DAY_BITS = 20
+DAY_MASK = (1 << DAY_BITS) - 1
+
+# Header names used by NAVAll.txt and the AMFI NAV history report
+CODE_COLUMN = 'Scheme Code'
+NAME_COLUMN = 'Scheme Name'
+NAV_COLUMN = 'Net Asset Value'
+DATE_COLUMN = 'Date'
+ISIN_PREFIX = 'ISIN'
+
+NavQuote = namedtuple('NavQuote', ['nav', 'date'])
+
+
+def pack_keys(codes, days):
+    return (np.asarray(codes, dtype=np.int64) << DAY_BITS) | np.asarray(days, dtype=np.int64)
+
+
+def to_days(dates):
+    """datetime-like (scalar or array) -> int days since the epoch"""
+    return np.asarray(dates, dtype='datetime64[D]').astype(np.int64)
+
+
+# --- Parsing ---
+def parse_nav_file(path):
+    """Rows of one AMFI file as a DataFrame: code, day, nav, name, isin_0, isin_1, ...
+
+    Section titles and fund-house lines carry no separator and are dropped,
+    as are rows whose NAV is 'N.A.' or otherwise non-numeric.
+    """
+    with open(path, encoding='utf-8-sig', errors='replace') as f:
+        header = [column.strip() for column in f.readline().split(';')]
+    isin_columns = [column for column in header if column.startswith(ISIN_PREFIX)]
+    usecols = [CODE_COLUMN, NAME_COLUMN, NAV_COLUMN, DATE_COLUMN] + isin_columns
+
+    raw = pd.read_csv(path, sep=';', header=0, names=header, usecols=usecols, dtype=object,
+                      skip_blank_lines=True, encoding='utf-8-sig', encoding_errors='replace',
+                      engine='c')
+    codes = pd.to_numeric(raw[CODE_COLUMN], errors='coerce')
+    navs = pd.to_numeric(raw[NAV_COLUMN], errors='coerce')
+    raw = raw[(codes.notna() & navs.notna() & raw[DATE_COLUMN].notna()).to_numpy()]
+
+    # A dump spans a few thousand distinct dates: parse each once, then broadcast
+    date_codes, unique_dates = pd.factorize(raw[DATE_COLUMN].str.strip())
+    parsed = pd.to_datetime(unique_dates, format='%d-%b-%Y', errors='coerce')
+    days = np.where(parsed.isna(), -1, to_days(parsed.fillna(pd.Timestamp(0))))[date_codes]
+
+    frame = pd.DataFrame({
+        'code': codes[raw.index].to_numpy(dtype=np.int64),
+        'day': days,
+        'nav': navs[raw.index].to_numpy(dtype=np.float64),
+        'name': raw[NAME_COLUMN].str.strip().to_numpy()
+    })
+    for i, column in enumerate(isin_columns):
+        frame[f'isin_{i}'] = raw[column].to_numpy()
+    return frame[days >= 0]
+
+
+# --- Store ---
+def _current_version(store_dir):
+    try:
+        with open(os.path.join(store_dir, CURRENT_FILE)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def current_dir(store_dir=NAV_STORE_DIR):
+    """Directory holding the live columns; store_dir itself for a store written before versioning"""
+    version = _current_version(store_dir)
+    return store_dir if version is None else os.path.join(store_dir, version)
+
+
+def store_version(store_dir=NAV_STORE_DIR):
+    """Live version name (navs.npy mtime for a store written before versioning); None when the store is empty"""
+    version = _current_version(store_dir)
+    if version is not None:
+        return version
+    try:
+        return os.stat(os.path.join(store_dir, 'navs.npy')).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class NavStore:
+    """Read side of the store: memory-mapped columns plus scheme indexes"""
+
+    def __init__(self, store_dir=NAV_STORE_DIR):
+        self.store_dir = store_dir
+        data_dir = current_dir(store_dir)
+        self.keys_file = os.path.join(data_dir, 'keys.npy')
+        self.navs_file = os.path.join(data_dir, 'navs.npy')
+        self.schemes_file = os.path.join(data_dir, 'schemes.json')
+        if os.path.exists(self.keys_file):
+            self.keys = np.load(self.keys_file, mmap_mode='r')
+            self.navs = np.load(self.navs_file, mmap_mode='r')
+            if len(self.keys) != len(self.navs):
+                raise ValueError(f"NAV store at {data_dir} is inconsistent: "
+                                 f"{len(self.keys):,} keys but {len(self.navs):,} NAVs")
+            with open(self.schemes_file) as f:
+                self.schemes = {int(code): scheme for code, scheme in json.load(f).items()}
+        else:
+            self.keys = np.empty(0, dtype=np.int64)
+            self.navs = np.empty(0, dtype=np.float64)
+            self.schemes = {}
+        self.isin_index = {isin: code for code, scheme in self.schemes.items() for isin in scheme['isins']}
+        self.name_index = {scheme['name'].lower(): code for code, scheme in self.schemes.items()}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def nav_on(self, codes, date):
+        """Latest NAV on or before date for every scheme code (NaN/NaT where none)"""
+        codes = np.atleast_1d(np.asarray(codes, dtype=np.int64))
+        if not len(self.keys):
+            return NavQuote(np.full(len(codes), np.nan), np.full(len(codes), np.datetime64('NaT'), dtype='datetime64[D]'))
+        targets = pack_keys(codes, to_days(date))
+        # Sorted needles walk the key column in order instead of jumping around the mmap
+        order = np.argsort(targets)
+        positions = np.empty(len(targets), dtype=np.int64)
+        positions[order] = np.searchsorted(self.keys, targets[order], side='right') - 1
+        keys = self.keys[np.maximum(positions, 0)]
+        found = (positions >= 0) & (codes >= 0) & ((keys >> DAY_BITS) == codes)
+        navs = np.where(found, self.navs[np.maximum(positions, 0)], np.nan)
+        dates = np.where(found, (keys & DAY_MASK).astype('datetime64[D]'), np.datetime64('NaT'))
+        return NavQuote(navs, dates)
+
+    def history(self, code, start=None, end=None):
+        """(dates, navs) for one scheme between start and end inclusive"""
+        low = pack_keys(code, 0 if start is None else to_days(start))
+        high = pack_keys(code, DAY_MASK if end is None else to_days(end))
+        lo = np.searchsorted(self.keys, low, side='left')
+        hi = np.searchsorted(self.keys, high, side='right')
+        dates = (np.asarray(self.keys[lo:hi]) & DAY_MASK).astype('datetime64[D]')
+        return dates, np.asarray(self.navs[lo:hi])
+
+    def scheme_codes(self, holdings):
+        """Scheme code per holding via scheme_code, ISIN or exact scheme name; -1 if unmatched"""
+        codes = []
+        for holding in holdings:
+            code = holding.get('scheme_code')
+            if code is None or pd.isna(code):
+                code = self.isin_index.get(holding.get('isin'))
+            if code is None:
+                code = self.name_index.get(str(holding.get('name', '')).strip().lower())
+            codes.append(-1 if code is None else int(code))
+        return np.array(codes, dtype=np.int64)
+
+
+def revalue_holdings(store, holdings, date):
+    """Holdings as a DataFrame with nav, nav_date and value at the given date.
+
+    Holdings without a quantity or a matching scheme keep their stored amount.
+    """
+    frame = pd.DataFrame(holdings)
+    if frame.empty:
+        return frame
+    quote = store.nav_on(store.scheme_codes(holdings), date)
+    quantity = pd.to_numeric(frame.get('quantity', pd.Series(np.nan, index=frame.index)), errors='coerce').to_numpy()
+    priced = ~np.isnan(quote.nav) & ~np.isnan(quantity)
+    frame['nav'] = quote.nav
+    frame['nav_date'] = quote.date
+    frame['value'] = np.where(priced, quantity * quote.nav, frame['amount'].to_numpy(dtype=float))
+    return frame
+
+
+# --- Ingest ---
+def publish(store_dir, keys, navs, schemes):
+    """Write the columns into a new version directory and point CURRENT at it; returns the version name.
+
+    Only the previous version is kept, for readers that opened the pointer
+    just before the swap; older versions and pre-versioning files are removed.
+    """
+    if len(keys) != len(navs):
+        raise ValueError(f"{len(keys):,} keys but {len(navs):,} NAVs")
+    os.makedirs(store_dir, exist_ok=True)
+    previous = _current_version(store_dir)
+    version = f"{VERSION_PREFIX}{time.time_ns()}"
+    version_dir = os.path.join(store_dir, version)
+    os.makedirs(version_dir)
+    np.save(os.path.join(version_dir, 'keys.npy'), keys)
+    np.save(os.path.join(version_dir, 'navs.npy'), navs)
+    with open(os.path.join(version_dir, 'schemes.json'), 'w') as f:
+        json.dump({str(code): scheme for code, scheme in schemes.items()}, f)
+
+    pointer = os.path.join(store_dir, CURRENT_FILE)
+    with open(pointer + '.tmp', 'w') as f:
+        f.write(version)
+    os.replace(pointer + '.tmp', pointer)
+
+    for name in os.listdir(store_dir):
+        path = os.path.join(store_dir, name)
+        if name.startswith(VERSION_PREFIX) and name not in (version, previous) and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif previous is None and name in STORE_FILES:
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # still mapped by a reader on Windows; unused once CURRENT exists
+    return version
+
+
+def ingest(paths, store_dir=NAV_STORE_DIR):
+    """Merge AMFI files into the store; later files win for duplicate (code, date) rows"""
+    existing = NavStore(store_dir)
+    new = pd.concat([parse_nav_file(path) for path in paths], ignore_index=True)
+
+    keys = np.concatenate([np.asarray(existing.keys), pack_keys(new['code'], new['day'])])
+    navs = np.concatenate([np.asarray(existing.navs), new['nav'].to_numpy(dtype=np.float64)])
+    order = np.argsort(keys, kind='stable')
+    keys, navs = keys[order], navs[order]
+    # Keep the last occurrence of each key, i.e. the most recently ingested row
+    last = np.ones(len(keys), dtype=bool)
+    last[:-1] = keys[:-1] != keys[1:]
+    keys, navs = keys[last], navs[last]
+
+    schemes = dict(existing.schemes)
+    isin_columns = [column for column in new.columns if column.startswith('isin_')]
+    for row in new.drop_duplicates('code', keep='last').itertuples(index=False):
+        row = row._asdict()
+        isins = {str(row[c]).strip() for c in isin_columns if isinstance(row[c], str)} - {'', '-'}
+        known = schemes.get(row['code'], {}).get('isins', [])
+        schemes[int(row['code'])] = {'name': row['name'], 'isins': sorted(isins.union(known))}
+
+    # Release the memory maps before older versions are pruned
+    del existing
+    publish(store_dir, keys, navs, schemes)
+    return {'rows_ingested': len(new), 'rows': len(keys), 'schemes': len(schemes)}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Manage the offline NAV history store')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    ingest_parser = subparsers.add_parser('ingest', help='Load NAVAll.txt / NAV history files into the store')
+    ingest_parser.add_argument('paths', nargs='+')
+    ingest_parser.add_argument('--store-dir', default=NAV_STORE_DIR)
+    args = parser.parse_args()
+
+    if args.command == 'ingest':
+        start = time.perf_counter()
+        result = ingest(args.paths, args.store_dir)
+        print(f"Ingested {result['rows_ingested']:,} rows in {time.perf_counter() - start:.1f}s; "
+              f"store now holds {result['rows']:,} rows for {result['schemes']:,} schemes")
@@ -0,0 +1,144 @@
+"""Risk-tolerance model, goal probabilities and recommendations"""
+from collections import namedtuple
+
+import numpy as np
+
+from core.financial_metrics import dining_ratio, financial_metrics
+from core.montecarlo import simulate_goals
+from core.risk_model import BAND_UPPER_SCORES, RISK_FACTORS, load_risk_model, risk_features
+from core.rules import recommendations
+
+# factors maps each input to its contribution to the score, for explainability
+RiskProfile = namedtuple('RiskProfile', ['profile', 'allocation', 'score', 'explanation', 'factors'])
+
+# (score upper bound, profile, equity allocation, explanation); the last band catches the rest
+RISK_PROFILES = [
+    (BAND_UPPER_SCORES[0], "🛡️ Conservative", 0.3, "Low risk appetite suitable for stable investments like FDs and debt funds"),
+    (BAND_UPPER_SCORES[1], "⚖️ Balanced", 0.5, "Moderate risk with balanced growth approach across equity and debt"),
+    (float('inf'), "🚀 Aggressive", 0.7, "High risk tolerance suitable for equity-heavy portfolios for maximum returns")
+]
+
+
+# Hand-weighted risk score: RISK_FACTORS name -> (scaled input, weight). The scalings take a profile
+# mapping of scalars or of arrays, so score_risk() and core.batch_scoring share this one table.
+RISK_WEIGHTS = {
+    'Income Stability': (lambda p: p['monthly_income'] / 10000, 0.25),
+    'Savings Buffer': (lambda p: p['current_savings'] / 50000, 0.20),
+    'Debt Burden': (lambda p: -(p['total_debt'] / np.maximum(p['monthly_income'], 1)), 0.15),
+    'Investment Experience': (lambda p: p['investment_experience'] * 2, 0.20),
+    'Age Factor': (lambda p: np.minimum(p['age'], 60) / 30, 0.10),
+    'Financial Goals': (lambda p: p['financial_goals'] * 0.5, 0.10)
+}
+
+
+def weighted_risk_factors(profile):
+    """Each factor's contribution to the hand-weighted score, in RISK_FACTORS order"""
+    return [scale(profile) * weight for scale, weight in (RISK_WEIGHTS[name] for name in RISK_FACTORS)]
+
+
+def score_risk(age, monthly_income, current_savings, total_debt, investment_experience, financial_goals=0):
+    """Hand-weighted risk score from the profile inputs; returns a RiskProfile with each factor's contribution"""
+    factors = [float(factor) for factor in weighted_risk_factors({
+        'age': age, 'monthly_income': monthly_income, 'current_savings': current_savings,
+        'total_debt': total_debt, 'investment_experience': investment_experience,
+        'financial_goals': financial_goals})]
+    # Summed left to right, as core.batch_scoring does
+    risk_score = factors[0]
+    for factor in factors[1:]:
+        risk_score = risk_score + factor
+
+    for upper, profile, allocation, explanation in RISK_PROFILES:
+        if risk_score < upper:
+            break
+    return RiskProfile(profile, allocation, risk_score, explanation, dict(zip(RISK_FACTORS, factors)))
+
+
+def predict_risk(age, monthly_income, current_savings, total_debt, investment_experience, financial_goals=0):
+    """Risk profile from the trained model; factors are each input's contribution to the 0-10 score"""
+    prediction = load_risk_model().predict(risk_features(
+        age, monthly_income, current_savings, total_debt, investment_experience, financial_goals))
+    _, profile, allocation, explanation = RISK_PROFILES[prediction.band[0]]
+    return RiskProfile(profile, allocation, float(prediction.score[0]), explanation,
+                       dict(zip(RISK_FACTORS, prediction.contributions[0].tolist())))
+
+
+def financial_recommendations(savings_rate, emergency_months, investment_percentage, dining_ratio, age):
+    """Generate comprehensive financial recommendations"""
+    return recommendations({
+        'savings_rate': savings_rate,
+        'emergency_months': emergency_months,
+        'investment_percentage': investment_percentage,
+        'dining_ratio': dining_ratio,
+        'age': age
+    }, 'app')
+
+
+class MLFinancialPredictor:
+    """Stateless: one instance is shared by every session"""
+    # Paths per goal for interactive pages; the engine itself defaults to 100k
+    simulation_paths = 20_000
+        
+    def predict_risk_tolerance(self, user_data, goals=(), metrics=None):
+        """Trained model's risk tolerance with explainable factors; goals are the saved goals list"""
+        return predict_risk(
+            age=user_data.get('age', 30),
+            monthly_income=user_data.get('monthly_income', 50000),
+            current_savings=user_data.get('current_savings', 100000),
+            total_debt=(metrics or financial_metrics(user_data)).total_liabilities,
+            investment_experience=user_data.get('investment_experience', 2),
+            financial_goals=len(goals)
+        )
+    
+    def simulate_goals(self, goals, user_finances):
+        """Batched Monte Carlo simulation of every goal against the user's savings"""
+        monthly_savings = user_finances.get('monthly_savings')
+        if monthly_savings is None:
+            monthly_savings = user_finances.get('monthly_income', 0) - sum(user_finances.get('expenses', {}).values())
+        return simulate_goals(
+            [goal['amount'] for goal in goals],
+            [goal['years'] for goal in goals],
+            [goal.get('return', 8) for goal in goals],
+            max(monthly_savings, 0),
+            user_finances.get('current_savings', 0),
+            n_paths=self.simulation_paths
+        )
+    
+    def predict_goals_success_probability(self, goals, user_finances):
+        """Monte Carlo success probability, confidence and color for each goal"""
+        if not goals:
+            return []
+        simulation = self.simulate_goals(goals, user_finances)
+        return [(probability,) + self.describe_confidence(probability) for probability in simulation.probability]
+    
+    def predict_goal_success_probability(self, goal, user_finances):
+        """Monte Carlo success probability for a single goal"""
+        return self.predict_goals_success_probability([goal], user_finances)[0]
+    
+    def describe_confidence(self, final_probability):
+        """Confidence message and color for a success probability"""
+        if final_probability >= 0.8:
+            confidence = "🎯 High confidence - You're on track to achieve this goal!"
+            color = "#10b981"
+        elif final_probability >= 0.6:
+            confidence = "✅ Moderate confidence - Minor adjustments may be needed"
+            color = "#f59e0b"
+        elif final_probability >= 0.4:
+            confidence = "⚠️ Low confidence - Consider increasing savings or extending timeline"
+            color = "#f97316"
+        else:
+            confidence = "🚨 Very low confidence - Goal may be unrealistic with current approach"
+            color = "#ef4444"
+            
+        return confidence, color
+
+    def get_financial_recommendations(self, user_data, metrics=None):
+        """Generate comprehensive financial recommendations from the snapshot's FinancialMetrics"""
+        metrics = metrics or financial_metrics(user_data)
+        dining = user_data.get('expenses', {}).get('Dining & Entertainment', 0)
+        return financial_recommendations(
+            savings_rate=metrics.savings_rate,
+            emergency_months=metrics.emergency_months,
+            investment_percentage=metrics.investment_percentage,
+            dining_ratio=dining_ratio(dining, metrics.total_expenses),
+            age=user_data.get('age', 30)
+        )
@@ -0,0 +1,265 @@
+"""Array-native SIP and lump-sum projections.
+
+Every function accepts scalars or NumPy arrays for amount, horizon and rate and
+broadcasts them against each other, so one call can project a single SIP or
+millions of (amount, years, return) combinations.
+
+cash_flow_projection() is the month-by-month mode for plans that are not a
+constant SIP: annual step-up, lump-sum top-ups, paused months and
+inflation-indexed targets. With G_t the cumulative product of (1 + r) and c_t
+the contribution at the end of month t, the balance is
+
+    B_t = G_t * (initial + sum_{s<=t} c_s / G_s)
+
+so every plan's full path is one cumprod and one cumsum, with no loop over
+months.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+Projection = namedtuple('Projection', ['future_value', 'total_invested', 'profit'])
+
+CashFlows = namedtuple('CashFlows', [
+    'month',         # (months,) 1..longest horizon
+    'contribution',  # (plans, months) SIP plus top-ups paid at the end of each month; 0 once a plan ends
+    'invested',      # (plans, months) initial amount plus contributions so far; NaN once a plan ends
+    'balance',       # (plans, months) nominal value at the end of each month; NaN once a plan ends
+    'real_value',    # (plans, months) balance in today's money
+    'target'         # (plans,) target indexed to each plan's horizon; NaN without a target
+])
+
+
+def _months(years):
+    return np.floor(np.asarray(years, dtype=float) * 12)
+
+
+def _monthly_rate(annual_return):
+    return np.asarray(annual_return, dtype=float) / 100 / 12
+
+
+def growth_factor(rate, periods):
+    """(1 + rate) ** periods, computed as exp(periods * log1p(rate))"""
+    return np.exp(periods * np.log1p(rate))
+
+
+def annuity_factor(rate, periods):
+    """((1 + rate) ** periods - 1) / rate, stable as rate -> 0 (limit: periods)"""
+    rate = np.asarray(rate, dtype=float)
+    periods = np.asarray(periods, dtype=float)
+    zero = rate == 0
+    safe_rate = np.where(zero, 1.0, rate)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = np.expm1(periods * np.log1p(safe_rate)) / safe_rate
+    return np.where(zero, periods, factor)
+
+
+def _unwrap(values):
+    """Hand back plain floats when every input was a scalar"""
+    return tuple(v.item() if v.ndim == 0 else v for v in values)
+
+
+def sip_projection(monthly_investment, years, expected_return):
+    """Future value, total invested and profit of a monthly SIP"""
+    amount = np.asarray(monthly_investment, dtype=float)
+    months = _months(years)
+    future_value = amount * annuity_factor(_monthly_rate(expected_return), months)
+    total_invested = amount * months
+    return Projection(*_unwrap(np.broadcast_arrays(future_value, total_invested, future_value - total_invested)))
+
+
+# Name the app's SIP calculator has always used
+investment_projection_calculator = sip_projection
+
+
+def lumpsum_projection(amount, years, annual_return):
+    """Future value, invested amount and profit of a one-time investment compounded annually"""
+    amount = np.asarray(amount, dtype=float)
+    rate = np.asarray(annual_return, dtype=float) / 100
+    future_value = amount * growth_factor(rate, np.asarray(years, dtype=float))
+    total_invested = amount * np.ones_like(future_value)
+    return Projection(*_unwrap(np.broadcast_arrays(future_value, total_invested, future_value - total_invested)))
+
+
+def required_sip(target_amount, years, expected_return):
+    """Monthly SIP needed to reach target_amount after years at expected_return"""
+    target = np.asarray(target_amount, dtype=float)
+    months = np.maximum(_months(years), 1)
+    sip = target / annuity_factor(_monthly_rate(expected_return), months)
+    return sip.item() if sip.ndim == 0 else sip
+
+
+def step_up_sip_factor(rate, years, step_up):
+    """Corpus per rupee of starting SIP when the SIP rises by step_up at the start of every year.
+
+    With R = (1 + rate) ** 12 and q = 1 + step_up, Y whole years contribute
+    annuity_factor(rate, 12) * (R ** Y - q ** Y) / (R - q) (limit Y * R ** (Y - 1)
+    as q -> R), and a final part-year of m months adds q ** Y * annuity_factor(rate, m).
+    """
+    rate = np.asarray(rate, dtype=float)
+    step_up = np.asarray(step_up, dtype=float)
+    months = _months(years)
+    whole_years, part_months = np.floor_divide(months, 12), np.remainder(months, 12)
+    annual_growth, step = growth_factor(rate, 12), 1 + step_up
+    gap = annual_growth - step
+    level = np.isclose(gap, 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        series = np.where(level, whole_years * annual_growth ** (whole_years - 1),
+                          (annual_growth ** whole_years - step ** whole_years) / np.where(level, 1.0, gap))
+    return (annuity_factor(rate, 12) * series * growth_factor(rate, part_months)
+            + step ** whole_years * annuity_factor(rate, part_months))
+
+
+def _monthly_schedule(spec, plans, horizon, dtype):
+    """(plans, horizon) array from None, a {month: value} dict, (first, last) month ranges or an array"""
+    schedule = np.zeros((plans, horizon), dtype=dtype)
+    if spec is None:
+        return schedule
+    if isinstance(spec, dict):
+        for month, value in spec.items():
+            if 1 <= month <= horizon:
+                schedule[:, month - 1] = value
+    elif dtype == bool and not isinstance(spec, np.ndarray):
+        for first, last in spec:
+            schedule[:, max(first, 1) - 1:last] = True
+    else:
+        schedule[:] = np.asarray(spec, dtype=dtype)[..., :horizon]
+    return schedule
+
+
+def cash_flow_projection(monthly_investment, years, expected_return, step_up=0, inflation=0,
+                         initial=0, top_ups=None, pauses=None, target=np.nan):
+    """Month-by-month contributions, balance and real value of one or many SIP plans.
+
+    step_up and inflation are annual percentages: the SIP rises by step_up at
+    the start of every plan year and real values are deflated by inflation.
+    top_ups maps month -> extra lump sum (or is a (plans, months) array);
+    pauses is a list of (first, last) month ranges without the SIP (or a
+    boolean array). target is in today's money and is indexed to the horizon.
+    """
+    sip, months, rate, step, inflation, initial, target = (np.atleast_1d(v) for v in np.broadcast_arrays(
+        np.asarray(monthly_investment, dtype=float), np.maximum(_months(years), 1), _monthly_rate(expected_return),
+        np.asarray(step_up, dtype=float) / 100, np.asarray(inflation, dtype=float) / 100,
+        np.asarray(initial, dtype=float), np.asarray(target, dtype=float)))
+    plans, horizon = len(sip), int(months.max())
+    month = np.arange(1, horizon + 1)
+    live = month <= months[:, None]
+
+    paused = _monthly_schedule(pauses, plans, horizon, bool)
+    stepped = sip[:, None] * np.cumprod(np.where(month % 12 == 1, 1 + step[:, None], 1.0), axis=1) / (1 + step[:, None])
+    contribution = np.where(live & ~paused, stepped, 0.0) + np.where(live, _monthly_schedule(top_ups, plans, horizon, float), 0.0)
+
+    growth = np.cumprod(np.broadcast_to(1 + rate[:, None], (plans, horizon)), axis=1)
+    balance = growth * (initial[:, None] + np.cumsum(contribution / growth, axis=1))
+    invested = initial[:, None] + np.cumsum(contribution, axis=1)
+    price_level = np.cumprod(np.broadcast_to((1 + inflation[:, None]) ** (1 / 12), (plans, horizon)), axis=1)
+    balance[~live] = np.nan
+    invested[~live] = np.nan
+    return CashFlows(month, contribution, invested, balance, balance / price_level,
+                     target * (1 + inflation) ** (months / 12))
+
+
+def final_values(series, years):
+    """Each plan's last value before its horizon from a (plans, months) CashFlows array"""
+    months = np.broadcast_to(np.maximum(_months(years), 1).astype(int), series.shape[:1])
+    return series[np.arange(series.shape[0]), months - 1]
+
+
+def required_plan_sip(target_amount, years, expected_return, step_up=0, inflation=0, initial=0):
+    """Starting monthly SIP that reaches a target in today's money with annual step-up and inflation"""
+    unit = cash_flow_projection(1.0, years, expected_return, step_up, inflation, target=target_amount)
+    lump = cash_flow_projection(0.0, years, expected_return, initial=initial)
+    needed = unit.target - final_values(lump.balance, years)
+    sip = np.maximum(needed, 0) / final_values(unit.balance, years)
+    return sip.item() if np.ndim(target_amount) == np.ndim(years) == np.ndim(expected_return) == 0 else sip
+
+
+# --- Inverse Solvers ---
+# Each takes the goal's target plus all but one of (monthly SIP, years, return,
+# initial corpus) and broadcasts like the forward projections.
+Solution = namedtuple('Solution', ['value', 'iterations', 'converged', 'residual'])
+
+# Monthly-rate bracket for the return solver: about -60% to +240% a year
+RATE_BRACKET = (-0.05, 0.2)
+
+
+def _balance(initial, sip, rate, months):
+    """Corpus after months from an initial amount and an end-of-month SIP"""
+    return initial * growth_factor(rate, months) + sip * annuity_factor(rate, months)
+
+
+def required_years(target_amount, monthly_investment, expected_return, initial=0):
+    """Years until the corpus reaches target_amount, rounded up to whole months; inf if it never does.
+
+    From target = P * G + S * (G - 1) / r with G = (1 + r) ** n:
+    G = (target * r + S) / (P * r + S), so n = log(G) / log1p(r) (n = (target - P) / S at r = 0).
+    """
+    target, sip, rate, initial = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (
+        target_amount, monthly_investment, _monthly_rate(expected_return), initial)))
+    zero = rate == 0
+    safe_rate = np.where(zero, 1.0, rate)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth_needed = (target * safe_rate + sip) / (initial * safe_rate + sip)
+        months = np.where(zero, (target - initial) / sip, np.log(growth_needed) / np.log1p(safe_rate))
+    months = np.where(np.isfinite(months) & (months >= 0), np.ceil(months - 1e-9), np.inf)
+    months = np.where(target <= initial, 0.0, months)
+    years = months / 12
+    return years.item() if years.ndim == 0 else years
+
+
+def required_lumpsum(target_amount, monthly_investment, years, expected_return):
+    """Corpus needed today, alongside the SIP, to reach target_amount after years"""
+    months = _months(years)
+    rate = _monthly_rate(expected_return)
+    shortfall = np.asarray(target_amount, dtype=float) - np.asarray(monthly_investment, dtype=float) * annuity_factor(rate, months)
+    lumpsum = np.maximum(shortfall, 0) / growth_factor(rate, months)
+    return lumpsum.item() if lumpsum.ndim == 0 else lumpsum
+
+
+def required_return(target_amount, monthly_investment, years, initial=0, tol=1e-6, max_iter=100):
+    """Annual return (%) at which the SIP and initial corpus reach target_amount: safeguarded Newton.
+
+    The corpus is increasing in the rate, so every element keeps a bracket
+    [lo, hi] around its root and a Newton step that leaves the bracket is
+    replaced by bisection. Elements drop out of the iteration once the corpus
+    is within tol * target. Returns a Solution whose value is NaN
+    where the target is out of reach inside RATE_BRACKET.
+    """
+    target, sip, months, initial = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (
+        target_amount, monthly_investment, _months(years), initial)))
+    lo = np.full(target.shape, RATE_BRACKET[0])
+    hi = np.full(target.shape, RATE_BRACKET[1])
+    f_lo = _balance(initial, sip, lo, months) - target
+    f_hi = _balance(initial, sip, hi, months) - target
+    solvable = (f_lo <= 0) & (f_hi >= 0)
+    rate = np.where(solvable, 0.01, np.nan)
+    iterations = np.zeros(target.shape, dtype=int)
+    tolerance = tol * np.maximum(np.abs(target), 1)
+    step = 1e-7
+
+    # Only the elements still searching are carried into the next iteration
+    idx = np.flatnonzero(solvable)
+    for _ in range(max_iter):
+        t, s, m, p, r = target.flat[idx], sip.flat[idx], months.flat[idx], initial.flat[idx], rate.flat[idx]
+        value = _balance(p, s, r, m) - t
+        searching = np.abs(value) > tolerance.flat[idx]
+        idx, t, s, m, p, r, value = (a[searching] for a in (idx, t, s, m, p, r, value))
+        if not len(idx):
+            break
+        iterations.flat[idx] += 1
+        lo.flat[idx] = np.where(value < 0, r, lo.flat[idx])
+        hi.flat[idx] = np.where(value > 0, r, hi.flat[idx])
+        # Central difference: exact enough for Newton and free of the r -> 0 singularity
+        slope = (_balance(p, s, r + step, m) - _balance(p, s, r - step, m)) / (2 * step)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = r - value / slope
+        inside = (newton > lo.flat[idx]) & (newton < hi.flat[idx]) & np.isfinite(newton)
+        rate.flat[idx] = np.where(inside, newton, (lo.flat[idx] + hi.flat[idx]) / 2)
+
+    value = _balance(initial, sip, rate, months) - target
+    residual = np.where(solvable, value, np.nan)
+    converged = solvable & (np.abs(value) <= tolerance)
+    annual = rate * 12 * 100
+    unwrap = target.ndim == 0
+    return Solution(annual.item() if unwrap else annual, iterations.item() if unwrap else iterations,
+                    converged.item() if unwrap else converged, residual.item() if unwrap else residual)
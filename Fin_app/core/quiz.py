@@ -0,0 +1,221 @@
+"""Behavioural finance quiz: questions, scoring and investor profiles"""
+
+
+class FinancialBehaviorQuiz:
+    def __init__(self):
+        self.questions = [
+            {
+                'id': 1,
+                'question': '💰 How do you react when the stock market drops by 20% in a short period?',
+                'options': [
+                    {'text': 'Sell everything immediately to prevent further losses', 'score': 1, 'type': 'risk_aversion'},
+                    {'text': 'Hold my investments and wait for recovery', 'score': 3, 'type': 'patience'},
+                    {'text': 'Review my portfolio but maintain my strategy', 'score': 5, 'type': 'discipline'},
+                    {'text': 'Buy more stocks at discounted prices', 'score': 7, 'type': 'opportunistic'}
+                ]
+            },
+            {
+                'id': 2,
+                'question': '📈 What is your primary investment goal?',
+                'options': [
+                    {'text': 'Capital preservation and safety of principal', 'score': 2, 'type': 'conservative'},
+                    {'text': 'Steady growth with minimal volatility', 'score': 4, 'type': 'moderate'},
+                    {'text': 'Balanced growth with some risk for better returns', 'score': 6, 'type': 'balanced'},
+                    {'text': 'Maximum growth potential, accepting higher volatility', 'score': 8, 'type': 'aggressive'}
+                ]
+            },
+            {
+                'id': 3,
+                'question': '⏰ What is your preferred investment time horizon?',
+                'options': [
+                    {'text': 'Short-term (1-2 years) for specific goals', 'score': 2, 'type': 'short_term'},
+                    {'text': 'Medium-term (3-5 years) for planned expenses', 'score': 4, 'type': 'medium_term'},
+                    {'text': 'Long-term (5-10 years) for wealth building', 'score': 6, 'type': 'long_term'},
+                    {'text': 'Very long-term (10+ years) for retirement', 'score': 8, 'type': 'retirement'}
+                ]
+            },
+            {
+                'id': 4,
+                'question': '🎯 How much volatility can you tolerate in your portfolio?',
+                'options': [
+                    {'text': 'Minimal - I prefer stable, predictable returns', 'score': 1, 'type': 'low_volatility'},
+                    {'text': 'Low - Small fluctuations are acceptable', 'score': 3, 'type': 'moderate_volatility'},
+                    {'text': 'Moderate - I can handle typical market swings', 'score': 5, 'type': 'medium_volatility'},
+                    {'text': 'High - I can withstand significant ups and downs', 'score': 7, 'type': 'high_volatility'}
+                ]
+            },
+            {
+                'id': 5,
+                'question': '📊 How experienced are you with investing?',
+                'options': [
+                    {'text': 'Beginner - Just starting to learn about investing', 'score': 2, 'type': 'novice'},
+                    {'text': 'Some experience - Have made a few investments', 'score': 4, 'type': 'intermediate'},
+                    {'text': 'Experienced - Regular investor with good knowledge', 'score': 6, 'type': 'experienced'},
+                    {'text': 'Expert - Extensive experience and advanced knowledge', 'score': 8, 'type': 'expert'}
+                ]
+            },
+            {
+                'id': 6,
+                'question': '💸 What percentage of your income are you comfortable investing?',
+                'options': [
+                    {'text': 'Less than 10% - Prefer to keep most cash available', 'score': 2, 'type': 'low_investment'},
+                    {'text': '10-20% - Regular savings with some investment', 'score': 4, 'type': 'moderate_investment'},
+                    {'text': '20-30% - Significant portion for wealth building', 'score': 6, 'type': 'high_investment'},
+                    {'text': 'Over 30% - Maximum allocation for growth', 'score': 8, 'type': 'aggressive_investment'}
+                ]
+            },
+            {
+                'id': 7,
+                'question': '🛡️ How important is having an emergency fund to you?',
+                'options': [
+                    {'text': 'Extremely important - 6+ months of expenses', 'score': 2, 'type': 'conservative_safety'},
+                    {'text': 'Very important - 3-6 months of expenses', 'score': 4, 'type': 'moderate_safety'},
+                    {'text': 'Somewhat important - 1-3 months of expenses', 'score': 6, 'type': 'balanced_safety'},
+                    {'text': 'Minimal - Prefer to invest most available funds', 'score': 8, 'type': 'aggressive_safety'}
+                ]
+            },
+            {
+                'id': 8,
+                'question': '🎲 How do you approach financial decisions?',
+                'options': [
+                    {'text': 'Very cautious - Extensive research before any decision', 'score': 2, 'type': 'cautious'},
+                    {'text': 'Careful - Research and consult before deciding', 'score': 4, 'type': 'deliberate'},
+                    {'text': 'Balanced - Research but willing to take calculated risks', 'score': 6, 'type': 'calculated'},
+                    {'text': 'Opportunistic - Quick to act on good opportunities', 'score': 8, 'type': 'opportunistic'}
+                ]
+            }
+        ]
+    
+    def calculate_personality(self, answers):
+        """Calculate investment personality based on quiz answers"""
+        total_score = sum(answers.values())
+        max_score = len(self.questions) * 8
+        
+        score_percentage = (total_score / max_score) * 100
+        
+        if score_percentage <= 30:
+            personality = "🛡️ Conservative Defender"
+            risk_level = "Low"
+            description = "You prioritize capital preservation and prefer stable, low-risk investments. Safety is your top concern with focus on guaranteed returns."
+            color = "#3b82f6"
+        elif score_percentage <= 50:
+            personality = "📊 Cautious Planner"
+            risk_level = "Low to Moderate"
+            description = "You prefer steady growth with minimal risk, balancing safety with some growth opportunities through diversified approach."
+            color = "#f59e0b"
+        elif score_percentage <= 70:
+            personality = "⚖️ Balanced Grower"
+            risk_level = "Moderate"
+            description = "You seek balanced growth through diversified investments, accepting moderate risk for better returns with systematic approach."
+            color = "#22c55e"
+        else:
+            personality = "🚀 Aggressive Builder"
+            risk_level = "High"
+            description = "You're comfortable with significant risk and volatility in pursuit of maximum growth potential through equity-focused investments."
+            color = "#ef4444"
+        
+        return {
+            'personality': personality,
+            'risk_level': risk_level,
+            'score': total_score,
+            'score_percentage': score_percentage,
+            'description': description,
+            'color': color
+        }
+    
+    def get_recommendations(self, personality_result):
+        """Get personalized investment recommendations based on personality"""
+        personality = personality_result['personality']
+        
+        if "Conservative" in personality:
+            return {
+                'asset_allocation': {
+                    'Debt Funds & FDs': '60-70%',
+                    'Large Cap Equity': '20-25%',
+                    'Gold': '5-10%',
+                    'Cash': '5%'
+                },
+                'recommended_funds': [
+                    'ICICI Prudential Corporate Bond Fund',
+                    'HDFC Short Term Debt Fund',
+                    'SBI Magnum Gilt Fund',
+                    'Axis Bluechip Fund'
+                ],
+                'strategy': 'Focus on capital preservation with stable returns. Ideal for short-term goals and low-risk tolerance.',
+                'suggestions': [
+                    'Build a strong emergency fund (6+ months)',
+                    'Prioritize debt instruments and fixed deposits',
+                    'Consider tax-saving fixed deposits',
+                    'Start with small SIPs in large cap funds'
+                ],
+                'risk_notes': 'Your portfolio will have minimal volatility with focus on capital protection.'
+            }
+        elif "Cautious" in personality:
+            return {
+                'asset_allocation': {
+                    'Debt Funds': '50-60%',
+                    'Large Cap Equity': '30-35%',
+                    'Gold': '5%',
+                    'Mid Cap Equity': '5-10%'
+                },
+                'recommended_funds': [
+                    'Mirae Asset Large Cap Fund',
+                    'Kotak Corporate Bond Fund',
+                    'Axis Midcap Fund',
+                    'SBI Gold Fund'
+                ],
+                'strategy': 'Balanced approach with focus on steady growth while managing risk effectively.',
+                'suggestions': [
+                    'Maintain 4-6 months emergency fund',
+                    'Systematic Investment Plans (SIPs) in diversified funds',
+                    'Consider balanced advantage funds',
+                    'Regular portfolio reviews every 6 months'
+                ],
+                'risk_notes': 'Moderate growth with controlled risk exposure.'
+            }
+        elif "Balanced" in personality:
+            return {
+                'asset_allocation': {
+                    'Equity Funds': '60-70%',
+                    'Debt Funds': '20-25%',
+                    'Gold': '5%',
+                    'International Funds': '5-10%'
+                },
+                'recommended_funds': [
+                    'Parag Parikh Flexi Cap Fund',
+                    'ICICI Prudential Bluechip Fund',
+                    'Kotak Emerging Equity Fund',
+                    'Motilal Oswal NASDAQ 100 ETF'
+                ],
+                'strategy': 'Growth-oriented approach with diversified portfolio across market caps and asset classes.',
+                'suggestions': [
+                    '3-4 months emergency fund sufficient',
+                    'Aggressive SIPs for long-term goals',
+                    'Consider sectoral funds for diversification',
+                    'Regular rebalancing of portfolio annually'
+                ],
+                'risk_notes': 'Balanced risk-reward ratio for optimal growth.'
+            }
+        else:  # Aggressive
+            return {
+                'asset_allocation': {
+                    'Equity Funds': '75-85%',
+                    'Debt Funds': '10-15%',
+                    'Small Cap Funds': '5-10%',
+                    'International Funds': '5%'
+                },
+                'recommended_funds': [
+                    'SBI Small Cap Fund',
+                    'Axis Small Cap Fund',
+                    'Mirae Asset Emerging Bluechip Fund',
+                    'PGIM India Midcap Opportunities Fund'
+                ],
+                'strategy': 'Maximum growth focus with high equity exposure, suitable for long-term wealth creation.',
+                'suggestions': [
+                    '2-3 months emergency fund adequate',
+                    'Direct equity investments can be considered',
+                    'Sector rotation strategies',
+                    'Systematic Transfer Plans for lump sum investments'
+                ],
+                'risk_notes': 'High growth potential with significant volatility exposure.'
+            }
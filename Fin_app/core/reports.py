@@ -0,0 +1,226 @@
+"""PDF report generation for a user's snapshot, goals and portfolio"""
+from datetime import datetime
+from io import BytesIO
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from core.financial_metrics import financial_metrics
+from core.projection import required_sip
+from core.rules import recommendations, rule_inputs
+
+
+class PDFReportGenerator:
+    def __init__(self):
+        # Stylesheet and custom styles are built once and reused for every report
+        self.styles = getSampleStyleSheet()
+        self.title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=self.styles['Heading1'],
+            fontSize=18,
+            textColor=colors.HexColor('#1e293b'),
+            spaceAfter=30,
+            alignment=1
+        )
+        
+        self.heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=self.styles['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor('#374151'),
+            spaceAfter=12
+        )
+        
+        self.normal_style = ParagraphStyle(
+            'CustomNormal',
+            parent=self.styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#4b5563'),
+            spaceAfter=6
+        )
+        
+    def create_comprehensive_pdf(self, user_data, goals, portfolio, quiz_results=None, ml_insights=None):
+        """Create a comprehensive PDF report with all user details and analysis"""
+        buffer = BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=72, bottomMargin=72)
+        
+        title_style = self.title_style
+        heading_style = self.heading_style
+        normal_style = self.normal_style
+        
+        story = []
+        
+        # Title
+        story.append(Paragraph("AI Financial Advisor - Comprehensive Report", title_style))
+        story.append(Paragraph(f"Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}", normal_style))
+        story.append(Spacer(1, 20))
+        
+        # Executive Summary
+        story.append(Paragraph("Executive Summary", heading_style))
+        metrics = financial_metrics(user_data, goals, portfolio)
+        total_expenses = metrics.total_expenses
+        
+        story.append(Paragraph(f"Financial Health Score: {metrics.health_score}/100", normal_style))
+        story.append(Paragraph(f"Monthly Income: ₹{user_data.get('monthly_income', 0):,}", normal_style))
+        story.append(Paragraph(f"Monthly Savings: ₹{metrics.monthly_savings:,} ({metrics.savings_rate:.1f}%)", normal_style))
+        story.append(Paragraph(f"Total Goals: {len(goals)}", normal_style))
+        story.append(Spacer(1, 15))
+        
+        # Personal Information
+        story.append(Paragraph("Personal Information", heading_style))
+        personal_data = [
+            ['Field', 'Value'],
+            ['Age', str(user_data.get('age', 'Not specified'))],
+            ['Investment Experience', f"{user_data.get('investment_experience', 0)}/5"],
+            ['Monthly Income', f"₹{user_data.get('monthly_income', 0):,}"],
+            ['Current Savings', f"₹{user_data.get('current_savings', 0):,}"],
+            ['Investment Percentage', f"{user_data.get('investment_percentage', 0)}%"]
+        ]
+        
+        personal_table = Table(personal_data, colWidths=[2.5*inch, 2.5*inch])
+        personal_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1'))
+        ]))
+        story.append(personal_table)
+        story.append(Spacer(1, 15))
+        
+        # Expense Analysis
+        story.append(Paragraph("Expense Breakdown", heading_style))
+        expenses = user_data.get('expenses', {})
+        if expenses:
+            expense_data = [['Category', 'Amount (₹)', 'Percentage']]
+            for category, amount in expenses.items():
+                if amount > 0:
+                    percentage = (amount / total_expenses) * 100
+                    expense_data.append([category, f"₹{amount:,}", f"{percentage:.1f}%"])
+            
+            expense_table = Table(expense_data, colWidths=[1.8*inch, 1.5*inch, 1.2*inch])
+            expense_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0fdf4')),
+                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bbf7d0'))
+            ]))
+            story.append(expense_table)
+        story.append(Spacer(1, 15))
+        
+        # Goals Section
+        if goals:
+            story.append(Paragraph("Financial Goals", heading_style))
+            goals_data = [['Goal Name', 'Target Amount', 'Timeline', 'Monthly SIP Required']]
+            sips = required_sip(
+                [goal.get('amount', 0) for goal in goals],
+                [goal.get('years', 1) for goal in goals],
+                [goal.get('return', 8) for goal in goals]
+            )
+            
+            for goal, sip in zip(goals, sips):
+                goals_data.append([
+                    goal.get('name', 'Unnamed'),
+                    f"₹{goal.get('amount', 0):,}",
+                    f"{goal.get('years', 0)} years",
+                    f"₹{sip:,.0f}"
+                ])
+            
+            goals_table = Table(goals_data, colWidths=[1.5*inch, 1.2*inch, 1.0*inch, 1.5*inch])
+            goals_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f59e0b')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#fef3c7')),
+                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fcd34d'))
+            ]))
+            story.append(goals_table)
+            story.append(Spacer(1, 15))
+        
+        # Portfolio Section
+        if portfolio:
+            story.append(Paragraph("Investment Portfolio", heading_style))
+            portfolio_data = [['Holding', 'Category', 'Amount (₹)', 'Percentage']]
+            total_portfolio = metrics.portfolio_total
+            
+            for item in portfolio:
+                percentage = (item['amount'] / total_portfolio) * 100
+                portfolio_data.append([
+                    item.get('name', 'Unnamed'),
+                    item.get('category', 'Other'),
+                    f"₹{item['amount']:,}",
+                    f"{percentage:.1f}%"
+                ])
+            
+            portfolio_table = Table(portfolio_data, colWidths=[1.5*inch, 1.2*inch, 1.2*inch, 1.1*inch])
+            portfolio_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8b5cf6')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#faf5ff')),
+                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ddd6fe'))
+            ]))
+            story.append(portfolio_table)
+            story.append(Spacer(1, 15))
+        
+        # Recommendations Section
+        story.append(Paragraph("AI-Powered Recommendations", heading_style))
+        
+        # Generate recommendations based on user data
+        recommendations = self.generate_recommendations(user_data, goals, portfolio)
+        for i, rec in enumerate(recommendations[:10], 1):
+            story.append(Paragraph(f"{i}. {rec}", normal_style))
+        
+        story.append(Spacer(1, 15))
+        
+        # Quiz Results (if available)
+        if quiz_results:
+            story.append(Paragraph("Behavioral Analysis", heading_style))
+            story.append(Paragraph(f"Investment Personality: {quiz_results.get('personality', 'Not assessed')}", normal_style))
+            story.append(Paragraph(f"Risk Level: {quiz_results.get('risk_level', 'Not assessed')}", normal_style))
+            story.append(Paragraph(f"Personality Score: {quiz_results.get('score', 0)} ({quiz_results.get('score_percentage', 0):.1f}%)", normal_style))
+            story.append(Spacer(1, 10))
+        
+        # ML Insights (if available)
+        if ml_insights:
+            story.append(Paragraph("Machine Learning Insights", heading_style))
+            story.append(Paragraph(f"Risk Profile: {ml_insights.get('risk_profile', 'Not assessed')}", normal_style))
+            story.append(Paragraph(f"Risk Score: {ml_insights.get('risk_score', 0):.1f}/10", normal_style))
+            story.append(Spacer(1, 10))
+        
+        # Action Plan
+        story.append(Paragraph("Recommended Action Plan", heading_style))
+        action_items = [
+            "Review and optimize your expense categories monthly",
+            "Set up automatic SIPs for your financial goals",
+            "Build an emergency fund covering 6 months of expenses",
+            "Diversify your investment portfolio across asset classes",
+            "Regularly review and rebalance your portfolio",
+            "Consider tax-saving investment options",
+            "Monitor your financial health score regularly"
+        ]
+        
+        for item in action_items:
+            story.append(Paragraph(f"• {item}", normal_style))
+        
+        doc.build(story)
+        pdf_data = buffer.getvalue()
+        buffer.close()
+        return pdf_data
+    
+    def calculate_health_score(self, user_data):
+        """Calculate financial health score"""
+        return financial_metrics(user_data).health_score
+    
+    def generate_recommendations(self, user_data, goals, portfolio):
+        """Generate personalized recommendations"""
+        return recommendations(rule_inputs(user_data, goals, portfolio), 'pdf')
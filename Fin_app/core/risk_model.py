@@ -0,0 +1,232 @@
+"""Trained risk-tolerance model: L2-regularised multinomial logistic regression.
+
+Labels are the investor personalities of the behavioural quiz, collapsed onto
+the three risk profiles (Conservative Defender -> Conservative, Cautious
+Planner and Balanced Grower -> Balanced, Aggressive Builder -> Aggressive),
+and the features are the snapshot inputs the hand-weighted score used, one
+per risk factor. Training runs offline on a JSONL of records with a snapshot
+and quiz answers, or on a seeded synthetic client book whose quiz answers are
+drawn from a latent risk appetite; the fitted weights are written to a JSON
+artifact that load_risk_model() reads once per process.
+
+predict() is batched: it takes an (n, features) matrix and returns the
+profile band, class probabilities, a 0-10 risk score (expected profile
+level) and each feature's contribution to that score, measured as the score
+change when the feature is set back to the training mean. The band is read
+off the score with the profile thresholds, so the two always agree.
+
+Run from the Fin_app directory:
+    python -m core.risk_model                       # synthetic client book
+    python -m core.risk_model --source records.jsonl
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+MODEL_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'risk_model.json')
+
+# One feature per risk factor, in display order
+RISK_FACTORS = ['Income Stability', 'Savings Buffer', 'Debt Burden', 'Investment Experience',
+                'Age Factor', 'Financial Goals']
+# Quiz personality keyword -> risk profile band (0 Conservative, 1 Balanced, 2 Aggressive)
+PERSONALITY_BANDS = {'Conservative': 0, 'Cautious': 1, 'Balanced': 1, 'Aggressive': 2}
+N_BANDS = 3
+# Score upper bounds of the Conservative and Balanced bands; Aggressive takes the rest
+BAND_UPPER_SCORES = (3, 7)
+
+RiskPrediction = namedtuple('RiskPrediction', [
+    'band',           # (n,) index into core.predictor.RISK_PROFILES, from the score
+    'probabilities',  # (n, bands)
+    'score',          # (n,) 0-10, ten times the expected band level
+    'contributions'   # (n, features) score change attributable to each feature
+])
+
+
+def risk_features(age, monthly_income, current_savings, total_debt, investment_experience, financial_goals=0):
+    """(n, features) matrix from scalars or arrays of the profile inputs"""
+    income = np.asarray(monthly_income, dtype=np.float64)
+    columns = np.broadcast_arrays(
+        np.log1p(np.maximum(income, 0)),
+        np.log1p(np.maximum(np.asarray(current_savings, dtype=np.float64), 0)),
+        # Debt in years of income, capped so a zero-income row does not dominate the fit
+        np.minimum(np.asarray(total_debt, dtype=np.float64) / np.maximum(income * 12, 1), 20),
+        np.asarray(investment_experience, dtype=np.float64),
+        np.asarray(age, dtype=np.float64),
+        np.asarray(financial_goals, dtype=np.float64)
+    )
+    return np.column_stack([np.atleast_1d(column) for column in columns])
+
+
+def _softmax(logits):
+    logits = logits - logits.max(axis=1, keepdims=True)
+    weights = np.exp(logits)
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+class RiskModel:
+    """Standardised features, a (features, bands) weight matrix and per-band intercepts"""
+
+    def __init__(self, mean, scale, weights, intercept, metadata=None):
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.intercept = np.asarray(intercept, dtype=np.float64)
+        self.metadata = metadata or {}
+        self.levels = np.linspace(0.0, 10.0, self.weights.shape[1])
+
+    @classmethod
+    def fit(cls, features, bands, l2=1e-3, iterations=500, learning_rate=1.0):
+        """Full-batch gradient descent on the mean cross-entropy plus an L2 penalty"""
+        mean, scale = features.mean(axis=0), features.std(axis=0)
+        scale[scale == 0] = 1.0
+        z = (features - mean) / scale
+        targets = np.eye(N_BANDS)[bands]
+        weights = np.zeros((z.shape[1], N_BANDS))
+        intercept = np.zeros(N_BANDS)
+        for _ in range(iterations):
+            error = (_softmax(z @ weights + intercept) - targets) / len(z)
+            weights -= learning_rate * (z.T @ error + l2 * weights)
+            intercept -= learning_rate * error.sum(axis=0)
+        return cls(mean, scale, weights, intercept)
+
+    def probabilities(self, features):
+        return _softmax(((features - self.mean) / self.scale) @ self.weights + self.intercept)
+
+    def predict(self, features):
+        """RiskPrediction for every row of the feature matrix"""
+        z = (features - self.mean) / self.scale
+        logits = z @ self.weights + self.intercept
+        probabilities = _softmax(logits)
+        score = probabilities @ self.levels
+        # Setting feature j to the training mean (z_j = 0) removes z_j * w_j from the logits
+        without = _softmax((logits[:, None, :] - z[:, :, None] * self.weights[None, :, :]).reshape(-1, len(self.levels)))
+        contributions = score[:, None] - (without @ self.levels).reshape(z.shape)
+        band = np.searchsorted(BAND_UPPER_SCORES, score, side='right')
+        return RiskPrediction(band, probabilities, score, contributions)
+
+    def save(self, path=MODEL_FILE):
+        artifact = {
+            'model': 'multinomial_logistic_regression',
+            'features': RISK_FACTORS,
+            'mean': self.mean.tolist(),
+            'scale': self.scale.tolist(),
+            'weights': self.weights.tolist(),
+            'intercept': self.intercept.tolist(),
+            'metadata': self.metadata
+        }
+        with open(path, 'w') as f:
+            json.dump(artifact, f, indent=2)
+
+    @classmethod
+    def load(cls, path=MODEL_FILE):
+        with open(path) as f:
+            artifact = json.load(f)
+        if artifact['features'] != RISK_FACTORS:
+            raise ValueError(f"Risk model at {path} was trained on features {artifact['features']}, expected {RISK_FACTORS}")
+        return cls(artifact['mean'], artifact['scale'], artifact['weights'], artifact['intercept'], artifact['metadata'])
+
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def load_risk_model():
+    """The process-wide model, read from MODEL_FILE on first use"""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                _model = RiskModel.load()
+    return _model
+
+
+# --- Training data ---
+def personality_band(personality):
+    """Risk profile band of a quiz personality such as '📊 Cautious Planner'"""
+    return next(band for keyword, band in PERSONALITY_BANDS.items() if keyword in personality)
+
+
+def synthetic_training_set(size=50_000, seed=7):
+    """Seeded client book: snapshot features and quiz answers driven by a latent risk appetite"""
+    from core.quiz import FinancialBehaviorQuiz
+
+    rng = np.random.default_rng(seed)
+    age = rng.integers(21, 66, size)
+    income = np.round(rng.lognormal(np.log(60_000), 0.7, size), -2)
+    savings = np.round(income * rng.gamma(2.0, 6.0, size), -3)
+    debt = np.round(income * 12 * rng.gamma(1.2, 1.0, size) * (rng.random(size) < 0.6), -3)
+    experience = np.minimum(rng.poisson(np.maximum(age - 21, 0) / 6), 25)
+    goals = rng.integers(0, 6, size)
+    features = risk_features(age, income, savings, debt, experience, goals)
+
+    z = (features - features.mean(axis=0)) / features.std(axis=0)
+    appetite = z @ np.array([0.6, 0.4, -0.5, 0.7, -0.4, 0.2]) + rng.normal(0, 0.8, size)
+
+    quiz = FinancialBehaviorQuiz()
+    option_scores = np.array([[option['score'] for option in question['options']] for question in quiz.questions])
+    choices = np.clip(np.rint(1.5 + 0.9 * appetite[:, None] + rng.normal(0, 0.9, (size, len(quiz.questions)))), 0, 3)
+    answer_scores = option_scores[np.arange(len(quiz.questions)), choices.astype(int)]
+    bands = np.array([personality_band(quiz.calculate_personality(dict(enumerate(row)))['personality'])
+                      for row in answer_scores.tolist()])
+    return features, bands
+
+
+def load_training_records(source):
+    """Features and bands from JSONL records with a snapshot and quiz_answers ({question id: score})"""
+    from core.quiz import FinancialBehaviorQuiz
+
+    quiz = FinancialBehaviorQuiz()
+    rows, bands = [], []
+    with open(source) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            snapshot = record.get('snapshot', {})
+            rows.append((snapshot.get('age', 30), snapshot.get('monthly_income', 0), snapshot.get('current_savings', 0),
+                         sum(snapshot.get('liabilities', {}).values()), snapshot.get('investment_experience', 2),
+                         len(record.get('goals', []))))
+            bands.append(personality_band(quiz.calculate_personality(record['quiz_answers'])['personality']))
+    return risk_features(*np.array(rows, dtype=np.float64).T), np.array(bands)
+
+
+def train(features, bands, holdout=0.2, seed=0):
+    """Fit on a shuffled split and record hold-out accuracy and log loss in the metadata"""
+    order = np.random.default_rng(seed).permutation(len(bands))
+    cut = int(len(order) * (1 - holdout))
+    train_rows, test_rows = order[:cut], order[cut:]
+    start = time.perf_counter()
+    model = RiskModel.fit(features[train_rows], bands[train_rows])
+    fit_seconds = time.perf_counter() - start
+    probabilities = model.probabilities(features[test_rows])
+    model.metadata = {
+        'trained_rows': int(cut),
+        'holdout_rows': int(len(test_rows)),
+        'holdout_accuracy': float((probabilities.argmax(axis=1) == bands[test_rows]).mean()),
+        'holdout_log_loss': float(-np.log(probabilities[np.arange(len(test_rows)), bands[test_rows]] + 1e-12).mean()),
+        'band_counts': np.bincount(bands, minlength=N_BANDS).tolist(),
+        'fit_seconds': round(fit_seconds, 3)
+    }
+    return model
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Train the risk-tolerance model and write its JSON artifact')
+    parser.add_argument('--source', help='JSONL of {snapshot, goals, quiz_answers} records (default: synthetic book)')
+    parser.add_argument('--size', type=int, default=50_000, help='Synthetic profiles when no source is given')
+    parser.add_argument('--out', default=MODEL_FILE, help='Artifact path')
+    args = parser.parse_args()
+
+    features, bands = load_training_records(args.source) if args.source else synthetic_training_set(args.size)
+    model = train(features, bands)
+    model.metadata['source'] = os.path.basename(args.source) if args.source else f'synthetic:{args.size}'
+    model.save(args.out)
+    print(f"Trained on {model.metadata['trained_rows']:,} profiles in {model.metadata['fit_seconds']:.2f}s "
+          f"(bands {model.metadata['band_counts']}) -> {args.out}")
+    print(f"  hold-out accuracy {model.metadata['holdout_accuracy']:.3f}, "
+          f"log loss {model.metadata['holdout_log_loss']:.3f}")
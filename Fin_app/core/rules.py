@@ -0,0 +1,204 @@
+"""Declarative recommendation rules, compiled to vectorised predicates.
+
+Every recommendation the app gives is a Rule: a conjunction of threshold
+conditions over metric fields, a message id, a channel ('financial' or
+'tax') and a priority that orders the output. Each surface (the Dashboard
+and ML Insights cards, the PDF report, the Tax Planner page) phrases the
+message ids it shows from PHRASINGS; ids a surface has no phrasing for are
+not shown there.
+
+RuleEngine compiles the table once: identical conditions shared by several
+rules become one predicate, each predicate is a single NumPy comparison over
+a column, and a rule fires where all of its predicates hold. evaluate()
+therefore scores one user or a million in the same pass and returns a
+(users, rules) boolean matrix that any surface can phrase. recommend() runs
+the same compiled predicates with plain comparisons for a single user.
+"""
+import operator
+from collections import namedtuple
+
+import numpy as np
+
+from core.financial_metrics import dining_ratio, financial_metrics
+
+# each: optional context list; the message is repeated for every item in it
+Rule = namedtuple('Rule', ['id', 'channel', 'priority', 'conditions', 'each'], defaults=(None,))
+RuleResults = namedtuple('RuleResults', ['rules', 'fired'])  # fired: (users, rules) bool
+
+# Condition values are numbers or the name of another field
+OPERATORS = {'<': np.less, '<=': np.less_equal, '>': np.greater, '>=': np.greater_equal, '==': np.equal}
+# Same predicates for a single user, where per-call NumPy overhead would dominate
+SCALAR_OPERATORS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge, '==': operator.eq}
+
+RULES = [
+    # --- Financial ---
+    Rule('savings.low', 'financial', 10, [('savings_rate', '<', 10)]),
+    Rule('savings.fair', 'financial', 10, [('savings_rate', '>=', 10), ('savings_rate', '<', 15)]),
+    Rule('savings.good', 'financial', 10, [('savings_rate', '>=', 15)]),
+    Rule('emergency.low', 'financial', 20, [('emergency_months', '<', 3)]),
+    Rule('emergency.building', 'financial', 20, [('emergency_months', '>=', 3), ('emergency_months', '<', 6)]),
+    Rule('investing.start', 'financial', 30, [('investment_percentage', '<', 10)]),
+    Rule('investing.increase', 'financial', 30, [('investment_percentage', '>=', 10), ('investment_percentage', '<', 20)]),
+    Rule('spending.dining', 'financial', 40, [('dining_ratio', '>', 0.15)]),
+    Rule('goals.prioritise', 'financial', 50, [('goals_count', '>', 0), ('goals_total', '>', 'annual_income')]),
+    Rule('portfolio.diversify', 'financial', 60, [('portfolio_count', '>', 0), ('portfolio_total', '<', 'half_year_income')]),
+    Rule('strategy.equity', 'financial', 70, [('age', '<', 35)]),
+    Rule('strategy.balanced', 'financial', 70, [('age', '>=', 35), ('age', '<', 50)]),
+    Rule('strategy.debt', 'financial', 70, [('age', '>=', 50)]),
+    # --- Tax ---
+    Rule('tax.below_limit', 'tax', 10, [('annual_income', '<=', 700000)]),
+    Rule('tax.elss', 'tax', 10, [('annual_income', '>', 700000), ('annual_income', '<=', 1200000)]),
+    Rule('tax.section_80c', 'tax', 11, [('annual_income', '>', 700000), ('annual_income', '<=', 1200000)]),
+    Rule('tax.nps', 'tax', 10, [('annual_income', '>', 1200000)]),
+    Rule('tax.hra', 'tax', 11, [('annual_income', '>', 1200000)]),
+    Rule('tax.strategy_elss', 'tax', 20, [('age', '<', 40)]),
+    Rule('tax.strategy_balanced', 'tax', 20, [('age', '>=', 40)]),
+    Rule('tax.home_goal', 'tax', 30, [('home_goals', '>', 0)], each='home_goal_names')
+]
+
+# Surface -> message id -> template, formatted with the user's fields ({item} for 'each' rules)
+PHRASINGS = {
+    'app': {
+        'savings.low': "🚨 **Priority**: Increase your savings rate to at least 15-20% for better financial growth",
+        'savings.fair': "📈 **Good Progress**: Consider optimizing expenses to reach 20% savings rate",
+        'savings.good': "🎉 **Excellent**: Maintain your savings discipline for wealth accumulation",
+        'emergency.low': "🛡️ **Priority**: Build emergency fund to cover 3-6 months of essential expenses",
+        'emergency.building': "💰 **Good Start**: Continue building emergency fund to reach 6 months coverage",
+        'investing.start': "📊 **Start Investing**: Begin with systematic investments through SIPs in diversified mutual funds",
+        'investing.increase': "📈 **Increase Investments**: Consider increasing investment allocation to 20% for accelerated wealth creation",
+        'spending.dining': "🍽️ **Spending Alert**: Consider reducing dining expenses which are high at {dining_ratio:.1%} of total",
+        'strategy.equity': "🎯 **Strategy**: Focus on equity-oriented investments for long-term wealth creation",
+        'strategy.balanced': "⚖️ **Strategy**: Maintain balanced portfolio with mix of equity and debt instruments",
+        'strategy.debt': "🛡️ **Strategy**: Consider shifting towards debt-oriented investments for capital preservation"
+    },
+    'pdf': {
+        'savings.low': "Increase your savings rate to at least 15-20% for better financial growth",
+        'savings.fair': "Good savings rate! Consider optimizing expenses to reach 20% savings",
+        'savings.good': "Excellent savings rate! Maintain this discipline for wealth accumulation",
+        'emergency.low': "Build emergency fund to cover 3-6 months of essential expenses",
+        'emergency.building': "Continue building emergency fund to reach 6 months coverage",
+        'investing.start': "Start with systematic investments through SIPs in diversified mutual funds",
+        'investing.increase': "Consider increasing investment allocation to 20% for accelerated wealth creation",
+        'goals.prioritise': "Prioritize your goals and focus on achievable timelines",
+        'portfolio.diversify': "Diversify your portfolio across different asset classes for risk management",
+        'strategy.equity': "Focus on equity-oriented investments for long-term wealth creation",
+        'strategy.balanced': "Maintain balanced portfolio with mix of equity and debt instruments",
+        'strategy.debt': "Consider shifting towards debt-oriented investments for capital preservation"
+    },
+    'tax': {
+        'tax.below_limit': "💡 **Tax Planning**: You're below taxable income limit. Focus on wealth creation rather than tax saving.",
+        'tax.elss': "💡 **Tax Planning**: Consider ELSS funds for tax saving with growth potential and shortest lock-in.",
+        'tax.section_80c': "🏦 **Recommendation**: Allocate ₹1.5L to Section 80C instruments (ELSS, PPF, Insurance Premiums)",
+        'tax.nps': "💡 **Tax Planning**: Maximize all tax-saving avenues including NPS for additional ₹50,000 deduction.",
+        'tax.hra': "🏠 **Recommendation**: If paying rent, claim HRA exemption. Consider home loan for additional benefits.",
+        'tax.strategy_elss': "🎯 **Strategy**: Prefer ELSS over traditional options for better long-term returns despite higher risk.",
+        'tax.strategy_balanced': "🎯 **Strategy**: Balance between ELSS and PPF for tax savings with moderate risk exposure.",
+        'tax.home_goal': "🏠 **Goal Alignment**: Your {item} goal can be optimized with home loan tax benefits (Section 24)"
+    }
+}
+
+
+def rule_inputs(user_data, goals=(), portfolio=(), metrics=None):
+    """Every field the rules read, for one user"""
+    metrics = metrics or financial_metrics(user_data, goals, portfolio)
+    dining = user_data.get('expenses', {}).get('Dining & Entertainment', 0)
+    home_goal_names = [goal['name'] for goal in goals
+                       if 'house' in goal['name'].lower() or 'home' in goal['name'].lower()]
+    return {
+        'savings_rate': metrics.savings_rate,
+        'emergency_months': metrics.emergency_months,
+        'investment_percentage': metrics.investment_percentage,
+        'dining_ratio': dining_ratio(dining, metrics.total_expenses),
+        'age': user_data.get('age', 30),
+        'annual_income': metrics.monthly_income * 12,
+        'half_year_income': metrics.monthly_income * 6,
+        'goals_count': metrics.goals_count,
+        'goals_total': metrics.goals_total,
+        'portfolio_count': len(portfolio),
+        'portfolio_total': metrics.portfolio_total,
+        'home_goals': len(home_goal_names),
+        'home_goal_names': home_goal_names
+    }
+
+
+class RuleEngine:
+    """Rule table compiled into shared predicates; evaluate() works on columns of any length"""
+
+    def __init__(self, rules=RULES, phrasings=PHRASINGS):
+        # Stable sort: rules with equal priority keep their table order
+        self.rules = sorted(rules, key=lambda rule: rule.priority)
+        self.phrasings = phrasings
+        self.predicates = []
+        index = {}
+        self.rule_predicates = []
+        for rule in self.rules:
+            ids = []
+            for condition in rule.conditions:
+                if condition not in index:
+                    index[condition] = len(self.predicates)
+                    self.predicates.append(condition)
+                ids.append(index[condition])
+            self.rule_predicates.append(ids)
+        self.surface_rules = {surface: [r for r, rule in enumerate(self.rules) if rule.id in messages]
+                              for surface, messages in phrasings.items()}
+
+    def evaluate(self, columns, rule_indices=None):
+        """RuleResults for every row of columns (a dict of arrays or a DataFrame)"""
+        rule_indices = range(len(self.rules)) if rule_indices is None else rule_indices
+        needed = sorted({p for r in rule_indices for p in self.rule_predicates[r]})
+        values = {}
+        for p in needed:
+            field, operator, value = self.predicates[p]
+            value = np.asarray(columns[value]) if isinstance(value, str) else value
+            values[p] = OPERATORS[operator](np.asarray(columns[field]), value)
+        fired = np.column_stack([np.logical_and.reduce([values[p] for p in self.rule_predicates[r]])
+                                 for r in rule_indices])
+        return RuleResults([self.rules[r] for r in rule_indices], fired)
+
+    def phrase(self, results, surface, context, row=0):
+        """Messages of the rules fired for one row, in the surface's phrasing"""
+        messages = self.phrasings[surface]
+        phrased = []
+        for rule, fired in zip(results.rules, results.fired[row]):
+            if not fired or rule.id not in messages:
+                continue
+            items = context[rule.each] if rule.each else [None]
+            phrased.extend(messages[rule.id].format(item=item, **context) for item in items)
+        return phrased
+
+    def recommend(self, inputs, surface):
+        """Messages for one user on one surface; only the rules that surface phrases are evaluated"""
+        values = {}
+        messages = self.phrasings[surface]
+        phrased = []
+        for r in self.surface_rules[surface]:
+            for p in self.rule_predicates[r]:
+                if p not in values:
+                    field, operator_name, value = self.predicates[p]
+                    values[p] = SCALAR_OPERATORS[operator_name](
+                        inputs[field], inputs[value] if isinstance(value, str) else value)
+                if not values[p]:
+                    break
+            else:
+                rule = self.rules[r]
+                items = inputs[rule.each] if rule.each else [None]
+                phrased.extend(messages[rule.id].format(item=item, **inputs) for item in items)
+        return phrased
+
+
+_engine = RuleEngine()
+
+
+def recommendations(inputs, surface):
+    """Recommendations for one user's rule_inputs() on a surface ('app', 'pdf' or 'tax')"""
+    return _engine.recommend(inputs, surface)
+
+
+def evaluate_rules(columns):
+    """Every rule over a batch of users; phrase rows with rule_engine().phrase()"""
+    return _engine.evaluate(columns)
+
+
+def rule_engine():
+    """The process-wide compiled engine"""
+    return _engine
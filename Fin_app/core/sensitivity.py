@@ -0,0 +1,76 @@
+"""Sensitivity of a goal's required SIP and a SIP's corpus to return, horizon and step-up.
+
+The grid covers expected returns 4-18% x horizons 1-40 years x annual
+step-ups 0-15%. Corpus per rupee of starting SIP is goal-independent, so it
+is one broadcast step_up_sip_factor() call over a (returns, years, step-ups)
+array; a goal's required SIP or a SIP's corpus is then a single division or
+multiplication over the same array. tornado() ranks the inputs by how far
+moving each one across its range (others held at the base case) moves the
+outcome.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from core.projection import step_up_sip_factor
+
+GRID_RETURNS = np.arange(4, 19)    # % a year
+GRID_YEARS = np.arange(1, 41)
+GRID_STEP_UPS = np.arange(0, 16)   # % a year
+
+SensitivityGrid = namedtuple('SensitivityGrid', ['returns', 'years', 'step_ups', 'values'])  # values: (returns, years, step-ups)
+TornadoBar = namedtuple('TornadoBar', ['input', 'low_input', 'high_input', 'low', 'high', 'swing'])
+
+# Input -> (label, function of the base value giving the (low, high) values tried)
+TORNADO_RANGES = {
+    'expected_return': ('Expected Return (%)', lambda base: (max(base - 3, 0), base + 3)),
+    # +-25% of the horizon, at least a year each way so short horizons still get a bar
+    'years': ('Years', lambda base: (max(base - max(1, round(base * 0.25)), 1), base + max(1, round(base * 0.25)))),
+    'step_up': ('Annual Step-up (%)', lambda base: (max(base - 5, 0), base + 5)),
+    'inflation': ('Inflation (%)', lambda base: (max(base - 2, 0), base + 2))
+}
+
+_factor = None
+
+
+def corpus_factor_grid():
+    """Corpus per rupee of starting SIP over the whole grid, computed once per process"""
+    global _factor
+    if _factor is None:
+        _factor = step_up_sip_factor(GRID_RETURNS[:, None, None] / 100 / 12, GRID_YEARS[None, :, None],
+                                     GRID_STEP_UPS[None, None, :] / 100)
+    return _factor
+
+
+def required_sip_grid(target_amount, inflation=0):
+    """Starting SIP that reaches target_amount (today's money) at every grid point"""
+    indexed = target_amount * (1 + inflation / 100) ** GRID_YEARS[None, :, None]
+    return SensitivityGrid(GRID_RETURNS, GRID_YEARS, GRID_STEP_UPS, indexed / corpus_factor_grid())
+
+
+def corpus_grid(monthly_investment):
+    """Final corpus of a starting SIP at every grid point"""
+    return SensitivityGrid(GRID_RETURNS, GRID_YEARS, GRID_STEP_UPS, monthly_investment * corpus_factor_grid())
+
+
+def goal_required_sip(target_amount, expected_return, years, step_up=0, inflation=0):
+    """Starting SIP for one goal; the outcome the Goals Planner's tornado varies"""
+    indexed = target_amount * (1 + inflation / 100) ** years
+    return indexed / step_up_sip_factor(expected_return / 100 / 12, years, step_up / 100)
+
+
+def sip_corpus(monthly_investment, expected_return, years, step_up=0):
+    """Final corpus of a SIP; the outcome the Investment Center's tornado varies"""
+    return monthly_investment * step_up_sip_factor(expected_return / 100 / 12, years, step_up / 100)
+
+
+def tornado(outcome, base, inputs):
+    """Outcome swing when each input moves across its TORNADO_RANGES range, largest first"""
+    bars = []
+    for name in inputs:
+        label, span = TORNADO_RANGES[name]
+        low_input, high_input = span(base[name])
+        low = float(outcome(**dict(base, **{name: low_input})))
+        high = float(outcome(**dict(base, **{name: high_input})))
+        bars.append(TornadoBar(label, low_input, high_input, low, high, abs(high - low)))
+    return sorted(bars, key=lambda bar: bar.swing, reverse=True)
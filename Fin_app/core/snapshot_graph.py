@@ -0,0 +1,183 @@
+"""Reactive computation graph over the snapshot fields.
+
+Input fields are the values entered in the snapshot form (plus the goals
+list). Derived nodes declare the fields or nodes they read; update() diffs
+the new inputs against the previous ones and invalidates only the nodes
+downstream of what changed, and value() recomputes an invalid node on first
+read. Editing Dining & Entertainment therefore recomputes expenses, savings,
+recommendations and goal probabilities, but not the risk profile or the tax
+recommendations. Each metric is its own node reading exactly the values its
+formula uses (the formulas are shared with derive_metrics), so an edit to the
+investment share touches only the health score and the recommendations.
+"""
+import time
+from collections import namedtuple
+
+from core.financial_metrics import dining_ratio, emergency_months, health_score, monthly_savings, net_worth, savings_rate
+from core.predictor import financial_recommendations, predict_risk
+
+Node = namedtuple('Node', ['name', 'inputs', 'compute'])
+
+# Input field -> path into the snapshot dict, named after the snapshot form's variables
+FIELDS = {
+    'monthly_income': ('monthly_income',),
+    'current_savings': ('current_savings',),
+    'investment_percentage': ('investment_percentage',),
+    'age': ('age',),
+    'investment_experience': ('investment_experience',),
+    'rent_emi': ('expenses', 'Rent/EMI'),
+    'groceries': ('expenses', 'Groceries'),
+    'utilities': ('expenses', 'Utilities'),
+    'transportation': ('expenses', 'Transportation'),
+    'dining_entertainment': ('expenses', 'Dining & Entertainment'),
+    'miscellaneous': ('expenses', 'Miscellaneous'),
+    'cash_balance': ('assets', 'Cash'),
+    'stocks_mf': ('assets', 'Stocks/MF'),
+    'property_value': ('assets', 'Property'),
+    'home_loan': ('liabilities', 'Home Loan'),
+    'personal_loan': ('liabilities', 'Personal Loan'),
+    'other_debt': ('liabilities', 'Other Debt')
+}
+FIELD_DEFAULTS = {'age': 30, 'investment_experience': 2}
+EXPENSE_FIELDS = ('rent_emi', 'groceries', 'utilities', 'transportation', 'dining_entertainment', 'miscellaneous')
+ASSET_FIELDS = ('cash_balance', 'stocks_mf', 'property_value')
+LIABILITY_FIELDS = ('home_loan', 'personal_loan', 'other_debt')
+
+
+def snapshot_inputs(user_data, goals=()):
+    """Field values of a snapshot, plus a copy of the goals so in-place edits are detected"""
+    inputs = {}
+    for name, path in FIELDS.items():
+        section = user_data
+        for key in path[:-1]:
+            section = section.get(key, {})
+        inputs[name] = section.get(path[-1], FIELD_DEFAULTS.get(name, 0))
+    inputs['goals'] = [dict(goal) for goal in goals]
+    return inputs
+
+
+class ReactiveGraph:
+    """Derived nodes over input fields, invalidated by changed inputs and computed on read"""
+
+    def __init__(self, fields, nodes):
+        self.fields = list(fields)
+        self.nodes = {node.name: node for node in nodes}
+        self.order = self._topological_order()
+        self.dependents = {name: [] for name in self.fields + self.order}
+        for name in self.order:
+            for source in self.nodes[name].inputs:
+                self.dependents[source].append(name)
+        self.values = {}
+        self.stats = {name: {'computes': 0, 'last_ms': 0.0, 'total_ms': 0.0} for name in self.order}
+        self.invalidated = []
+
+    def _topological_order(self):
+        """Nodes ordered so every node comes after its inputs; rejects unknown inputs and cycles"""
+        known = set(self.fields) | set(self.nodes)
+        for node in self.nodes.values():
+            missing = [source for source in node.inputs if source not in known]
+            if missing:
+                raise ValueError(f"Node {node.name!r} reads unknown inputs {missing}")
+        order, visiting, done = [], set(), set(self.fields)
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle in computation graph at {name!r}")
+            visiting.add(name)
+            for source in self.nodes[name].inputs:
+                visit(source)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.nodes:
+            visit(name)
+        return order
+
+    def update(self, inputs):
+        """Take new field values and invalidate the nodes downstream of the ones that changed"""
+        changed = [name for name in self.fields if name not in self.values or self.values[name] != inputs[name]]
+        for name in changed:
+            self.values[name] = inputs[name]
+
+        invalid, stack = set(), list(changed)
+        while stack:
+            for name in self.dependents[stack.pop()]:
+                if name not in invalid:
+                    invalid.add(name)
+                    stack.append(name)
+        for name in invalid:
+            self.values.pop(name, None)
+        if changed:
+            self.invalidated = [name for name in self.order if name in invalid]
+        return self.invalidated
+
+    def value(self, name):
+        """Current value of a field or node, recomputing the node if it was invalidated"""
+        if name not in self.values:
+            node = self.nodes[name]
+            arguments = {source: self.value(source) for source in node.inputs}
+            start = time.perf_counter()
+            self.values[name] = node.compute(**arguments)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            stats = self.stats[name]
+            stats['computes'] += 1
+            stats['last_ms'] = elapsed_ms
+            stats['total_ms'] += elapsed_ms
+        return self.values[name]
+
+    def node_stats(self):
+        """One row per node for display"""
+        return [{
+            'Node': name,
+            'Inputs': ', '.join(self.nodes[name].inputs),
+            'Valid': name in self.values,
+            'Computes': self.stats[name]['computes'],
+            'Last (ms)': self.stats[name]['last_ms'],
+            'Total (ms)': self.stats[name]['total_ms']
+        } for name in self.order]
+
+    def to_dot(self):
+        """Graphviz DOT source; fields are boxes, nodes invalidated by the last edit are highlighted"""
+        lines = ['digraph {', '  rankdir=LR;', '  node [fontname="Inter", fontsize=10];']
+        for name in self.fields:
+            lines.append(f'  "{name}" [shape=box, style=filled, fillcolor="#e2e8f0"];')
+        for name in self.order:
+            color = '#fde68a' if name in self.invalidated else '#c7d2fe'
+            lines.append(f'  "{name}" [shape=ellipse, style=filled, fillcolor="{color}"];')
+            for source in self.nodes[name].inputs:
+                lines.append(f'  "{source}" -> "{name}";')
+        lines.append('}')
+        return '\n'.join(lines)
+
+
+def _total(**values):
+    return sum(values.values())
+
+
+def build_snapshot_graph(predictor, tax_planner):
+    """Graph of the snapshot-derived metrics and analyses used across the pages"""
+    nodes = [
+        Node('total_expenses', EXPENSE_FIELDS, _total),
+        Node('total_assets', ASSET_FIELDS, _total),
+        Node('total_liabilities', LIABILITY_FIELDS, _total),
+        Node('net_worth', ('total_assets', 'total_liabilities'), net_worth),
+        Node('monthly_savings', ('monthly_income', 'total_expenses'), monthly_savings),
+        Node('savings_rate', ('monthly_income', 'monthly_savings'), savings_rate),
+        Node('emergency_months', ('current_savings', 'total_expenses'), emergency_months),
+        Node('dining_ratio', ('dining_entertainment', 'total_expenses'), dining_ratio),
+        Node('health_score', ('savings_rate', 'emergency_months', 'investment_percentage'), health_score),
+        Node('risk_profile', ('age', 'monthly_income', 'current_savings', 'total_liabilities', 'investment_experience',
+                              'goals'),
+             lambda total_liabilities, goals, **profile: predict_risk(total_debt=total_liabilities,
+                                                                      financial_goals=len(goals), **profile)),
+        Node('recommendations', ('savings_rate', 'emergency_months', 'investment_percentage', 'dining_ratio', 'age'),
+             financial_recommendations),
+        Node('goal_simulation', ('goals', 'monthly_savings', 'current_savings'),
+             lambda goals, **finances: predictor.simulate_goals(goals, finances) if goals else None),
+        Node('tax_recommendations', ('age', 'monthly_income', 'goals'),
+             lambda goals, **profile: tax_planner.get_tax_recommendations(profile, goals))
+    ]
+    return ReactiveGraph(list(FIELDS) + ['goals'], nodes)
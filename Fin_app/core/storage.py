@@ -0,0 +1,337 @@
+"""Persistence backends for the snapshot, goals and portfolio datasets"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+
+DATA_DIR = '.ai_financial_data'
+DB_FILE = os.path.join(DATA_DIR, 'financial_data.db')
+
+GOAL_FIELDS = ('name', 'amount', 'years', 'return', 'created_date')
+HOLDING_FIELDS = ('name', 'amount', 'category', 'quantity', 'source')
+
+
+def load_json(path, default):
+    try:
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                return json.load(f)
+    except Exception:
+        pass
+    return default
+
+def save_json(path, data):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+# --- JSON Backend ---
+class JSONStorage:
+    """Legacy backend: one JSON file per dataset, rewritten on every change"""
+    name = 'json'
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = data_dir
+        os.makedirs(data_dir, exist_ok=True)
+        self.snapshot_file = os.path.join(data_dir, 'user_snapshot.json')
+        self.goals_file = os.path.join(data_dir, 'user_goals.json')
+        self.portfolio_file = os.path.join(data_dir, 'user_portfolio.json')
+
+    def load_snapshot(self):
+        return load_json(self.snapshot_file, {})
+
+    def save_snapshot(self, snapshot):
+        save_json(self.snapshot_file, snapshot)
+
+    def load_goals(self):
+        return _with_ids(load_json(self.goals_file, []))
+
+    def add_goal(self, goal):
+        goals = self.load_goals()
+        goal = dict(goal, id=_next_id(goals))
+        goals.append(goal)
+        save_json(self.goals_file, goals)
+        return goal
+
+    def delete_goal(self, goal_id):
+        goals = [g for g in self.load_goals() if g.get('id') != goal_id]
+        save_json(self.goals_file, goals)
+
+    def load_portfolio(self):
+        return _with_ids(load_json(self.portfolio_file, []))
+
+    def add_holdings(self, holdings):
+        portfolio = self.load_portfolio()
+        next_id = _next_id(portfolio)
+        added = [dict(h, id=next_id + i) for i, h in enumerate(holdings)]
+        portfolio.extend(added)
+        save_json(self.portfolio_file, portfolio)
+        return added
+
+    def add_holding(self, holding):
+        return self.add_holdings([holding])[0]
+
+    def delete_holding(self, holding_id):
+        portfolio = [h for h in self.load_portfolio() if h.get('id') != holding_id]
+        save_json(self.portfolio_file, portfolio)
+
+    def data_files(self):
+        return {
+            'snapshot': [self.snapshot_file],
+            'goals': [self.goals_file],
+            'portfolio': [self.portfolio_file]
+        }
+
+
+def _with_ids(rows):
+    """Give legacy rows without an id a stable positional one"""
+    return [dict(row, id=row.get('id', i + 1)) for i, row in enumerate(rows)]
+
+def _next_id(rows):
+    return max((row['id'] for row in rows), default=0) + 1
+
+
+# --- SQLite Backend ---
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshot (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS goals (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    amount REAL NOT NULL,
+    years NUMERIC NOT NULL,
+    expected_return NUMERIC,
+    created_date TEXT,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS holdings (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    amount REAL NOT NULL,
+    category TEXT,
+    quantity REAL,
+    source TEXT,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Statements are module constants so sqlite3's per-connection statement
+# cache reuses the compiled form for every call.
+SQL_UPSERT_SNAPSHOT = "INSERT INTO snapshot (id, data) VALUES (1, ?) ON CONFLICT(id) DO UPDATE SET data = excluded.data"
+SQL_SELECT_SNAPSHOT = "SELECT data FROM snapshot WHERE id = 1"
+SQL_CLEAR_SNAPSHOT = "DELETE FROM snapshot"
+SQL_INSERT_GOAL = "INSERT INTO goals (name, amount, years, expected_return, created_date, extra) VALUES (?, ?, ?, ?, ?, ?)"
+SQL_DELETE_GOAL = "DELETE FROM goals WHERE id = ?"
+SQL_SELECT_GOALS = "SELECT id, name, amount, years, expected_return, created_date, extra FROM goals ORDER BY id"
+SQL_INSERT_HOLDING = "INSERT INTO holdings (name, amount, category, quantity, source, extra) VALUES (?, ?, ?, ?, ?, ?)"
+SQL_DELETE_HOLDING = "DELETE FROM holdings WHERE id = ?"
+SQL_SELECT_HOLDINGS = "SELECT id, name, amount, category, quantity, source, extra FROM holdings ORDER BY id"
+SQL_CLEAR_GOALS = "DELETE FROM goals"
+SQL_CLEAR_HOLDINGS = "DELETE FROM holdings"
+SQL_GET_META = "SELECT value FROM meta WHERE key = ?"
+SQL_SET_META = "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+
+
+class SQLiteStorage:
+    """Single SQLite database in WAL mode with row-level goal and holding writes"""
+    name = 'sqlite'
+
+    def __init__(self, db_path=DB_FILE):
+        self.db_path = db_path
+        self.data_dir = os.path.dirname(db_path) or '.'
+        os.makedirs(self.data_dir, exist_ok=True)
+        # Thread ident -> that thread's connection, kept here so close() reaches all of them
+        self._connections = {}
+        self._lock = threading.Lock()
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+
+    def _conn(self):
+        # Streamlit serves each session from its own thread, so every thread
+        # keeps its own connection rather than sharing one behind a lock.
+        thread = threading.get_ident()
+        conn = self._connections.get(thread)
+        if conn is None:
+            # Only the owning thread uses it; check_same_thread=False lets close() run from any thread
+            conn = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=64,
+                                   check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            with self._lock:
+                self._connections[thread] = conn
+        return conn
+
+    def close(self):
+        """Close the connection of every thread that used this storage"""
+        with self._lock:
+            connections, self._connections = list(self._connections.values()), {}
+        for conn in connections:
+            conn.close()
+
+    def load_snapshot(self):
+        row = self._conn().execute(SQL_SELECT_SNAPSHOT).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def save_snapshot(self, snapshot):
+        self._conn().execute(SQL_UPSERT_SNAPSHOT, (json.dumps(snapshot),))
+
+    def load_goals(self):
+        goals = []
+        for goal_id, name, amount, years, expected_return, created_date, extra in self._conn().execute(SQL_SELECT_GOALS):
+            goal = {'id': goal_id, 'name': name, 'amount': amount, 'years': years}
+            if expected_return is not None:
+                goal['return'] = expected_return
+            if created_date is not None:
+                goal['created_date'] = created_date
+            if extra:
+                goal.update(json.loads(extra))
+            goals.append(goal)
+        return goals
+
+    def add_goal(self, goal):
+        cursor = self._conn().execute(SQL_INSERT_GOAL, _goal_params(goal))
+        return dict(goal, id=cursor.lastrowid)
+
+    def delete_goal(self, goal_id):
+        self._conn().execute(SQL_DELETE_GOAL, (goal_id,))
+
+    def load_portfolio(self):
+        portfolio = []
+        for holding_id, name, amount, category, quantity, source, extra in self._conn().execute(SQL_SELECT_HOLDINGS):
+            holding = {'id': holding_id, 'name': name, 'amount': amount, 'category': category}
+            if quantity is not None:
+                holding['quantity'] = quantity
+            if source is not None:
+                holding['source'] = source
+            if extra:
+                holding.update(json.loads(extra))
+            portfolio.append(holding)
+        return portfolio
+
+    def add_holding(self, holding):
+        cursor = self._conn().execute(SQL_INSERT_HOLDING, _holding_params(holding))
+        return dict(holding, id=cursor.lastrowid)
+
+    def add_holdings(self, holdings):
+        conn = self._conn()
+        added = []
+        conn.execute('BEGIN')
+        try:
+            for holding in holdings:
+                cursor = conn.execute(SQL_INSERT_HOLDING, _holding_params(holding))
+                added.append(dict(holding, id=cursor.lastrowid))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return added
+
+    def delete_holding(self, holding_id):
+        self._conn().execute(SQL_DELETE_HOLDING, (holding_id,))
+
+    def get_meta(self, key):
+        row = self._conn().execute(SQL_GET_META, (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        self._conn().execute(SQL_SET_META, (key, value))
+
+    def data_files(self):
+        # WAL commits land in the -wal file until a checkpoint, so it has to be
+        # watched alongside the main database file.
+        files = [self.db_path, self.db_path + '-wal']
+        return {'snapshot': files, 'goals': files, 'portfolio': files}
+
+
+def _extra(row, known):
+    extra = {k: v for k, v in row.items() if k not in known and k != 'id'}
+    return json.dumps(extra) if extra else None
+
+def _goal_params(goal):
+    return (goal['name'], goal['amount'], goal['years'], goal.get('return'),
+            goal.get('created_date'), _extra(goal, GOAL_FIELDS))
+
+def _holding_params(holding):
+    return (holding['name'], holding['amount'], holding.get('category'), holding.get('quantity'),
+            holding.get('source'), _extra(holding, HOLDING_FIELDS))
+
+
+# --- Migration ---
+def migrate_json_to_sqlite(data_dir=DATA_DIR, db_path=None, force=False):
+    """One-shot copy of the legacy JSON files into the SQLite database; force replaces its snapshot, goals and holdings"""
+    target = SQLiteStorage(db_path or os.path.join(data_dir, 'financial_data.db'))
+    try:
+        if target.get_meta('migrated_from_json') and not force:
+            return {'migrated': False, 'snapshot': 0, 'goals': 0, 'holdings': 0}
+
+        source = JSONStorage(data_dir)
+        snapshot = load_json(source.snapshot_file, {})
+        goals = load_json(source.goals_file, [])
+        portfolio = load_json(source.portfolio_file, [])
+
+        conn = target._conn()
+        conn.execute('BEGIN')
+        try:
+            # A forced re-import replaces everything rather than appending a second copy
+            # or keeping a snapshot the JSON files no longer have
+            conn.execute(SQL_CLEAR_SNAPSHOT)
+            if snapshot:
+                conn.execute(SQL_UPSERT_SNAPSHOT, (json.dumps(snapshot),))
+            conn.execute(SQL_CLEAR_GOALS)
+            conn.execute(SQL_CLEAR_HOLDINGS)
+            conn.executemany(SQL_INSERT_GOAL, [_goal_params(g) for g in goals])
+            conn.executemany(SQL_INSERT_HOLDING, [_holding_params(h) for h in portfolio])
+            conn.execute(SQL_SET_META, ('migrated_from_json', '1'))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return {'migrated': True, 'snapshot': int(bool(snapshot)), 'goals': len(goals), 'holdings': len(portfolio)}
+    finally:
+        target.close()
+
+
+# --- Backend Selection ---
+BACKENDS = {
+    'json': JSONStorage,
+    'sqlite': SQLiteStorage
+}
+
+_instances = {}
+
+def get_storage(backend=None, data_dir=DATA_DIR):
+    """Return the process-wide storage backend chosen by FIN_APP_STORAGE (default: sqlite)"""
+    backend = backend or os.environ.get('FIN_APP_STORAGE', 'sqlite')
+    key = (backend, data_dir)
+    if key not in _instances:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown storage backend '{backend}'. Choose from: {', '.join(BACKENDS)}")
+        if backend == 'sqlite':
+            migrate_json_to_sqlite(data_dir)
+            _instances[key] = SQLiteStorage(os.path.join(data_dir, 'financial_data.db'))
+        else:
+            _instances[key] = JSONStorage(data_dir)
+    return _instances[key]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Manage the local financial data store')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    migrate_parser = subparsers.add_parser('migrate', help='Copy the legacy JSON files into SQLite')
+    migrate_parser.add_argument('--data-dir', default=DATA_DIR)
+    migrate_parser.add_argument('--force', action='store_true', help='Re-import even if already migrated, replacing the SQLite snapshot, goals and holdings')
+    args = parser.parse_args()
+
+    if args.command == 'migrate':
+        result = migrate_json_to_sqlite(args.data_dir, force=args.force)
+        if result['migrated']:
+            print(f"Migrated {result['snapshot']} snapshot, {result['goals']} goals and {result['holdings']} holdings")
+        else:
+            print("Already migrated; pass --force to import the JSON files again")
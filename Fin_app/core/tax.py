@@ -0,0 +1,111 @@
+"""Section 80C/80D/NPS options and tax-saving estimates"""
+from core.income_tax import DEDUCTION_LIMITS, LATEST_YEAR, compare_regimes, income_tax
+from core.rules import recommendations
+
+SECTION_80C_OPTIONS = ('ELSS', 'PPF', 'TaxSaverFD', 'ULIP')
+# Other tax-saving options -> the income_tax deduction they count towards
+OPTION_DEDUCTIONS = {
+    'NPS': 'section_80ccd_1b',
+    'HealthInsurance': 'section_80d',
+    'HRA': 'hra_exemption',
+    'HomeLoan': 'home_loan_interest'
+}
+
+
+class TaxPlanner:
+    def __init__(self):
+        self.tax_saving_options = {
+            'ELSS': {
+                'name': 'Equity Linked Savings Scheme',
+                'lockin': '3 years',
+                'max_deduction': 150000,
+                'returns': '12-15%',
+                'risk': 'High',
+                'description': 'Tax-saving mutual funds with equity exposure and shortest lock-in period'
+            },
+            'PPF': {
+                'name': 'Public Provident Fund',
+                'lockin': '15 years',
+                'max_deduction': 150000,
+                'returns': '7.1%',
+                'risk': 'Low',
+                'description': 'Government-backed long-term savings with tax-free returns'
+            },
+            'NPS': {
+                'name': 'National Pension System',
+                'lockin': 'Till retirement',
+                'max_deduction': 50000,
+                'returns': '8-10%',
+                'risk': 'Medium',
+                'description': 'Retirement-focused scheme with additional ₹50,000 deduction under 80CCD(1B)'
+            },
+            'TaxSaverFD': {
+                'name': 'Tax Saver Fixed Deposit',
+                'lockin': '5 years',
+                'max_deduction': 150000,
+                'returns': '6-7%',
+                'risk': 'Low',
+                'description': 'Bank fixed deposits with tax benefits under section 80C'
+            },
+            'ULIP': {
+                'name': 'Unit Linked Insurance Plan',
+                'lockin': '5 years',
+                'max_deduction': 150000,
+                'returns': '8-12%',
+                'risk': 'Medium',
+                'description': 'Combination of insurance and investment with market-linked returns'
+            },
+            'HealthInsurance': {
+                'name': 'Health Insurance Premium',
+                'lockin': '1 year',
+                'max_deduction': 25000,
+                'returns': 'N/A',
+                'risk': 'N/A',
+                'description': 'Deduction on health insurance premiums under section 80D (₹50,000 for senior citizens)'
+            },
+            'HRA': {
+                'name': 'House Rent Allowance',
+                'lockin': 'N/A',
+                'max_deduction': 'As per salary',
+                'returns': 'N/A',
+                'risk': 'N/A',
+                'description': 'Tax exemption on house rent paid'
+            },
+            'HomeLoan': {
+                'name': 'Home Loan Interest',
+                'lockin': 'N/A',
+                'max_deduction': 200000,
+                'returns': 'N/A',
+                'risk': 'N/A',
+                'description': 'Deduction on home loan interest under section 24'
+            }
+        }
+    
+    def get_tax_recommendations(self, user_data, goals):
+        """Generate personalized tax saving recommendations"""
+        home_goal_names = [goal['name'] for goal in goals
+                           if 'house' in goal['name'].lower() or 'home' in goal['name'].lower()]
+        return recommendations({
+            'age': user_data.get('age', 30),
+            'annual_income': user_data.get('monthly_income', 0) * 12,
+            'home_goals': len(home_goal_names),
+            'home_goal_names': home_goal_names
+        }, 'tax')
+    
+    def tax_deductions(self, investments):
+        """income_tax deductions from the amounts entered per tax-saving option"""
+        deductions = {'section_80c': sum(investments.get(option, 0) for option in SECTION_80C_OPTIONS)}
+        for option, deduction in OPTION_DEDUCTIONS.items():
+            deductions[deduction] = investments.get(option, 0)
+        return deductions
+
+    def compare_regimes(self, investments, annual_income, age=30, year=LATEST_YEAR):
+        """Old vs new regime tax with the entered investments and exemptions"""
+        return compare_regimes(annual_income, self.tax_deductions(investments), age, year)
+
+    def calculate_tax_savings(self, investments, annual_income, age=30, year=LATEST_YEAR):
+        """Old-regime tax saved by the investments, and the Section 80C amount that counts"""
+        deductions = self.tax_deductions(investments)
+        tax_saved = (income_tax(annual_income, 'old', age=age, year=year).total
+                     - income_tax(annual_income, 'old', deductions, age, year).total)
+        return float(tax_saved), min(deductions['section_80c'], DEDUCTION_LIMITS['section_80c'])
@@ -0,0 +1,58 @@
+"""Surplus allocator: the max-plus programme against brute force, and splits that spend the whole budget"""
+import itertools
+
+import numpy as np
+import pytest
+
+from core.allocator import OBJECTIVES, allocate_from_curves, allocate_increments, allocate_surplus, goal_curves
+
+TARGETS, YEARS, RETURNS = [2_000_000, 800_000, 5_000_000], [8, 3, 15], [10, 7, 12]
+
+
+@pytest.fixture(scope='module')
+def curves():
+    return goal_curves(TARGETS, YEARS, RETURNS, n_paths=2_000)
+
+
+def splits(goals, steps):
+    """Every way of handing out steps increments to goals"""
+    for counts in itertools.product(range(steps + 1), repeat=goals):
+        if sum(counts) == steps:
+            yield counts
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_programme_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    goals, steps = rng.integers(1, 5), rng.integers(0, 7)
+    values = np.cumsum(rng.random((goals, steps + 1)) * (rng.random((goals, steps + 1)) < 0.5), axis=1)
+    counts = allocate_increments(values, steps)
+    assert counts.sum() == steps
+    best = max(sum(values[g, k] for g, k in enumerate(split)) for split in splits(goals, steps))
+    assert np.isclose(values[np.arange(goals), counts].sum(), best)
+
+
+@pytest.mark.parametrize('objective', OBJECTIVES)
+def test_allocation_beats_every_split_on_its_grid(curves, objective):
+    steps = 12
+    allocation = allocate_from_curves(curves, 60_000, objective=objective, steps=steps)
+    best = max(allocation.curve[np.arange(len(TARGETS)), list(split)].sum() for split in splits(len(TARGETS), steps))
+    counts = np.rint(allocation.sip / allocation.levels[1]).astype(int)
+    assert np.isclose(allocation.curve[np.arange(len(TARGETS)), counts].sum(), best)
+
+
+@pytest.mark.parametrize('objective', OBJECTIVES)
+@pytest.mark.parametrize('budget', [1_000, 25_000, 150_000, 2_000_000])
+def test_allocation_spends_the_whole_budget(curves, objective, budget):
+    allocation = allocate_from_curves(curves, budget, objective=objective)
+    assert np.isclose(allocation.sip.sum(), budget)
+    assert np.all(allocation.sip >= 0)
+
+
+def test_allocate_surplus_builds_the_same_curves(curves):
+    direct = allocate_surplus(TARGETS, YEARS, RETURNS, 40_000, n_paths=2_000)
+    cached = allocate_from_curves(curves, 40_000)
+    np.testing.assert_array_equal(direct.sip, cached.sip)
+    assert allocate_from_curves(curves, 0).sip.tolist() == [0, 0, 0]
+    with pytest.raises(ValueError):
+        allocate_from_curves(curves, 40_000, objective='fastest')
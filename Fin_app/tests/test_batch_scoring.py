@@ -0,0 +1,44 @@
+"""Batch scoring against the scalar risk and health functions, row by row"""
+import numpy as np
+import pandas as pd
+
+from core.batch_scoring import predict_profiles, score_profiles
+from core.financial_metrics import health_score
+from core.predictor import RISK_FACTORS, predict_risk, score_risk
+
+PROFILES = pd.DataFrame({
+    'age': [25, 42, 67, 35, 50],
+    'monthly_income': [40000, 150000, 0, 90000, 300000],
+    'current_savings': [20000, 900000, 500000, 0, 4000000],
+    'total_debt': [0, 2500000, 0, 400000, 100000],
+    'investment_experience': [0, 8, 20, 2, 12],
+    'total_expenses': [35000, 80000, 20000, 0, 120000],
+    'investment_percentage': [5, 20, 0, 12, 30],
+    'financial_goals': [1, 3, 0, 2, 4]
+})
+
+
+def _profile(row):
+    return (row.age, row.monthly_income, row.current_savings, row.total_debt, row.investment_experience,
+            row.financial_goals)
+
+
+def test_trained_model_is_the_default():
+    pd.testing.assert_frame_equal(score_profiles(PROFILES), predict_profiles(PROFILES))
+    for row, scored in zip(PROFILES.itertuples(index=False), score_profiles(PROFILES).itertuples(index=False)):
+        risk = predict_risk(*_profile(row))
+        assert scored.risk_profile == risk.profile
+        assert np.isclose(scored.risk_score, risk.score)
+
+
+def test_hand_weighted_rows_match_score_risk_exactly():
+    scores = score_profiles(PROFILES, hand_weighted=True)
+    factors = scores[RISK_FACTORS].to_numpy()
+    for i, (row, scored) in enumerate(zip(PROFILES.itertuples(index=False), scores.itertuples(index=False))):
+        risk = score_risk(*_profile(row))
+        assert (scored.risk_profile, scored.allocation, scored.risk_score) == (risk.profile, risk.allocation, risk.score)
+        assert factors[i].tolist() == [risk.factors[name] for name in RISK_FACTORS]
+        income, expenses = row.monthly_income, row.total_expenses
+        savings_rate = ((income - expenses) / income) * 100 if income > 0 else 0
+        emergency_months = row.current_savings / expenses if expenses > 0 else 0
+        assert scored.health_score == health_score(savings_rate, emergency_months, row.investment_percentage)
@@ -0,0 +1,55 @@
+"""Holdings import: one-frame reads and chunk-by-chunk streaming into storage"""
+import io
+
+import pytest
+
+from core.csv_import import import_holdings, preview_holdings, read_holdings
+from core.storage import JSONStorage, SQLiteStorage
+
+GENERIC = "Symbol,Quantity,Average Price,LTP\n" + "".join(
+    f"STOCK{i},{i + 1},{100 + i},{110 + i}\n" for i in range(25))
+
+
+def test_read_holdings_returns_one_frame():
+    holdings = read_holdings(io.BytesIO(GENERIC.encode()), chunk_threshold_bytes=0, chunksize=4)
+    assert list(holdings.index) == list(range(25))
+    assert holdings['amount'].tolist() == [(i + 1) * (110 + i) for i in range(25)]
+
+
+def test_read_holdings_without_a_known_layout_is_empty():
+    assert len(read_holdings(io.BytesIO(b"foo,bar\n1,2\n"))) == 0
+
+
+def test_preview_counts_every_chunk_and_keeps_the_first_rows():
+    source = io.BytesIO(GENERIC.encode())
+    source.read()
+    preview = preview_holdings(source, rows=3, chunksize=4)
+    assert preview.count == 25
+    assert preview.head['name'].tolist() == ['STOCK0', 'STOCK1', 'STOCK2']
+    assert preview_holdings(io.BytesIO(b"foo,bar\n1,2\n")) == (0, None)
+
+
+@pytest.mark.parametrize('backend', ['json', 'sqlite'])
+def test_import_holdings_streams_every_chunk(tmp_path, backend):
+    storage = JSONStorage(str(tmp_path)) if backend == 'json' else SQLiteStorage(str(tmp_path / 'fin.db'))
+    source = io.BytesIO(GENERIC.encode())
+    source.read()  # a preview read leaves the upload at its end
+    assert import_holdings(source, storage, chunksize=4) == 25
+    portfolio = storage.load_portfolio()
+    assert [h['name'] for h in portfolio] == [f"STOCK{i}" for i in range(25)]
+    assert len({h['id'] for h in portfolio}) == 25
+
+
+KITE_HEADER = 'Instrument,Qty.,Avg. cost,LTP,Cur. val,P&L,Net chg.,Day chg.\n'
+
+
+@pytest.mark.parametrize('chunksize', [None, 2])
+def test_placeholder_and_bad_cells_drop_rows_not_the_file(chunksize):
+    rows = ['INFY,10,"1,450.5",-,0,0,0,0', 'TCS,-,3000,3100,0,0,0,0', 'HDFC,N/A,1500,1600,0,0,0,0',
+            'ITC,,400,410,0,0,0,0', 'WIPRO,abc,400,410,0,0,0,0', 'SBIN,"1,000",500,N/A,0,0,0,0']
+    source = io.BytesIO((KITE_HEADER + '\n'.join(rows) + '\n').encode())
+    kwargs = {} if chunksize is None else {'chunk_threshold_bytes': 0, 'chunksize': chunksize}
+    holdings = read_holdings(source, **kwargs)
+    assert holdings['name'].tolist() == ['INFY', 'SBIN']
+    # A missing LTP falls back to the average cost
+    assert holdings['amount'].tolist() == [14505.0, 500_000.0]
@@ -0,0 +1,131 @@
+"""Slab tax engine against hand-computed cases and a slab-by-slab scalar reference"""
+import numpy as np
+import pytest
+
+from core.income_tax import (CESS, TAX_YEARS, allowed_deductions, break_even_deductions, compare_regimes,
+                             hra_exemption, income_tax, slab_tax)
+
+
+def scalar_slab_tax(income, regime, age):
+    """Walk the slabs from the bottom, with the senior citizen first bound where one applies"""
+    first_bound = regime.slabs[0][0]
+    for minimum_age, exempt in regime.senior_exemptions:
+        if age >= minimum_age:
+            first_bound = exempt
+    tax, lower = 0.0, 0.0
+    for i, (upper, rate) in enumerate(regime.slabs):
+        upper = max(first_bound if i == 0 else upper, first_bound)
+        if income > lower:
+            tax += (min(income, upper) - lower) * rate / 100
+        lower = upper
+    return tax
+
+
+def scalar_tax(gross, regime, claimed, age):
+    """Total tax one client at a time: rebate with marginal relief, surcharge band by band, then cess"""
+    taxable = max(gross - regime.standard_deduction - claimed, 0.0)
+    tax = scalar_slab_tax(taxable, regime, age)
+    if taxable <= regime.rebate_limit:
+        tax -= min(tax, regime.rebate_max)
+    elif regime.rebate_marginal_relief:
+        tax = min(tax, taxable - regime.rebate_limit)
+    surcharge, previous_rate = 0.0, 0.0
+    for threshold, rate in regime.surcharge:
+        if taxable <= threshold:
+            break
+        at_threshold = scalar_slab_tax(threshold, regime, age) * (1 + previous_rate)
+        surcharge = min(tax * rate / 100, at_threshold + (taxable - threshold) - tax)
+        previous_rate = rate / 100
+    return round((tax + surcharge) * (1 + CESS))
+
+
+# (gross income, regime, year, deductions, age, tax worked out by hand)
+HAND_COMPUTED = [
+    # New regime FY2025-26: the 87A rebate covers taxable income up to 12L (gross 12.75L)
+    (700_000, 'new', 'FY2025-26', None, 30, 0),
+    (775_000, 'new', 'FY2025-26', None, 30, 0),
+    (1_200_000, 'new', 'FY2025-26', None, 30, 0),
+    (1_275_000, 'new', 'FY2025-26', None, 30, 0),
+    # Taxable 12.25L: slab tax 63,750 capped at the 25,000 above the limit, plus cess
+    (1_300_000, 'new', 'FY2025-26', None, 30, 26_000),
+    # New regime FY2024-25: rebate up to 7L taxable, marginal relief just above it
+    (775_000, 'new', 'FY2024-25', None, 30, 0),
+    (785_000, 'new', 'FY2024-25', None, 30, 10_400),
+    # Taxable 12.25L: 20,000 + 30,000 + 15% of 2L + 20% of 25,000 = 85,000 plus cess
+    (1_300_000, 'new', 'FY2024-25', None, 30, 88_400),
+    # New regime FY2023-24: 50,000 standard deduction, 3-6L at 5%, 6-9L at 10%
+    (750_000, 'new', 'FY2023-24', None, 30, 0),
+    (760_000, 'new', 'FY2023-24', None, 30, 10_400),
+    # Old regime: taxable 5.5L after 80C and 80D -> 12,500 + 10,000, no rebate above 5L
+    (775_000, 'old', 'FY2025-26', {'section_80c': 150_000, 'section_80d': 25_000}, 30, 23_400),
+    (700_000, 'old', 'FY2025-26', {'section_80c': 150_000}, 30, 0),
+    (1_200_000, 'old', 'FY2025-26', None, 30, 163_800),
+    (1_300_000, 'old', 'FY2025-26', None, 30, 195_000),
+    # Senior (3L exempt) and super senior (5L exempt) citizens on taxable 9.5L
+    (1_000_000, 'old', 'FY2025-26', None, 65, 104_000),
+    (1_000_000, 'old', 'FY2025-26', None, 85, 93_600),
+    # Just above the 50L surcharge band: surcharge limited to the 50,000 of income above it
+    (5_100_000, 'old', 'FY2025-26', None, 30, 1_417_000)
+]
+
+
+@pytest.mark.parametrize('gross, regime, year, deductions, age, expected', HAND_COMPUTED)
+def test_hand_computed_tax(gross, regime, year, deductions, age, expected):
+    assert income_tax(gross, regime, deductions, age, year).total == expected
+
+
+@pytest.mark.parametrize('year', list(TAX_YEARS))
+@pytest.mark.parametrize('regime', ['old', 'new'])
+def test_vectorised_tax_matches_the_scalar_reference(year, regime):
+    rng = np.random.default_rng(17)
+    gross = np.concatenate([rng.uniform(0, 3e6, 400), rng.uniform(3e6, 8e7, 100),
+                            [500_000, 700_000, 775_000, 1_275_000, 5_050_000, 10_075_000, 20_075_000, 50_075_000]])
+    age = rng.choice([30, 45, 60, 70, 80, 90], len(gross))
+    claimed = rng.uniform(0, 400_000, len(gross)) if regime == 'old' else np.zeros(len(gross))
+    rules = TAX_YEARS[year][regime]
+    result = income_tax(gross, regime, {'hra_exemption': claimed} if regime == 'old' else None, age, year)
+    np.testing.assert_allclose(slab_tax(result.taxable_income, rules, age),
+                               [scalar_slab_tax(t, rules, a) for t, a in zip(result.taxable_income, age)], rtol=1e-12)
+    assert result.total.tolist() == [scalar_tax(g, rules, c, a) for g, c, a in zip(gross, claimed, age)]
+
+
+def test_deduction_caps():
+    deductions = {'section_80c': 200_000, 'section_80ccd_1b': 80_000, 'section_80d': 60_000,
+                  'hra_exemption': 300_000, 'home_loan_interest': 250_000}
+    assert allowed_deductions(deductions, 30) == 150_000 + 50_000 + 25_000 + 300_000 + 200_000
+    assert allowed_deductions(deductions, 65) == 150_000 + 50_000 + 50_000 + 300_000 + 200_000
+    with pytest.raises(ValueError):
+        allowed_deductions({'section_80e': 1})
+
+
+def test_hra_exemption_is_the_least_of_three():
+    # Basic 6L: HRA received, rent above 10% of basic, and 50% / 40% of basic
+    assert hra_exemption(600_000, 240_000, 300_000, metro=True) == 240_000
+    assert hra_exemption(600_000, 300_000, 300_000, metro=True) == 240_000
+    assert hra_exemption(600_000, 300_000, 400_000, metro=False) == 240_000
+    assert hra_exemption(600_000, 300_000, 500_000, metro=True) == 300_000
+    assert hra_exemption(600_000, 300_000, 50_000) == 0
+    np.testing.assert_array_equal(hra_exemption([600_000, 600_000], 300_000, 500_000, [True, False]),
+                                  [300_000, 240_000])
+
+
+def test_compare_regimes_picks_the_cheaper():
+    comparison = compare_regimes([775_000, 1_500_000], {'section_80c': 150_000, 'section_80d': 25_000},
+                                 year='FY2023-24')
+    # 7.75L: old 23,400 against new 26,000 (taxable 7.25L, marginal relief caps 27,500 at 25,000)
+    # 15L: old 202,800 against new 145,600
+    assert comparison.better.tolist() == ['old', 'new']
+    assert comparison.saving.tolist() == [2_600, 57_200]
+
+
+def test_break_even_is_the_smallest_whole_rupee_that_matches():
+    gross = np.array([600_000, 1_000_000, 1_500_000, 2_500_000, 6_000_000])
+    for year in TAX_YEARS:
+        new_total = income_tax(gross, 'new', year=year).total
+        for g, need, target in zip(gross, break_even_deductions(gross, year=year), new_total):
+            if np.isinf(need):
+                assert income_tax(g, 'old', {'hra_exemption': g}, year=year).total > target
+                continue
+            assert income_tax(g, 'old', {'hra_exemption': need}, year=year).total <= target
+            if need > 0:
+                assert income_tax(g, 'old', {'hra_exemption': need - 1}, year=year).total > target
@@ -0,0 +1,123 @@
+"""Vectorised amortization and prepayment engine against a loan-by-loan, month-by-month replay"""
+import numpy as np
+import pytest
+
+from core.loans import CLEARED, emi, emi_schedule, payoff_timeline, prepayment_sweep, snapshot_loans
+
+LOANS = [
+    {'name': 'Home Loan', 'balance': 2_500_000.0, 'rate': 8.5, 'emi': 21_700.0},
+    {'name': 'Personal Loan', 'balance': 300_000.0, 'rate': 13.0, 'emi': 10_100.0},
+    {'name': 'Car Loan', 'balance': 450_000.0, 'rate': 9.5, 'emi': 9_450.0},
+    {'name': 'Credit Card', 'balance': 60_000.0, 'rate': 36.0, 'emi': 3_000.0}
+]
+EXTRAS = [0.0, 2_500.0, 15_000.0, 60_000.0]
+
+
+def scalar_priority(loans, strategy):
+    if strategy == 'snowball':
+        return sorted(range(len(loans)), key=lambda i: (loans[i]['balance'], -loans[i]['rate']))
+    return sorted(range(len(loans)), key=lambda i: (-loans[i]['rate'], loans[i]['balance']))
+
+
+def scalar_payoff(loans, extra, strategy, max_months=600):
+    """Each month: interest, every EMI, then the spare budget to loans in priority order"""
+    balance = [loan['balance'] for loan in loans]
+    budget = sum(loan['emi'] for loan in loans) + extra
+    interest_paid = [0.0] * len(loans)
+    payoff = [np.inf] * len(loans)
+    history = []
+    for month in range(1, max_months + 1):
+        if not any(balance):
+            break
+        opening = list(balance)
+        interest = [b * loan['rate'] / 100 / 12 for b, loan in zip(balance, loans)]
+        spare = budget
+        for i, loan in enumerate(loans):
+            balance[i] += interest[i]
+            minimum = min(loan['emi'], balance[i])
+            balance[i] -= minimum
+            spare -= minimum
+        for i in scalar_priority(loans, strategy):
+            paid = min(spare, balance[i])
+            balance[i] -= paid
+            spare -= paid
+        for i in range(len(loans)):
+            if balance[i] < CLEARED:
+                balance[i] = 0.0
+            interest_paid[i] += interest[i]
+            if balance[i] == 0 and np.isinf(payoff[i]):
+                payoff[i] = month
+        history.append(([o + r - b for o, r, b in zip(opening, interest, balance)], interest, list(balance)))
+    return interest_paid, payoff, history
+
+
+def scalar_schedule(loan, max_months=600):
+    """Contractual EMIs alone: (payments, interest, balances) month by month"""
+    r = loan['rate'] / 100 / 12
+    balance, rows = loan['balance'], []
+    for _ in range(max_months):
+        interest = balance * r
+        closing = max(balance + interest - loan['emi'], 0.0)
+        closing = 0.0 if closing < CLEARED else closing
+        rows.append((balance + interest - closing, interest, closing))
+        balance = closing
+    return np.array(rows).T
+
+
+def test_emi_clears_the_principal():
+    instalment = emi(1_000_000, 9.0, 120)
+    assert scalar_schedule({'balance': 1_000_000, 'rate': 9.0, 'emi': instalment}, 120)[2][-1] == 0
+    assert emi(120_000, 0.0, 24) == 5_000
+
+
+def test_emi_schedule_matches_the_month_loop():
+    schedule = emi_schedule(LOANS)
+    for l, loan in enumerate(LOANS):
+        payment, interest, balance = scalar_schedule(loan)
+        np.testing.assert_allclose(schedule.balance[l], balance, rtol=1e-7, atol=1e-3)
+        np.testing.assert_allclose(schedule.interest[l], interest, rtol=1e-7, atol=1e-3)
+        np.testing.assert_allclose(schedule.payment[l], payment, rtol=1e-7, atol=1e-3)
+        assert schedule.payoff_month[l] == np.argmax(balance == 0) + 1
+        assert np.isclose(schedule.total_interest[l], interest.sum(), rtol=1e-9)
+
+
+@pytest.mark.parametrize('strategy', ['avalanche', 'snowball'])
+def test_prepayment_sweep_matches_the_month_loop(strategy):
+    sweep = prepayment_sweep(LOANS, EXTRAS, strategies=(strategy,))
+    for e, extra in enumerate(EXTRAS):
+        interest, payoff, _ = scalar_payoff(LOANS, extra, strategy)
+        assert np.isclose(sweep.total_interest[0, e], sum(interest), rtol=1e-9)
+        assert sweep.payoff_month[0, e].tolist() == payoff
+        assert sweep.debt_free_month[0, e] == max(payoff)
+    assert np.all(np.diff(sweep.total_interest[0]) <= 0)  # paying more never costs more interest
+
+
+def test_extra_payments_save_interest_against_the_emi_schedule():
+    sweep = prepayment_sweep(LOANS, EXTRAS)
+    # With no extra, rolling over the EMIs of cleared loans can only save interest
+    assert np.all(sweep.interest_saved[:, 0] >= -1e-6)
+    assert np.all(sweep.interest_saved[:, -1] > sweep.interest_saved[:, 0])
+
+
+@pytest.mark.parametrize('strategy', ['avalanche', 'snowball'])
+def test_payoff_timeline_matches_the_month_loop(strategy):
+    timeline = payoff_timeline(LOANS, 15_000.0, strategy)
+    _, _, history = scalar_payoff(LOANS, 15_000.0, strategy)
+    payment, interest, balance = (np.array(column) for column in zip(*history))
+    assert len(timeline.month) == len(history)
+    np.testing.assert_allclose(timeline.balance, balance, rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(timeline.interest, interest, rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(timeline.payment, payment, rtol=1e-9, atol=1e-6)
+
+
+def test_uncovered_interest_never_clears():
+    loans = [{'name': 'Other Debt', 'balance': 100_000.0, 'rate': 24.0, 'emi': 1_500.0}]
+    sweep = prepayment_sweep(loans, [0.0, 1_000.0])
+    assert np.isinf(sweep.payoff_month[0, 0, 0]) and np.isfinite(sweep.payoff_month[0, 1, 0])
+    assert np.isinf(emi_schedule(loans).payoff_month[0])
+
+
+def test_snapshot_loans_skip_zero_balances():
+    loans = snapshot_loans({'liabilities': {'Home Loan': 0, 'Personal Loan': 200_000, 'Other Debt': 10_000}})
+    assert [loan['name'] for loan in loans] == ['Personal Loan', 'Other Debt']
+    assert loans[0]['emi'] == round(float(emi(200_000, 13.0, 36)))
@@ -0,0 +1,85 @@
+"""Batched Monte Carlo engine against a path-by-path, month-by-month replay of the same draws"""
+import numpy as np
+import pytest
+
+from core.montecarlo import default_volatility, shortfall_summary, simulate_goals
+from core.projection import sip_projection
+
+TARGETS = [600000, 2_000_000, 150000]
+YEARS = [4, 9, 1.5]
+RETURNS = [10, 12, 6]
+SIP = 9000
+INITIAL = 25000
+
+
+def scalar_terminal_wealth(n_paths, chunk_size, seed=42):
+    """Each path compounded one month at a time from the engine's draws (first half drawn, second half mirrored)"""
+    rng = np.random.Generator(np.random.SFC64(seed))
+    months = [int(y * 12) for y in YEARS]
+    sigma = default_volatility(RETURNS) / np.sqrt(12)
+    mu = np.log1p(np.array(RETURNS) / 100 / 12) - sigma ** 2 / 2
+    wealth = np.empty((len(TARGETS), n_paths))
+    path = 0
+    for start in range(0, n_paths, chunk_size):
+        size = min(chunk_size, n_paths - start)
+        half = (size + 1) // 2
+        draws = rng.standard_normal((half, max(months)), dtype=np.float32).astype(np.float64)
+        draws = np.vstack([draws, -draws[:size - half]])
+        for shocks in draws:
+            for g, n in enumerate(months):
+                balance = INITIAL
+                for t in range(n):
+                    balance = balance * np.exp(mu[g] + sigma[g] * shocks[t]) + SIP
+                wealth[g, path] = balance
+            path += 1
+    return wealth
+
+
+def test_terminal_wealth_matches_path_by_path_replay():
+    simulation = simulate_goals(TARGETS, YEARS, RETURNS, SIP, INITIAL, n_paths=50, chunk_size=16)
+    expected = scalar_terminal_wealth(50, 16)
+    # The engine accumulates the draws in float32
+    assert np.allclose(simulation.terminal_wealth, expected, rtol=1e-4)
+    assert np.array_equal(simulation.probability, (expected >= np.array(TARGETS)[:, None]).mean(axis=1))
+    assert np.allclose(simulation.shortfall, np.maximum(np.array(TARGETS)[:, None] - expected, 0), rtol=1e-4, atol=1)
+
+
+def test_zero_volatility_reduces_to_deterministic_projection():
+    simulation = simulate_goals(TARGETS, YEARS, RETURNS, SIP, 0.0, volatility=0.0, n_paths=8)
+    deterministic = sip_projection(SIP, np.array(YEARS), np.array(RETURNS)).future_value
+    assert np.allclose(simulation.terminal_wealth, deterministic[:, None], rtol=1e-5)
+
+
+def test_mean_wealth_matches_expected_growth():
+    simulation = simulate_goals(TARGETS, YEARS, RETURNS, SIP, INITIAL, n_paths=40_000)
+    deterministic = (sip_projection(SIP, np.array(YEARS), np.array(RETURNS)).future_value
+                     + INITIAL * (1 + np.array(RETURNS) / 1200) ** (np.array(YEARS) * 12))
+    assert np.allclose(simulation.terminal_wealth.mean(axis=1), deterministic, rtol=0.01)
+
+
+def test_results_are_reproducible_for_a_seed():
+    first = simulate_goals(TARGETS, YEARS, RETURNS, SIP, INITIAL, n_paths=2000)
+    second = simulate_goals(TARGETS, YEARS, RETURNS, SIP, INITIAL, n_paths=2000)
+    assert np.array_equal(first.terminal_wealth, second.terminal_wealth)
+
+
+def test_percentile_paths_are_ordered_and_end_at_horizon():
+    simulation = simulate_goals(TARGETS, YEARS, RETURNS, SIP, INITIAL, n_paths=4000, path_step=6)
+    paths = simulation.percentile_paths
+    finite = ~np.isnan(paths)
+    assert (np.diff(np.where(finite, paths, 0), axis=1) >= -1e-6).all()
+    for g, years in enumerate(YEARS):
+        last = int(np.sum(simulation.path_months <= years * 12))
+        assert finite[g, :, :last].all() and not finite[g, :, last:].any()
+    assert np.allclose(paths[:, :, 0], INITIAL)
+
+
+@pytest.mark.parametrize('n_paths', [1, 7, 1000])
+def test_shortfall_summary_consistent(n_paths):
+    simulation = simulate_goals(TARGETS, YEARS, RETURNS, SIP, INITIAL, n_paths=n_paths)
+    summary = shortfall_summary(simulation)
+    assert np.allclose(summary['expected'], simulation.shortfall.mean(axis=1))
+    missed = simulation.shortfall > 0
+    for g in range(len(TARGETS)):
+        expected = simulation.shortfall[g][missed[g]].mean() if missed[g].any() else 0
+        assert np.isclose(summary['expected_when_missed'][g], expected)
@@ -0,0 +1,69 @@
+"""NAV store ingest: versioned publishing and consistent reads"""
+import json
+import os
+
+import numpy as np
+import pytest
+
+from core.nav_store import CURRENT_FILE, NavStore, ingest, pack_keys, store_version, to_days
+
+HEADER = ('Scheme Code;Scheme Name;ISIN Div Payout/ISIN Growth;ISIN Div Reinvestment;'
+          'Net Asset Value;Repurchase Price;Sale Price;Date\n\nOpen Ended Schemes ( Equity Scheme )\n\n')
+
+
+def write_dump(path, rows):
+    with open(path, 'w') as f:
+        f.write(HEADER)
+        for code, nav, date in rows:
+            f.write(f"{code};Scheme {code};INF{code};;{nav};;;{date}\n")
+    return str(path)
+
+
+def versions(store_dir):
+    return sorted(name for name in os.listdir(store_dir) if os.path.isdir(os.path.join(store_dir, name)))
+
+
+def test_each_ingest_publishes_a_new_version(tmp_path):
+    store_dir = str(tmp_path / 'store')
+    assert store_version(store_dir) is None
+    ingest([write_dump(tmp_path / 'a.txt', [(100, 10.0, '01-Jan-2024'), (101, 20.0, '01-Jan-2024')])], store_dir)
+    first = store_version(store_dir)
+    reader = NavStore(store_dir)
+
+    ingest([write_dump(tmp_path / 'b.txt', [(100, 11.0, '02-Jan-2024'), (102, 30.0, '02-Jan-2024')])], store_dir)
+    assert store_version(store_dir) != first
+    # A reader opened before the swap keeps its own, complete version
+    assert len(reader) == len(reader.navs) == 2
+    store = NavStore(store_dir)
+    assert len(store) == 4 and set(store.schemes) == {100, 101, 102}
+    assert store.nav_on([100, 101], np.datetime64('2024-01-05')).nav.tolist() == [11.0, 20.0]
+
+    ingest([write_dump(tmp_path / 'c.txt', [(103, 5.0, '03-Jan-2024')])], store_dir)
+    # Only the live version and the one before it are kept
+    assert len(versions(store_dir)) == 2
+    with open(os.path.join(store_dir, CURRENT_FILE)) as f:
+        assert f.read() in versions(store_dir)
+
+
+def test_store_written_before_versioning_is_read_and_replaced(tmp_path):
+    store_dir = str(tmp_path / 'store')
+    os.makedirs(store_dir)
+    np.save(os.path.join(store_dir, 'keys.npy'), pack_keys([100], to_days(np.datetime64('2024-01-01'))))
+    np.save(os.path.join(store_dir, 'navs.npy'), np.array([10.0]))
+    with open(os.path.join(store_dir, 'schemes.json'), 'w') as f:
+        json.dump({'100': {'name': 'Scheme 100', 'isins': ['INF100']}}, f)
+    assert len(NavStore(store_dir)) == 1
+
+    ingest([write_dump(tmp_path / 'a.txt', [(101, 20.0, '01-Jan-2024')])], store_dir)
+    assert len(NavStore(store_dir)) == 2
+    assert not os.path.exists(os.path.join(store_dir, 'keys.npy'))
+
+
+def test_misaligned_columns_are_rejected(tmp_path):
+    store_dir = str(tmp_path)
+    np.save(os.path.join(store_dir, 'keys.npy'), np.arange(3, dtype=np.int64))
+    np.save(os.path.join(store_dir, 'navs.npy'), np.ones(2))
+    with open(os.path.join(store_dir, 'schemes.json'), 'w') as f:
+        json.dump({}, f)
+    with pytest.raises(ValueError, match='inconsistent'):
+        NavStore(store_dir)
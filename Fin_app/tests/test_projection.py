@@ -0,0 +1,119 @@
+"""Vectorised projections and inverse solvers against month-by-month scalar loops"""
+import numpy as np
+import pytest
+
+from core.projection import (cash_flow_projection, final_values, investment_projection_calculator,
+                             lumpsum_projection, required_lumpsum, required_return, required_sip, required_years,
+                             step_up_sip_factor)
+
+CASES = [(5000, 10, 12), (12000, 3.5, 8), (2500, 25, 0), (1, 1, 15), (40000, 0, 10)]
+
+
+def scalar_sip(monthly_investment, years, expected_return):
+    """The calculator the app shipped before the projection engine"""
+    monthly_rate = expected_return / 100 / 12
+    months = int(years * 12)
+    if monthly_rate > 0:
+        future_value = monthly_investment * (((1 + monthly_rate) ** months - 1) / monthly_rate)
+    else:
+        future_value = monthly_investment * months
+    total_invested = monthly_investment * months
+    return future_value, total_invested, future_value - total_invested
+
+
+def scalar_plan(sip, years, expected_return, step_up=0, inflation=0, initial=0, top_ups=None, pauses=()):
+    """Balance, invested and real value month by month, one loop iteration per month"""
+    rate = expected_return / 100 / 12
+    balance, invested, rows = initial, initial, []
+    for month in range(1, int(years * 12) + 1):
+        payment = sip * (1 + step_up / 100) ** ((month - 1) // 12)
+        if any(first <= month <= last for first, last in pauses):
+            payment = 0
+        payment += (top_ups or {}).get(month, 0)
+        balance = balance * (1 + rate) + payment
+        invested += payment
+        rows.append((balance, invested, balance / (1 + inflation / 100) ** (month / 12)))
+    return np.array(rows)
+
+
+@pytest.mark.parametrize('sip, years, rate', CASES)
+def test_sip_projection_matches_scalar_calculator(sip, years, rate):
+    assert np.allclose(investment_projection_calculator(sip, years, rate), scalar_sip(sip, years, rate))
+
+
+def test_sip_projection_broadcasts_to_scalar_results():
+    sips, years, rates = (np.array(column, dtype=float) for column in zip(*CASES))
+    projected = investment_projection_calculator(sips, years, rates)
+    expected = np.array([scalar_sip(*case) for case in CASES]).T
+    assert np.allclose(np.array(projected), expected)
+
+
+def test_lumpsum_projection_compounds_annually():
+    assert np.isclose(lumpsum_projection(100000, 7, 9).future_value, 100000 * 1.09 ** 7)
+    assert lumpsum_projection(100000, 7, 0).profit == 0
+
+
+@pytest.mark.parametrize('step_up, inflation', [(0, 0), (10, 6), (5, 0), (0, 7)])
+def test_cash_flow_projection_matches_monthly_loop(step_up, inflation):
+    top_ups, pauses = {7: 50000, 30: 20000}, [(13, 18)]
+    flows = cash_flow_projection(8000, 4, 11, step_up, inflation, initial=100000, top_ups=top_ups, pauses=pauses)
+    expected = scalar_plan(8000, 4, 11, step_up, inflation, 100000, top_ups, pauses)
+    assert np.allclose(flows.balance[0], expected[:, 0])
+    assert np.allclose(flows.invested[0], expected[:, 1])
+    assert np.allclose(flows.real_value[0], expected[:, 2])
+
+
+def test_cash_flow_projection_ends_each_plan_at_its_horizon():
+    flows = cash_flow_projection([1000, 1000], [2, 5], 10)
+    assert np.isnan(flows.balance[0, 24:]).all() and not np.isnan(flows.balance[0, :24]).any()
+    assert np.allclose(final_values(flows.balance, [2, 5]), [scalar_plan(1000, y, 10)[-1, 0] for y in (2, 5)])
+
+
+@pytest.mark.parametrize('years', [1, 7.5, 20])
+@pytest.mark.parametrize('rate, step_up', [(12, 10), (8, 0), (0, 5), (12, 12.682503)])
+def test_step_up_factor_matches_monthly_loop(years, rate, step_up):
+    expected = scalar_plan(1, years, rate, step_up)[-1, 0]
+    # 12.682503% is the step-up equal to 12% compounded monthly, where the closed form switches to its limit
+    assert np.isclose(step_up_sip_factor(rate / 100 / 12, years, step_up / 100), expected, rtol=1e-8)
+
+
+def test_required_sip_reaches_target():
+    sip = required_sip(1_000_000, 10, 12)
+    assert np.isclose(scalar_sip(sip, 10, 12)[0], 1_000_000)
+
+
+@pytest.mark.parametrize('target, sip, rate, initial', [
+    (1_000_000, 10000, 12, 0), (500000, 5000, 0, 20000), (2_000_000, 15000, 9, 300000), (100000, 0, 10, 50000)
+])
+def test_required_years_is_first_month_reaching_target(target, sip, rate, initial):
+    months = round(required_years(target, sip, rate, initial) * 12)
+    path = scalar_plan(sip, months / 12, rate, initial=initial)[:, 0]
+    assert path[-1] >= target * (1 - 1e-9)
+    assert months == 1 or path[-2] < target
+
+
+def test_required_years_unreachable_and_already_met():
+    assert required_years(1_000_000, 0, 0, 1000) == np.inf
+    assert required_years(1000, 500, 10, 5000) == 0
+
+
+def test_required_lumpsum_closes_the_gap():
+    lumpsum = required_lumpsum(3_000_000, 10000, 12, 10)
+    assert np.isclose(scalar_plan(10000, 12, 10, initial=lumpsum)[-1, 0], 3_000_000)
+    assert required_lumpsum(1000, 10000, 12, 10) == 0
+
+
+def test_required_return_solves_every_goal():
+    targets = np.array([1_000_000, 2_500_000, 600000, 1e12])
+    sips = np.array([8000, 10000, 5000, 100])
+    years = np.array([8, 15, 10, 5])
+    solution = required_return(targets, sips, years)
+    for target, sip, year, rate, converged in zip(targets, sips, years, solution.value, solution.converged):
+        if np.isnan(rate):
+            assert not converged
+            continue
+        assert converged
+        assert np.isclose(scalar_plan(sip, year, rate)[-1, 0], target, rtol=1e-5)
+    assert np.isnan(solution.value[-1])
+    # Contributions alone cover the target exactly at 0%
+    assert abs(required_return(600000, 5000, 10).value) < 1e-3
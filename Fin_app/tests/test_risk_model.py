@@ -0,0 +1,68 @@
+"""Risk model: fitting, banding by score, per-feature contributions and the JSON artifact"""
+import json
+
+import numpy as np
+import pytest
+
+from core.risk_model import (BAND_UPPER_SCORES, MODEL_FILE, RISK_FACTORS, RiskModel, load_risk_model,
+                             synthetic_training_set, train)
+
+
+@pytest.fixture(scope='module')
+def book():
+    return synthetic_training_set(size=4_000, seed=3)
+
+
+@pytest.fixture(scope='module')
+def model(book):
+    return train(*book)
+
+
+def test_fit_learns_the_quiz_bands(book, model):
+    features, bands = book
+    probabilities = model.probabilities(features)
+    np.testing.assert_allclose(probabilities.sum(axis=1), 1.0)
+    # Far better than always answering the most common band
+    assert model.metadata['holdout_accuracy'] > np.bincount(bands).max() / len(bands) + 0.1
+
+
+def test_band_follows_the_score(book, model):
+    prediction = model.predict(book[0])
+    assert np.all((prediction.score >= 0) & (prediction.score <= 10))
+    expected = [sum(score >= upper for upper in BAND_UPPER_SCORES) for score in prediction.score]
+    assert prediction.band.tolist() == expected
+    # Every band is reachable on the client book
+    assert set(expected) == {0, 1, 2}
+
+
+def test_contributions_are_the_score_change_at_the_training_mean(book, model):
+    features = book[0][:50]
+    prediction = model.predict(features)
+    for j in range(len(RISK_FACTORS)):
+        at_mean = features.copy()
+        at_mean[:, j] = model.mean[j]
+        np.testing.assert_allclose(prediction.contributions[:, j],
+                                   prediction.score - model.predict(at_mean).score, atol=1e-9)
+
+
+def test_artifact_round_trip(book, model, tmp_path):
+    path = str(tmp_path / 'risk_model.json')
+    model.save(path)
+    loaded = RiskModel.load(path)
+    assert loaded.metadata == model.metadata
+    np.testing.assert_array_equal(loaded.predict(book[0]).score, model.predict(book[0]).score)
+
+    with open(path) as f:
+        artifact = json.load(f)
+    artifact['features'] = RISK_FACTORS[:-1]
+    with open(path, 'w') as f:
+        json.dump(artifact, f)
+    with pytest.raises(ValueError, match='trained on features'):
+        RiskModel.load(path)
+
+
+def test_shipped_artifact_loads():
+    model = load_risk_model()
+    assert model is load_risk_model()
+    assert model.weights.shape[0] == len(RISK_FACTORS)
+    assert RiskModel.load(MODEL_FILE).weights.tolist() == model.weights.tolist()
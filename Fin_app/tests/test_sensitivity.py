@@ -0,0 +1,24 @@
+"""Sensitivity grid and tornado ranges"""
+import numpy as np
+import pytest
+
+from core.sensitivity import (GRID_RETURNS, GRID_STEP_UPS, GRID_YEARS, TORNADO_RANGES, goal_required_sip,
+                              required_sip_grid, tornado)
+
+
+@pytest.mark.parametrize('years, expected', [(1, (1, 2)), (2, (1, 3)), (4, (3, 5)), (10, (8, 12)), (20, (15, 25))])
+def test_years_range_always_moves_the_horizon(years, expected):
+    assert TORNADO_RANGES['years'][1](years) == expected
+
+
+def test_one_year_goal_gets_a_years_bar():
+    base = {'target_amount': 500000, 'expected_return': 8, 'years': 1, 'step_up': 0, 'inflation': 6}
+    bars = {bar.input: bar for bar in tornado(goal_required_sip, base, ['years', 'expected_return'])}
+    assert bars['Years'].swing > 0
+
+
+def test_grid_matches_goal_required_sip():
+    grid = required_sip_grid(2_000_000, inflation=5)
+    for r, y, s in [(0, 0, 0), (4, 9, 3), (len(GRID_RETURNS) - 1, len(GRID_YEARS) - 1, len(GRID_STEP_UPS) - 1)]:
+        expected = goal_required_sip(2_000_000, GRID_RETURNS[r], GRID_YEARS[y], GRID_STEP_UPS[s], 5)
+        assert np.isclose(grid.values[r, y, s], expected, rtol=1e-12)
@@ -0,0 +1,72 @@
+"""Snapshot graph nodes against derive_metrics, and what an edit invalidates"""
+import copy
+
+import pytest
+
+from core.financial_metrics import derive_metrics
+from core.predictor import MLFinancialPredictor, predict_risk
+from core.snapshot_graph import build_snapshot_graph, snapshot_inputs
+
+METRICS = ('total_expenses', 'monthly_savings', 'savings_rate', 'emergency_months', 'health_score',
+           'total_assets', 'total_liabilities', 'net_worth')
+GOALS = [{'name': 'House', 'amount': 5_000_000, 'years': 10, 'return': 10}]
+
+SNAPSHOT = {
+    'monthly_income': 120000, 'current_savings': 300000, 'investment_percentage': 15, 'age': 34,
+    'investment_experience': 3,
+    'expenses': {'Rent/EMI': 30000, 'Groceries': 12000, 'Utilities': 4000, 'Transportation': 5000,
+                 'Dining & Entertainment': 8000, 'Miscellaneous': 6000},
+    'assets': {'Cash': 150000, 'Stocks/MF': 600000, 'Property': 0},
+    'liabilities': {'Home Loan': 0, 'Personal Loan': 200000, 'Other Debt': 15000}
+}
+
+
+@pytest.mark.parametrize('snapshot', [SNAPSHOT, {'monthly_income': 0, 'expenses': {}, 'assets': {}, 'liabilities': {}}])
+def test_nodes_match_derive_metrics(snapshot):
+    graph = build_snapshot_graph(None, None)
+    graph.update(snapshot_inputs(snapshot))
+    metrics = derive_metrics(snapshot)
+    for name in METRICS:
+        assert graph.value(name) == getattr(metrics, name), name
+
+
+class StubPredictor:
+    def simulate_goals(self, goals, finances):
+        return dict(finances)
+
+
+def computed_graph(snapshot):
+    graph = build_snapshot_graph(StubPredictor(), None)
+    graph.update(snapshot_inputs(snapshot, GOALS))
+    for name in graph.order:
+        if name != 'tax_recommendations':
+            graph.value(name)
+    return graph
+
+
+def test_expense_edit_leaves_the_balance_sheet_valid():
+    graph = computed_graph(SNAPSHOT)
+    edited = copy.deepcopy(SNAPSHOT)
+    edited['expenses']['Dining & Entertainment'] = 20000
+    invalidated = graph.update(snapshot_inputs(edited, GOALS))
+    assert {'total_expenses', 'monthly_savings', 'savings_rate', 'emergency_months', 'dining_ratio',
+            'health_score', 'recommendations', 'goal_simulation'} == set(invalidated)
+    assert graph.value('health_score') == derive_metrics(edited).health_score
+
+
+def test_investment_share_edit_touches_only_the_score_and_recommendations():
+    graph = computed_graph(SNAPSHOT)
+    edited = dict(SNAPSHOT, investment_percentage=25)
+    assert set(graph.update(snapshot_inputs(edited, GOALS))) == {'health_score', 'recommendations'}
+    assert 'monthly_savings' in graph.values and 'goal_simulation' in graph.values
+    assert graph.value('health_score') == derive_metrics(edited).health_score
+
+
+def test_risk_profile_counts_the_saved_goals():
+    graph = computed_graph(SNAPSHOT)
+    goals = GOALS + [{'name': 'Car', 'amount': 800_000, 'years': 3, 'return': 8}]
+    assert 'risk_profile' in graph.update(snapshot_inputs(SNAPSHOT, goals))
+    expected = predict_risk(34, 120000, 300000, 215000, 3, financial_goals=2)
+    assert graph.value('risk_profile') == expected
+    assert MLFinancialPredictor().predict_risk_tolerance(SNAPSHOT, goals) == expected
+    assert expected != predict_risk(34, 120000, 300000, 215000, 3, financial_goals=0)
@@ -0,0 +1,90 @@
+"""Both storage backends round-trip the same way, and forced migration replaces the SQLite data"""
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from core.storage import JSONStorage, SQLiteStorage, load_json, migrate_json_to_sqlite, save_json
+
+SNAPSHOT = {'monthly_income': 90000, 'expenses': {'Groceries': 8000}, 'assets': {'Cash': 50000}}
+GOALS = [{'name': 'House', 'amount': 5_000_000.0, 'years': 10, 'return': 10, 'created_date': '2024-01-01'},
+         {'name': 'Car', 'amount': 800_000.0, 'years': 3, 'return': 8, 'created_date': '2024-02-01', 'priority': 2}]
+HOLDINGS = [{'name': 'NIFTY ETF', 'amount': 120_000.0, 'category': 'Stocks', 'quantity': 500.0, 'source': 'CSV Import'},
+            {'name': 'SBI FD', 'amount': 200_000.0, 'category': 'FD/RD', 'isin': None}]
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def storage(request, tmp_path):
+    if request.param == 'json':
+        yield JSONStorage(str(tmp_path))
+    else:
+        storage = SQLiteStorage(str(tmp_path / 'fin.db'))
+        yield storage
+        storage.close()
+
+
+def without_ids(rows):
+    return [{k: v for k, v in row.items() if k != 'id'} for row in rows]
+
+
+def test_snapshot_round_trip(storage):
+    assert storage.load_snapshot() == {}
+    storage.save_snapshot(SNAPSHOT)
+    assert storage.load_snapshot() == SNAPSHOT
+
+
+def test_goals_add_delete_load(storage):
+    added = [storage.add_goal(goal) for goal in GOALS]
+    assert without_ids(storage.load_goals()) == GOALS
+    storage.delete_goal(added[0]['id'])
+    assert storage.load_goals() == added[1:]
+
+
+def test_holdings_add_delete_load(storage):
+    added = storage.add_holdings(HOLDINGS)
+    added.append(storage.add_holding({'name': 'Gold', 'amount': 30_000.0, 'category': 'Gold'}))
+    assert len({h['id'] for h in added}) == 3
+    assert storage.load_portfolio() == added
+    storage.delete_holding(added[1]['id'])
+    assert storage.load_portfolio() == [added[0], added[2]]
+
+
+def test_close_reaches_every_thread(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / 'fin.db'))
+    thread = threading.Thread(target=lambda: storage.add_goal(GOALS[0]))
+    thread.start()
+    thread.join()
+    connections = list(storage._connections.values())
+    assert len(connections) == 2
+    storage.close()
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
+    # A closed storage reconnects on next use
+    assert len(storage.load_goals()) == 1
+    storage.close()
+
+
+def test_forced_migration_replaces_snapshot_goals_and_holdings(tmp_path):
+    data_dir = str(tmp_path)
+    source = JSONStorage(data_dir)
+    source.save_snapshot(SNAPSHOT)
+    for goal in GOALS:
+        source.add_goal(goal)
+    source.add_holdings(HOLDINGS)
+
+    assert migrate_json_to_sqlite(data_dir)['migrated']
+    assert not migrate_json_to_sqlite(data_dir)['migrated']
+
+    # Re-import after the JSON side lost its snapshot and a goal
+    os.remove(source.snapshot_file)
+    save_json(source.goals_file, load_json(source.goals_file, [])[:1])
+    result = migrate_json_to_sqlite(data_dir, force=True)
+    assert result == {'migrated': True, 'snapshot': 0, 'goals': 1, 'holdings': 2}
+
+    target = SQLiteStorage(os.path.join(data_dir, 'financial_data.db'))
+    assert target.load_snapshot() == {}
+    assert without_ids(target.load_goals()) == GOALS[:1]
+    assert without_ids(target.load_portfolio()) == HOLDINGS
+    target.close()
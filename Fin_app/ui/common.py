@@ -0,0 +1,33 @@
+"""Storage handle, shared metrics, the snapshot graph and formatting helpers used across pages"""
+import streamlit as st
+
+from core.financial_metrics import financial_metrics
+from core.snapshot_graph import build_snapshot_graph, snapshot_inputs
+from core.storage import get_storage
+from ui.engines import get_predictor, get_tax_planner
+from ui.hydration import hydrate
+
+# --- Data Persistence ---
+# Backend is picked with FIN_APP_STORAGE ('sqlite' by default, 'json' for the legacy files)
+storage = get_storage()
+
+
+def session_metrics():
+    """FinancialMetrics for this session's snapshot, goals and portfolio (memoised by content)"""
+    hydrate('user_data', 'goals', 'portfolio')
+    return financial_metrics(st.session_state.user_data, st.session_state.goals, st.session_state.portfolio)
+
+
+def snapshot_graph():
+    """This session's reactive graph, with only the nodes affected by snapshot or goal edits invalidated"""
+    hydrate('user_data', 'goals')
+    if 'snapshot_graph' not in st.session_state:
+        st.session_state.snapshot_graph = build_snapshot_graph(get_predictor(), get_tax_planner())
+    graph = st.session_state.snapshot_graph
+    graph.update(snapshot_inputs(st.session_state.user_data, st.session_state.goals))
+    return graph
+
+
+def format_currency(amount):
+    """Format currency with Indian numbering system"""
+    return f"₹{amount:,.0f}"
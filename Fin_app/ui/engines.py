@@ -0,0 +1,38 @@
+"""Stateless engines shared by every session of the server process"""
+import streamlit as st
+
+from core.education import FinancialEducator
+from core.integrations import PortfolioIntegrator
+from core.predictor import MLFinancialPredictor
+from core.quiz import FinancialBehaviorQuiz
+from core.tax import TaxPlanner
+
+
+# --- Engines ---
+# Built once per process; none of them keeps per-call state, so sharing is thread-safe
+@st.cache_resource(show_spinner=False)
+def get_predictor():
+    return MLFinancialPredictor()
+
+@st.cache_resource(show_spinner=False)
+def get_quiz():
+    return FinancialBehaviorQuiz()
+
+@st.cache_resource(show_spinner=False)
+def get_tax_planner():
+    return TaxPlanner()
+
+@st.cache_resource(show_spinner=False)
+def get_educator():
+    return FinancialEducator()
+
+@st.cache_resource(show_spinner=False)
+def get_integrator():
+    return PortfolioIntegrator()
+
+# reportlab is imported with the generator, so only the Export page pays for it
+@st.cache_resource(show_spinner=False)
+def get_report_generator():
+    """Stylesheet built once, on the first report request"""
+    from core.reports import PDFReportGenerator
+    return PDFReportGenerator()
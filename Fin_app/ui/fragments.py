@@ -0,0 +1,45 @@
+"""Fragment-scoped reruns and the script time they save over full reruns"""
+import time
+from functools import wraps
+
+import streamlit as st
+
+# Interactions kept for the Developer page
+MAX_INTERACTIONS = 50
+
+
+def start_full_run():
+    """Called at the top of app.py; returns the start time for finish_full_run"""
+    st.session_state.full_run_done = False
+    return time.perf_counter()
+
+
+def finish_full_run(started):
+    """Called at the end of app.py with the time a full script run took"""
+    st.session_state.full_run_ms = (time.perf_counter() - started) * 1000
+    st.session_state.full_run_done = True
+
+
+def timed_fragment(func):
+    """st.fragment that records its own run time on fragment-only reruns"""
+    @st.fragment
+    @wraps(func)
+    def run(*args, **kwargs):
+        # A full run is still in progress while app.py renders the page; a widget
+        # inside the fragment reruns only this function after the full run finished
+        fragment_only = st.session_state.get('full_run_done', False)
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        if fragment_only:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            full_ms = st.session_state.get('full_run_ms', 0.0)
+            stats = st.session_state.setdefault('fragment_stats', [])
+            stats.append({
+                'Fragment': func.__name__.strip('_').replace('_', ' '),
+                'Fragment (ms)': elapsed_ms,
+                'Full script (ms)': full_ms,
+                'Saved (ms)': max(full_ms - elapsed_ms, 0.0)
+            })
+            del stats[:-MAX_INTERACTIONS]
+        return result
+    return run
@@ -0,0 +1,65 @@
+"""Lazy hydration of session state from the persisted datasets"""
+import os
+import time
+
+import streamlit as st
+
+from core.storage import get_storage
+
+# session_state key -> (dataset name, storage loader)
+DATASETS = {
+    'user_data': ('snapshot', 'load_snapshot'),
+    'goals': ('goals', 'load_goals'),
+    'portfolio': ('portfolio', 'load_portfolio')
+}
+
+_parse_count = {'value': 0}
+
+
+def _files_version(paths):
+    """mtime/size fingerprint of the files backing a dataset"""
+    version = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            version.append((path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            version.append((path, None, None))
+    return tuple(version)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _load_dataset(backend, data_dir, dataset, version):
+    """Parse one dataset; cached per file version so reruns and sessions share it"""
+    _parse_count['value'] += 1
+    loader = dict(DATASETS.values())[dataset]
+    return getattr(get_storage(backend, data_dir), loader)()
+
+
+def hydrate(*keys):
+    """Load the given session_state keys from storage the first time a page needs them"""
+    if 'hydrated' not in st.session_state:
+        st.session_state.hydrated = set()
+        st.session_state.hydration_stats = []
+    storage = get_storage()
+
+    for key in keys:
+        if key in st.session_state.hydrated:
+            continue
+        dataset, _ = DATASETS[key]
+
+        start = time.perf_counter()
+        version = _files_version(storage.data_files()[dataset])
+        parses_before = _parse_count['value']
+        data = _load_dataset(storage.name, storage.data_dir, dataset, version)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        st.session_state[key] = data
+        st.session_state.hydrated.add(key)
+        st.session_state.hydration_stats.append({
+            'Dataset': dataset,
+            'Backend': storage.name,
+            'Records': len(data),
+            'Time (ms)': elapsed_ms,
+            'Source': 'parsed' if _parse_count['value'] > parses_before else 'cache'
+        })
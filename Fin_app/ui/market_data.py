@@ -0,0 +1,30 @@
+"""Cached fund universe, NAV store and fund metrics shared by the pages"""
+import streamlit as st
+
+from core.fund_metrics import fund_metrics, metrics_table
+from core.fund_universe import FUND_UNIVERSE_FILE, FundUniverse, file_version
+from core.nav_store import NavStore
+
+
+# --- Fund Universe ---
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_fund_universe(path, version):
+    """Parsed and indexed once per file version; shared read-only across sessions"""
+    return FundUniverse.load(path)
+
+def get_mutual_fund_data():
+    """Fund universe, reloaded when the file's mtime or size changes"""
+    return _load_fund_universe(FUND_UNIVERSE_FILE, file_version(FUND_UNIVERSE_FILE))
+
+# --- NAV Store ---
+@st.cache_resource(show_spinner=False, max_entries=2)
+def get_nav_store(version):
+    """Memory-mapped NAV history, reopened only after an ingest publishes a new version"""
+    return NavStore()
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def get_fund_comparison(universe_version, nav_version):
+    """Fund universe joined with the materialised NAV metrics, indexed by fund name"""
+    funds = get_mutual_fund_data()
+    metrics = fund_metrics(metrics_table(), funds.table['Fund Name'])
+    return funds.table.set_index('Fund Name').join(metrics.drop(columns=['Scheme Name'], errors='ignore'))
@@ -0,0 +1,60 @@
+"""Cached sensitivity grids and the heatmap and tornado charts built from them"""
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from core.financial_metrics import content_hash
+from core.sensitivity import GRID_STEP_UPS, goal_required_sip, required_sip_grid, tornado
+from ui.theme import apply_plotly_theme
+
+# Tornado hover: the input value tried and the outcome it gives
+HOVER = '%{y} = %{customdata[0]}: ₹%{customdata[1]:,.0f}<extra></extra>'
+
+
+# --- Grids ---
+@st.cache_data(show_spinner=False, max_entries=64)
+def _goal_sensitivity(goal_hash, _goal, step_up, inflation):
+    """Required-SIP grid and tornado for one goal; goal_hash is the cache key, _goal is not hashed"""
+    grid = required_sip_grid(_goal['amount'], inflation)
+    base = {'target_amount': _goal['amount'], 'expected_return': _goal['return'], 'years': _goal['years'],
+            'step_up': step_up, 'inflation': inflation}
+    return grid, tornado(goal_required_sip, base, ['expected_return', 'years', 'step_up', 'inflation'])
+
+
+def goal_sensitivity(goal, step_up=0, inflation=0):
+    """Cached per goal content, so switching between goals is a lookup"""
+    key = content_hash({name: goal[name] for name in ('amount', 'years', 'return')})
+    return _goal_sensitivity(key, goal, step_up, inflation)
+
+
+# --- Charts ---
+def sensitivity_heatmap(grid, step_up, base_return, base_years, title, value_label):
+    """Returns x years slice of the grid at the closest step-up, with the base case marked"""
+    step_index = int(np.abs(GRID_STEP_UPS - step_up).argmin())
+    fig = go.Figure(go.Heatmap(
+        z=grid.values[:, :, step_index], x=grid.years, y=grid.returns, colorscale='Viridis',
+        colorbar=dict(title=value_label),
+        hovertemplate='%{y}% for %{x} years: ₹%{z:,.0f}<extra></extra>'
+    ))
+    fig.add_trace(go.Scatter(x=[base_years], y=[base_return], mode='markers', name='Your plan',
+                             marker=dict(symbol='x', size=14, color='#ef4444')))
+    fig.update_layout(title=f"{title} at {GRID_STEP_UPS[step_index]}% step-up",
+                      xaxis_title='Years', yaxis_title='Expected Return (%)', showlegend=False)
+    return apply_plotly_theme(fig)
+
+
+def tornado_chart(bars, base_value, title):
+    """Bars from the base outcome to the outcome at each input's low and high value, largest swing on top"""
+    bars = bars[::-1]
+    labels = [bar.input for bar in bars]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(y=labels, x=[bar.low - base_value for bar in bars], base=base_value, orientation='h',
+                         name='Low input', marker_color='#f59e0b',
+                         customdata=[[bar.low_input, bar.low] for bar in bars],
+                         hovertemplate=HOVER))
+    fig.add_trace(go.Bar(y=labels, x=[bar.high - base_value for bar in bars], base=base_value, orientation='h',
+                         name='High input', marker_color='#6366f1',
+                         customdata=[[bar.high_input, bar.high] for bar in bars],
+                         hovertemplate=HOVER))
+    fig.update_layout(title=title, barmode='overlay', xaxis_title='₹', showlegend=True)
+    return apply_plotly_theme(fig)
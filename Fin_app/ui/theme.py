@@ -0,0 +1,458 @@
+"""Page styling: the app-wide CSS and the shared Plotly layout"""
+
+# Super Impressive Enhanced Light Theme
+APP_CSS = """
+<style>
+    /* Global styles */
+    .main {
+        background-color: #ffffff;
+    }
+    
+    .stApp {
+        background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%);
+    }
+    
+    .main .block-container {
+        background-color: #ffffff;
+        padding: 2.5rem 1.5rem;
+        border-radius: 20px;
+        box-shadow: 0 8px 40px rgba(0,0,0,0.12);
+        margin: 1.5rem auto;
+        max-width: 1400px;
+        border: 1px solid #f1f5f9;
+    }
+    
+    /* Perfect text visibility */
+    h1, h2, h3, h4, h5, h6 {
+        color: #1e293b !important;
+        font-weight: 700 !important;
+        font-family: 'Inter', sans-serif;
+    }
+    
+    h1 { font-size: 2.75rem !important; margin-bottom: 1rem !important; }
+    h2 { font-size: 2.25rem !important; margin-bottom: 0.75rem !important; }
+    h3 { font-size: 1.75rem !important; margin-bottom: 0.5rem !important; }
+    h4 { font-size: 1.5rem !important; margin-bottom: 0.5rem !important; }
+    
+    p, div, span, label, .stMarkdown, .stText {
+        color: #374151 !important;
+        font-family: 'Inter', sans-serif;
+        font-size: 1.1rem;
+        line-height: 1.7;
+    }
+    
+    /* Enhanced widget styling */
+    .stNumberInput>div>div>input, .stTextInput>div>div>input {
+        color: #1e293b !important;
+        background-color: #ffffff !important;
+        border: 2.5px solid #e2e8f0 !important;
+        border-radius: 12px !important;
+        font-size: 1.1rem !important;
+        font-weight: 500 !important;
+        padding: 14px 18px !important;
+    }
+    
+    .stSelectbox>div>div>select {
+        color: #1e293b !important;
+        background-color: #ffffff !important;
+        border: 2.5px solid #e2e8f0 !important;
+        border-radius: 12px !important;
+        font-size: 1.1rem !important;
+        font-weight: 500 !important;
+        padding: 12px !important;
+    }
+    
+    .stSlider>div>div>div>div {
+        background: linear-gradient(90deg, #3b82f6, #8b5cf6) !important;
+        height: 8px !important;
+        border-radius: 10px !important;
+    }
+    
+    .stButton>button {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        border-radius: 14px;
+        padding: 16px 32px;
+        font-weight: 700;
+        font-size: 1.1rem;
+        transition: all 0.4s ease;
+        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
+        margin: 8px 0;
+    }
+    
+    .stButton>button:hover {
+        background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
+        transform: translateY(-3px);
+        box-shadow: 0 12px 30px rgba(102, 126, 234, 0.6);
+    }
+    
+    /* Enhanced metric cards */
+    .metric-card {
+        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
+        border: 2.5px solid #f1f5f9;
+        border-radius: 20px;
+        padding: 2.5rem;
+        margin: 1.5rem 0;
+        box-shadow: 0 8px 30px rgba(0,0,0,0.08);
+        transition: all 0.4s ease;
+        text-align: center;
+        position: relative;
+        overflow: hidden;
+    }
+    
+    .metric-card::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        height: 4px;
+        background: linear-gradient(90deg, #667eea, #764ba2);
+    }
+    
+    .metric-card:hover {
+        transform: translateY(-8px);
+        box-shadow: 0 20px 50px rgba(0,0,0,0.15);
+        border-color: #3b82f6;
+    }
+    
+    .metric-value {
+        font-size: 3rem !important;
+        font-weight: 800 !important;
+        color: #1e293b !important;
+        margin: 1rem 0;
+        background: linear-gradient(135deg, #667eea, #764ba2);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+    }
+    
+    .metric-label {
+        font-size: 1.3rem !important;
+        font-weight: 600 !important;
+        color: #64748b !important;
+        margin-bottom: 1rem;
+    }
+    
+    /* Enhanced custom components */
+    .ml-insight {
+        background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%);
+        border: 3px solid #7dd3fc;
+        border-radius: 16px;
+        padding: 1.75rem;
+        margin: 1.25rem 0;
+        color: #0c4a6e !important;
+        font-weight: 600;
+        font-size: 1.1rem;
+        box-shadow: 0 6px 20px rgba(125, 211, 252, 0.2);
+        border-left: 6px solid #0ea5e9;
+    }
+    
+    .financial-sticker {
+        background: linear-gradient(135deg, #f0fdf4 0%, #dcfce7 100%);
+        border: 3px solid #86efac;
+        border-radius: 16px;
+        padding: 1.75rem;
+        margin: 1.25rem 0;
+        color: #166534 !important;
+        font-weight: 600;
+        font-size: 1.1rem;
+        box-shadow: 0 6px 20px rgba(134, 239, 172, 0.2);
+        border-left: 6px solid #22c55e;
+    }
+    
+    .ai-prediction {
+        background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);
+        border: 3px solid #fcd34d;
+        border-radius: 16px;
+        padding: 1.75rem;
+        margin: 1.25rem 0;
+        color: #92400e !important;
+        font-weight: 600;
+        font-size: 1.1rem;
+        box-shadow: 0 6px 20px rgba(252, 211, 77, 0.2);
+        border-left: 6px solid #f59e0b;
+    }
+    
+    .recommendation-card {
+        background: linear-gradient(135deg, #faf5ff 0%, #f3e8ff 100%);
+        border: 3px solid #c4b5fd;
+        border-radius: 16px;
+        padding: 1.75rem;
+        margin: 1.25rem 0;
+        color: #5b21b6 !important;
+        font-weight: 600;
+        font-size: 1.1rem;
+        box-shadow: 0 6px 20px rgba(196, 181, 253, 0.2);
+        border-left: 6px solid #8b5cf6;
+    }
+    
+    /* Quiz specific styling */
+    .quiz-question {
+        background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%);
+        border: 3px solid #7dd3fc;
+        border-radius: 20px;
+        padding: 2.5rem;
+        margin: 2rem 0;
+        box-shadow: 0 8px 30px rgba(125, 211, 252, 0.25);
+    }
+    
+    .quiz-option {
+        background: white;
+        border: 2.5px solid #e2e8f0;
+        border-radius: 14px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        cursor: pointer;
+        transition: all 0.3s ease;
+        font-weight: 600;
+        font-size: 1.1rem;
+    }
+    
+    .quiz-option:hover {
+        border-color: #3b82f6;
+        background-color: #f0f9ff;
+        transform: translateY(-3px);
+        box-shadow: 0 6px 20px rgba(59, 130, 246, 0.15);
+    }
+    
+    .quiz-option.selected {
+        border-color: #3b82f6;
+        background: linear-gradient(135deg, #dbeafe 0%, #93c5fd 100%);
+        color: #1e40af;
+        font-weight: 700;
+        transform: translateY(-2px);
+    }
+    
+    /* Personality result cards */
+    .personality-conservative {
+        background: linear-gradient(135deg, #dbeafe 0%, #93c5fd 100%);
+        border: 4px solid #3b82f6;
+        border-radius: 24px;
+        padding: 3rem;
+        margin: 2rem 0;
+        text-align: center;
+        box-shadow: 0 12px 40px rgba(59, 130, 246, 0.25);
+    }
+    
+    .personality-moderate {
+        background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);
+        border: 4px solid #f59e0b;
+        border-radius: 24px;
+        padding: 3rem;
+        margin: 2rem 0;
+        text-align: center;
+        box-shadow: 0 12px 40px rgba(245, 158, 11, 0.25);
+    }
+    
+    .personality-aggressive {
+        background: linear-gradient(135deg, #fecaca 0%, #fca5a5 100%);
+        border: 4px solid #ef4444;
+        border-radius: 24px;
+        padding: 3rem;
+        margin: 2rem 0;
+        text-align: center;
+        box-shadow: 0 12px 40px rgba(239, 68, 68, 0.25);
+    }
+    
+    .personality-balanced {
+        background: linear-gradient(135deg, #bbf7d0 0%, #86efac 100%);
+        border: 4px solid #22c55e;
+        border-radius: 24px;
+        padding: 3rem;
+        margin: 2rem 0;
+        text-align: center;
+        box-shadow: 0 12px 40px rgba(34, 197, 94, 0.25);
+    }
+    
+    /* Enhanced progress bars */
+    .stProgress > div > div > div > div {
+        background: linear-gradient(90deg, #3b82f6, #8b5cf6) !important;
+        border-radius: 12px !important;
+        height: 10px !important;
+    }
+    
+    /* Mobile responsiveness */
+    @media (max-width: 768px) {
+        .main .block-container {
+            padding: 1.5rem 1rem;
+            margin: 1rem;
+        }
+        
+        .metric-card {
+            padding: 2rem;
+            margin: 1rem 0;
+        }
+        
+        .metric-value {
+            font-size: 2.5rem !important;
+        }
+    }
+    
+    /* Plotly graph enhancements */
+    .js-plotly-plot .plotly, .js-plotly-plot .plotly div {
+        background-color: transparent !important;
+    }
+    
+    /* Enhanced social links */
+    .social-link {
+        display: inline-block;
+        padding: 18px 28px;
+        margin: 10px;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white !important;
+        text-decoration: none;
+        border-radius: 14px;
+        transition: all 0.4s ease;
+        text-align: center;
+        font-weight: 700;
+        font-size: 1.1rem;
+        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
+    }
+    
+    .social-link:hover {
+        transform: translateY(-4px);
+        box-shadow: 0 12px 30px rgba(102, 126, 234, 0.6);
+        color: white !important;
+        text-decoration: none;
+    }
+    
+    /* Data table enhancements */
+    .dataframe {
+        border-radius: 16px !important;
+        overflow: hidden !important;
+        box-shadow: 0 8px 30px rgba(0,0,0,0.12) !important;
+        font-size: 1.1rem !important;
+    }
+    
+    /* Section headers */
+    .section-header {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 20px;
+        margin: 2.5rem 0 1.5rem 0;
+        text-align: center;
+        box-shadow: 0 8px 30px rgba(102, 126, 234, 0.4);
+    }
+    
+    /* Welcome message */
+    .welcome-message {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 3rem;
+        border-radius: 24px;
+        margin: 2rem 0;
+        text-align: center;
+        box-shadow: 0 12px 40px rgba(102, 126, 234, 0.4);
+    }
+    
+    /* Tab enhancements */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 12px;
+        padding: 0 1rem;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        height: 70px;
+        white-space: pre-wrap;
+        background-color: #f8fafc;
+        border-radius: 16px 16px 0 0;
+        gap: 10px;
+        padding: 20px 24px;
+        font-weight: 700;
+        font-size: 1.1rem;
+        border: 2px solid #e2e8f0;
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
+        color: white !important;
+        border-color: #667eea !important;
+    }
+    
+    /* Form enhancements */
+    .stForm {
+        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
+        border: 2.5px solid #f1f5f9;
+        border-radius: 20px;
+        padding: 2.5rem;
+        margin: 2rem 0;
+        box-shadow: 0 8px 30px rgba(0,0,0,0.08);
+    }
+    
+    /* Educational tooltip styles */
+    .tooltip-container {
+        position: relative;
+        display: inline-block;
+        cursor: help;
+    }
+    
+    .tooltip-text {
+        visibility: hidden;
+        width: 300px;
+        background-color: #1e293b;
+        color: white;
+        text-align: center;
+        border-radius: 12px;
+        padding: 12px;
+        position: absolute;
+        z-index: 1;
+        bottom: 125%;
+        left: 50%;
+        margin-left: -150px;
+        opacity: 0;
+        transition: opacity 0.3s;
+        font-size: 0.9rem;
+        box-shadow: 0 8px 25px rgba(0,0,0,0.2);
+    }
+    
+    .tooltip-container:hover .tooltip-text {
+        visibility: visible;
+        opacity: 1;
+    }
+</style>
+"""
+
+
+def apply_plotly_theme(fig):
+    """Apply consistent theme to all Plotly charts"""
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(
+            family="Inter, sans-serif",
+            size=16,
+            color="#1e293b"
+        ),
+        title=dict(
+            font=dict(
+                size=22,
+                color="#1e293b",
+                family="Inter, sans-serif"
+            ),
+            x=0.5,
+            xanchor='center'
+        ),
+        legend=dict(
+            bgcolor='rgba(255,255,255,0.95)',
+            bordercolor='#e2e8f0',
+            borderwidth=2,
+            font=dict(
+                size=14,
+                color="#374151"
+            )
+        ),
+        xaxis=dict(
+            gridcolor='#e2e8f0',
+            gridwidth=2,
+            tickfont=dict(size=14, color="#64748b")
+        ),
+        yaxis=dict(
+            gridcolor='#e2e8f0',
+            gridwidth=2,
+            tickfont=dict(size=14, color="#64748b")
+        )
+    )
+    return fig
@@ -0,0 +1 @@
+"""Page modules; app.py imports each one the first time its page is opened."""
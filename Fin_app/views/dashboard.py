@@ -0,0 +1,108 @@
+"""📈 Dashboard: health metrics and spending breakdown"""
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from ui.common import format_currency, session_metrics, snapshot_graph
+from ui.theme import apply_plotly_theme
+
+
+def render():
+    st.header('📈 Financial Dashboard')
+    
+    if not st.session_state.user_data:
+        st.warning("🚨 No financial snapshot found. Please create one in 'Snapshot' first!")
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Get Started with Your Financial Journey!</h3>
+            <p>Create your financial snapshot to unlock personalized insights and recommendations.</p>
+            <p><strong>🔒 All your data remains 100% private</strong></p>
+            <p><strong>👇 Scroll down and click on "📊 Snapshot" to enter your details!</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Show navigation reminder
+        st.markdown("---")
+        st.markdown("### 🚀 Quick Navigation")
+        nav_cols = st.columns(3)
+        with nav_cols[1]:
+            if st.button("📊 Go to Snapshot", use_container_width=True):
+                st.session_state.current_page = "📊 Snapshot"
+                st.rerun()
+    else:
+        user_data = st.session_state.user_data
+        metrics = session_metrics()
+        graph = snapshot_graph()
+        
+        # Top Metrics Row
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.markdown(f"""
+            <div class='metric-card'>
+                <div class='metric-label'>💰 Monthly Income</div>
+                <div class='metric-value'>{format_currency(metrics.monthly_income)}</div>
+                <p>Gross monthly earnings</p>
+            </div>
+            """, unsafe_allow_html=True)
+        with col2:
+            st.markdown(f"""
+            <div class='metric-card'>
+                <div class='metric-label'>📊 Savings Rate</div>
+                <div class='metric-value'>{metrics.savings_rate:.1f}%</div>
+                <p>Of monthly income saved</p>
+            </div>
+            """, unsafe_allow_html=True)
+        with col3:
+            risk_profile, _, risk_score, _, _ = graph.value('risk_profile')
+            st.markdown(f"""
+            <div class='metric-card'>
+                <div class='metric-label'>🛡️ Risk Profile</div>
+                <div class='metric-value'>{risk_profile}</div>
+                <p>Score: {risk_score:.1f}/10</p>
+            </div>
+            """, unsafe_allow_html=True)
+        with col4:
+            st.markdown(f"""
+            <div class='metric-card'>
+                <div class='metric-label'>🏦 Net Worth</div>
+                <div class='metric-value'>{format_currency(metrics.net_worth)}</div>
+                <p>Total assets minus liabilities</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Recommendations Section
+        st.markdown("### 💡 AI Recommendations")
+        recommendations = graph.value('recommendations')
+        for rec in recommendations:
+            st.markdown(f"""
+            <div class='recommendation-card'>
+                {rec}
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Expense Analysis
+        st.markdown("### 💸 Expense Analysis")
+        expense_data = {k: v for k, v in user_data.get('expenses', {}).items() if v > 0}
+        if expense_data:
+            col1, col2 = st.columns(2)
+            with col1:
+                fig = go.Figure(go.Pie(values=list(expense_data.values()),
+                                       labels=list(expense_data.keys())))
+                fig.update_layout(title='Expense Distribution')
+                fig = apply_plotly_theme(fig)
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                # Expense breakdown table
+                expense_df = pd.DataFrame({
+                    'Category': list(expense_data.keys()),
+                    'Amount': list(expense_data.values()),
+                    'Percentage': [(v/sum(expense_data.values()))*100 for v in expense_data.values()]
+                }).sort_values('Amount', ascending=False)
+                
+                st.dataframe(expense_df.style.format({
+                    'Amount': '₹{:,.0f}',
+                    'Percentage': '{:.1f}%'
+                }), use_container_width=True)
+        else:
+            st.info("💡 No expense data available. Add your expenses in the Snapshot section.")
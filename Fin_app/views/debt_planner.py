@@ -0,0 +1,144 @@
+"""💳 Debt planner"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from core.financial_metrics import content_hash
+from core.loans import STRATEGIES, month_label, payoff_timeline, prepayment_sweep, snapshot_loans
+from ui.common import format_currency, snapshot_graph
+from ui.fragments import timed_fragment
+from ui.theme import apply_plotly_theme
+
+STRATEGY_LABELS = {'avalanche': '🏔️ Avalanche (highest rate first)', 'snowball': '⛄ Snowball (smallest balance first)'}
+STRATEGY_COLORS = {'avalanche': '#6366f1', 'snowball': '#f59e0b'}
+SWEEP_POINTS = 501
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _sweep(loans_hash, _loans, max_extra):
+    """Prepayment sweep over SWEEP_POINTS extra amounts; loans_hash is the cache key, _loans is not hashed"""
+    return prepayment_sweep(_loans, np.linspace(0.0, max_extra, SWEEP_POINTS))
+
+
+@timed_fragment
+def _prepayment(loans):
+    """Interest saved by extra payments under each strategy; the slider reruns only this fragment"""
+    st.markdown("### 📉 Prepayment Planner")
+    surplus = max(float(snapshot_graph().value('monthly_savings')), 0.0)
+    # Up to twice the surplus, in multiples of 50,000 so the sweep's steps are round amounts
+    max_extra = float(max(np.ceil(surplus * 2 / 50000), 1) * 50000)
+    sweep = _sweep(content_hash(loans), loans, max_extra)
+
+    control_cols = st.columns([2, 1])
+    with control_cols[0]:
+        extra = st.slider('Extra monthly payment (₹)', 0.0, max_extra, float(np.round(surplus / 2, -3)),
+                          step=max_extra / (SWEEP_POINTS - 1), key='debt_extra')
+    with control_cols[1]:
+        strategy = st.radio('Strategy', STRATEGIES, format_func=STRATEGY_LABELS.__getitem__, key='debt_strategy')
+    s = STRATEGIES.index(strategy)
+    i = int(np.abs(sweep.extras - extra).argmin())
+    today = date.today()
+
+    metric_cols = st.columns(3)
+    with metric_cols[0]:
+        st.metric("Interest Saved", format_currency(sweep.interest_saved[s, i]))
+    with metric_cols[1]:
+        st.metric("Debt-Free By", month_label(sweep.debt_free_month[s, i], today),
+                  f"{sweep.baseline.payoff_month.max() - sweep.debt_free_month[s, i]:.0f} months sooner"
+                  if np.isfinite(sweep.baseline.payoff_month.max()) and np.isfinite(sweep.debt_free_month[s, i])
+                  else None)
+    with metric_cols[2]:
+        st.metric("Total Interest", format_currency(sweep.total_interest[s, i]),
+                  f"EMIs alone: {format_currency(sweep.baseline.total_interest.sum())}", delta_color='off')
+
+    # Interest-saved curve: every point is precomputed, so moving the slider only moves the marker
+    fig = go.Figure()
+    for k, name in enumerate(sweep.strategies):
+        fig.add_trace(go.Scatter(x=sweep.extras, y=sweep.interest_saved[k], mode='lines',
+                                 name=STRATEGY_LABELS[name], line=dict(color=STRATEGY_COLORS[name], width=3)))
+    fig.add_trace(go.Scatter(x=[sweep.extras[i]], y=[sweep.interest_saved[s, i]], mode='markers',
+                             name='Your choice', marker=dict(size=14, color='#ef4444')))
+    fig.update_layout(title='Interest Saved by Extra Monthly Payment', xaxis_title='Extra per month (₹)',
+                      yaxis_title='Interest saved (₹)', hovermode='x unified')
+    st.plotly_chart(apply_plotly_theme(fig), use_container_width=True)
+
+    st.dataframe(pd.DataFrame({
+        'Loan': [loan['name'] for loan in loans],
+        'EMIs Only': [month_label(m, today) for m in sweep.baseline.payoff_month],
+        **{STRATEGY_LABELS[name]: [month_label(m, today) for m in sweep.payoff_month[k, i]]
+           for k, name in enumerate(sweep.strategies)}
+    }), hide_index=True, use_container_width=True)
+
+    timeline = payoff_timeline(loans, sweep.extras[i], strategy)
+    fig = go.Figure()
+    for l, loan in enumerate(loans):
+        fig.add_trace(go.Scatter(x=timeline.month, y=timeline.balance[:, l], mode='lines', stackgroup='balance',
+                                 name=loan['name']))
+    fig.update_layout(title=f"Outstanding Balance — {STRATEGY_LABELS[strategy]}", xaxis_title='Month',
+                      yaxis_title='Balance (₹)', hovermode='x unified')
+    st.plotly_chart(apply_plotly_theme(fig), use_container_width=True)
+    st.caption("Each month every loan gets its EMI; the extra payment and the EMIs of loans already "
+               "cleared go to the next loan in the strategy's order.")
+
+
+def render():
+    st.header('💳 Debt Payoff Planner')
+
+    if not st.session_state.user_data:
+        st.warning("🚨 Please create a financial snapshot first to plan your loan payoff!")
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Become Debt-Free Sooner!</h3>
+            <p>Complete your financial snapshot with your loan balances to see EMI schedules and prepayment savings.</p>
+            <p><strong>🔒 Your loan details stay private</strong></p>
+            <p><strong>👇 Scroll down and click on "📊 Snapshot" to enter your details!</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Show navigation reminder
+        st.markdown("---")
+        st.markdown("### 🚀 Quick Navigation")
+        nav_cols = st.columns(3)
+        with nav_cols[1]:
+            if st.button("📊 Go to Snapshot", use_container_width=True):
+                st.session_state.current_page = "📊 Snapshot"
+                st.rerun()
+        return
+
+    loans = snapshot_loans(st.session_state.user_data)
+    if not loans:
+        st.success("🎉 No outstanding loans in your snapshot. Keep it that way!")
+        return
+
+    st.markdown("### 🏦 Your Loans")
+    # Rates and EMIs start from typical terms; keyed on the balances so a snapshot edit resets them
+    edited = st.data_editor(pd.DataFrame({
+        'Loan': [loan['name'] for loan in loans],
+        'Outstanding (₹)': [loan['balance'] for loan in loans],
+        'Interest Rate (%)': [loan['rate'] for loan in loans],
+        'EMI (₹)': [loan['emi'] for loan in loans]
+    }), disabled=['Loan', 'Outstanding (₹)'], hide_index=True, use_container_width=True,
+        column_config={
+            'Interest Rate (%)': st.column_config.NumberColumn(required=True, min_value=0.0, max_value=60.0,
+                                                               step=0.05, format='%.2f'),
+            'EMI (₹)': st.column_config.NumberColumn(required=True, min_value=0.0, step=100.0, format='%.0f')
+        },
+        key=f"debt_terms_{content_hash(loans)}")
+    # A cell cleared mid-edit comes back empty; leave that loan out until it is filled in again
+    terms = edited[['Outstanding (₹)', 'Interest Rate (%)', 'EMI (₹)']].apply(pd.to_numeric, errors='coerce')
+    complete = terms.notna().all(axis=1).to_numpy()
+    if not complete.all():
+        st.info(f"✏️ Enter a rate and EMI for {', '.join(edited['Loan'][~complete])} to include it in the plan.")
+    loans = [{'name': name, 'balance': float(balance), 'rate': float(rate), 'emi': float(instalment)}
+             for name, balance, rate, instalment in zip(edited['Loan'][complete], *terms[complete].to_numpy().T)]
+    if not loans:
+        return
+    short = [loan['name'] for loan in loans if loan['emi'] <= loan['balance'] * loan['rate'] / 1200]
+    if short:
+        st.warning(f"⚠️ The EMI does not cover the monthly interest on: {', '.join(short)}. "
+                   f"These loans never clear without extra payments.")
+
+    _prepayment(loans)
@@ -0,0 +1,110 @@
+"""👨‍💻 About the developer and session diagnostics"""
+import pandas as pd
+import streamlit as st
+
+from core.financial_metrics import metrics_cache_stats
+
+
+def render():
+    st.header('👨‍💻 About the Developer')
+    
+    # Developer Profile
+    st.markdown("""
+    <div style='text-align: center; padding: 2.5rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                border-radius: 24px; color: white; margin-bottom: 2.5rem;'>
+        <div style='font-size: 4.5rem; margin-bottom: 1.5rem;'>🤖</div>
+        <h1 style='color: white; margin-bottom: 0.75rem; font-size: 3rem;'>Ayush Shukla</h1>
+        <p style='font-size: 1.5rem; opacity: 0.95; margin-bottom: 0;'>Data Scientist & ML Engineer</p>
+        <p style='opacity: 0.9; font-size: 1.2rem;'>Building intelligent financial solutions with machine learning</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Clickable Social Links
+    st.markdown("### 📱 Connect & Collaborate")
+    
+    contact_cols = st.columns(4)
+    
+    with contact_cols[0]:
+        st.markdown("""
+        <a href="https://github.com/asdharupur1-boop/Finance_app" target="_blank" class="social-link">
+            <div style='font-size: 2.5rem;'>🐙</div>
+            <p><strong>GitHub</strong></p>
+            <p style='font-size: 1rem;'>ayushshukla</p>
+        </a>
+        """, unsafe_allow_html=True)
+    
+    with contact_cols[1]:
+        st.markdown("""
+        <a href="https://www.linkedin.com/in/ayush-shukla-890072337/" target="_blank" class="social-link">
+            <div style='font-size: 2.5rem;'>💼</div>
+            <p><strong>LinkedIn</strong></p>
+            <p style='font-size: 1rem;'>ayushshukla</p>
+        </a>
+        """, unsafe_allow_html=True)
+    
+    with contact_cols[2]:
+        st.markdown("""
+        <a href="Asdharupur1@gmail.com" class="social-link">
+            <div style='font-size: 2.5rem;'>📧</div>
+            <p><strong>Email</strong></p>
+            <p style='font-size: 1rem;'>Contact Me</p>
+        </a>
+        """, unsafe_allow_html=True)
+    
+    with contact_cols[3]:
+        st.markdown("""
+        <a href="https://github.com/asdharupur1-boop" target="_blank" class="social-link">
+            <div style='font-size: 2.5rem;'>🌐</div>
+            <p><strong>Portfolio</strong></p>
+            <p style='font-size: 1rem;'>Ayush Shukla</p>
+        </a>
+        """, unsafe_allow_html=True)
+    
+    # Hydration diagnostics
+    st.markdown("### ⚙️ Data Hydration")
+    hydration_stats = st.session_state.get('hydration_stats', [])
+    if hydration_stats:
+        st.dataframe(pd.DataFrame(hydration_stats).style.format({
+            'Time (ms)': '{:.2f}'
+        }), use_container_width=True)
+        st.caption(f"Total hydration time this session: {sum(h['Time (ms)'] for h in hydration_stats):.2f} ms")
+    else:
+        st.info("No datasets hydrated yet in this session.")
+
+    # Derived metrics cache (process-wide, shared by every session)
+    st.markdown("### 🧮 Financial Metrics Cache")
+    cache_stats = metrics_cache_stats()
+    lookups = cache_stats['hits'] + cache_stats['misses']
+    cache_cols = st.columns(3)
+    with cache_cols[0]:
+        st.metric("Hits", cache_stats['hits'])
+    with cache_cols[1]:
+        st.metric("Misses", cache_stats['misses'])
+    with cache_cols[2]:
+        st.metric("Hit Rate", f"{cache_stats['hits'] / lookups * 100:.0f}%" if lookups else "-")
+    st.caption(f"{cache_stats['size']} of {cache_stats['maxsize']} entries in use")
+
+    # Reactive snapshot graph
+    st.markdown("### 🕸️ Snapshot Computation Graph")
+    graph = st.session_state.get('snapshot_graph')
+    if graph is not None:
+        st.graphviz_chart(graph.to_dot(), use_container_width=True)
+        st.caption("Boxes are snapshot fields; highlighted nodes were invalidated by the last edit: "
+                   + (', '.join(graph.invalidated) or 'none'))
+        st.dataframe(pd.DataFrame(graph.node_stats()).style.format({
+            'Last (ms)': '{:.3f}', 'Total (ms)': '{:.3f}'
+        }), use_container_width=True)
+    else:
+        st.info("The graph is built the first time a page reads a derived value, e.g. the Dashboard.")
+
+    # Fragment rerun diagnostics
+    st.markdown("### ⚡ Fragment Reruns")
+    fragment_stats = st.session_state.get('fragment_stats', [])
+    if fragment_stats:
+        st.dataframe(pd.DataFrame(fragment_stats).style.format({
+            'Fragment (ms)': '{:.2f}', 'Full script (ms)': '{:.2f}', 'Saved (ms)': '{:.2f}'
+        }), use_container_width=True)
+        st.caption(f"Script time saved this session by {len(fragment_stats)} fragment-only reruns: "
+                   f"{sum(f['Saved (ms)'] for f in fragment_stats):.0f} ms")
+    else:
+        st.info("No fragment-only reruns yet. Calculators, the goals list and the goal cards rerun on their own.")
@@ -0,0 +1,97 @@
+"""📥 Export: PDF report and JSON data download"""
+import json
+from datetime import datetime
+
+import streamlit as st
+
+from ui.common import snapshot_graph
+from ui.engines import get_report_generator
+
+
+def render():
+    st.header('📥 Export Reports & Data')
+    
+    if not st.session_state.user_data:
+        st.warning("🚨 Please create a financial snapshot first to generate reports!")
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Comprehensive Reports Await Your Data!</h3>
+            <p>Complete your financial snapshot to generate detailed PDF reports with analysis and recommendations.</p>
+            <p><strong>🔒 All reports are generated locally on your device</strong></p>
+            <p><strong>👇 Scroll down and click on "📊 Snapshot" to enter your details!</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Show navigation reminder
+        st.markdown("---")
+        st.markdown("### 🚀 Quick Navigation")
+        nav_cols = st.columns(3)
+        with nav_cols[1]:
+            if st.button("📊 Go to Snapshot", use_container_width=True):
+                st.session_state.current_page = "📊 Snapshot"
+                st.rerun()
+    else:
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Generate Comprehensive Financial Reports</h3>
+            <p>Download detailed PDF reports with your financial data, analysis, and personalized recommendations.</p>
+            <p><strong>🔒 Reports are generated locally - your data never leaves your device</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 📄 PDF Report Options")
+            
+            if st.button('📊 Generate Comprehensive PDF Report', use_container_width=True):
+                pdf_generator = get_report_generator()
+                
+                # Prepare ML insights
+                risk_profile, _, risk_score, _, _ = snapshot_graph().value('risk_profile')
+                ml_insights = {
+                    'risk_profile': risk_profile,
+                    'risk_score': risk_score
+                }
+                
+                # Prepare quiz results
+                quiz_results = st.session_state.get('quiz_results')
+                
+                # Generate PDF
+                pdf_data = pdf_generator.create_comprehensive_pdf(
+                    st.session_state.user_data,
+                    st.session_state.goals,
+                    st.session_state.portfolio,
+                    quiz_results,
+                    ml_insights
+                )
+                
+                st.download_button(
+                    '📥 Download Comprehensive PDF Report', 
+                    pdf_data, 
+                    f'financial_report_{datetime.now().strftime("%Y%m%d")}.pdf', 
+                    'application/pdf'
+                )
+                
+                st.success("✅ PDF report generated successfully! Click the download button above.")
+
+        with col2:
+            st.markdown("### 💾 Data Export")
+            if st.button('📁 Download Snapshot JSON', use_container_width=True):
+                snapshot_json = json.dumps(st.session_state.user_data, indent=2).encode('utf-8')
+                st.download_button(
+                    '📥 Download JSON', 
+                    snapshot_json, 
+                    'financial_snapshot.json', 
+                    'application/json'
+                )
+            
+            if st.session_state.goals:
+                if st.button('🎯 Download Goals Data', use_container_width=True):
+                    goals_json = json.dumps(st.session_state.goals, indent=2).encode('utf-8')
+                    st.download_button(
+                        '📥 Download Goals JSON', 
+                        goals_json, 
+                        'financial_goals.json', 
+                        'application/json'
+                    )
@@ -0,0 +1,270 @@
+"""🎯 Goals and SIP planner"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from core.allocator import OBJECTIVES, allocate_from_curves, evaluate_split, goal_curves
+from core.financial_metrics import content_hash
+from core.projection import (cash_flow_projection, final_values, required_lumpsum, required_plan_sip,
+                             required_return, required_sip, required_years)
+from ui.common import format_currency, snapshot_graph, storage
+from ui.fragments import timed_fragment
+from ui.sensitivity import goal_sensitivity, sensitivity_heatmap, tornado_chart
+from ui.theme import apply_plotly_theme
+
+
+@timed_fragment
+def _goals_list():
+    """Goals overview and list; the plan sliders rerun only this fragment, deleting a goal reruns the page"""
+    if st.session_state.goals:
+        # Goals Overview
+        total_goals_value = sum(g['amount'] for g in st.session_state.goals)
+        avg_years = np.mean([g['years'] for g in st.session_state.goals])
+
+        st.markdown("### 📊 Goals Overview")
+        overview_cols = st.columns(3)
+        with overview_cols[0]:
+            st.metric("Total Goals", len(st.session_state.goals))
+        with overview_cols[1]:
+            st.metric("Total Target", format_currency(total_goals_value))
+        with overview_cols[2]:
+            st.metric("Average Timeline", f"{avg_years:.1f} years")
+
+        # Goals List with Progress
+        st.markdown("### 📋 Your Financial Goals")
+        plan_cols = st.columns(2)
+        with plan_cols[0]:
+            step_up = st.slider('Annual SIP Step-up (%)', 0, 25, 0, key='goals_step_up',
+                                help='Raise every SIP by this much at the start of each year')
+        with plan_cols[1]:
+            inflation = st.slider('Inflation (%)', 0.0, 10.0, 0.0, step=0.5, key='goals_inflation',
+                                  help='Targets are in today\'s money and grow with inflation until the goal date')
+
+        # Starting SIP and month-by-month plan for every goal in one vectorized call each
+        targets = np.array([g['amount'] for g in st.session_state.goals], dtype=float)
+        timelines = np.array([g['years'] for g in st.session_state.goals], dtype=float)
+        returns = np.array([g['return'] for g in st.session_state.goals], dtype=float)
+        sips = required_plan_sip(targets, timelines, returns, step_up, inflation)
+        flows = cash_flow_projection(sips, timelines, returns, step_up, inflation, target=targets)
+        total_investments = final_values(flows.invested, timelines)
+        potential_growths = flows.target - total_investments
+
+        for i, goal in enumerate(st.session_state.goals):
+            sip = sips[i]
+            total_investment = total_investments[i]
+            potential_growth = potential_growths[i]
+
+            with st.container():
+                col1, col2, col3 = st.columns([3, 2, 1])
+
+                with col1:
+                    st.markdown(f"""
+                    <div class='metric-card'>
+                        <h4>🎯 {goal['name']}</h4>
+                        <p>💰 Target: <strong>{format_currency(goal['amount'])}</strong> | 
+                           📅 Timeline: <strong>{goal['years']} years</strong> | 
+                           📈 Expected Return: <strong>{goal['return']}%</strong></p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                with col2:
+                    st.markdown(f"""
+                    <div class='financial-sticker'>
+                        <p><strong>💸 {'Starting ' if step_up else ''}Monthly SIP Required:</strong> {format_currency(sip)}</p>
+                        {f"<p><strong>📈 Target at Goal Date:</strong> {format_currency(flows.target[i])}</p>" if inflation else ''}
+                        <p><strong>💰 Total Investment:</strong> {format_currency(total_investment)}</p>
+                        <p><strong>📊 Potential Growth:</strong> {format_currency(potential_growth)}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                with col3:
+                    if st.button('🗑️', key=f'delete_{i}', help='Delete this goal'):
+                        removed = st.session_state.goals.pop(i)
+                        if 'id' in removed:
+                            storage.delete_goal(removed['id'])
+                        # The solver and allocator below read the goals too, so rerun the whole page
+                        st.rerun()
+
+        fig = go.Figure()
+        for i, goal in enumerate(st.session_state.goals):
+            fig.add_trace(go.Scatter(x=flows.month / 12, y=flows.balance[i], name=goal['name']))
+        fig.update_layout(title='Month-by-month Balance per Goal', xaxis_title='Years', yaxis_title='₹', showlegend=True)
+        st.plotly_chart(apply_plotly_theme(fig), use_container_width=True)
+
+        # Sensitivity: grids are cached per goal, so switching goals is a lookup
+        st.markdown("### 🔬 Goal Sensitivity")
+        names = [goal['name'] for goal in st.session_state.goals]
+        g = st.selectbox('Goal', range(len(names)), format_func=names.__getitem__, key='sensitivity_goal')
+        goal = st.session_state.goals[g]
+        grid, bars = goal_sensitivity(goal, step_up, inflation)
+        sens_cols = st.columns(2)
+        with sens_cols[0]:
+            st.plotly_chart(sensitivity_heatmap(grid, step_up, goal['return'], goal['years'],
+                                                'Required Monthly SIP', 'SIP (₹)'), use_container_width=True)
+        with sens_cols[1]:
+            st.plotly_chart(tornado_chart(bars, sips[g], 'What Moves the Required SIP Most'),
+                            use_container_width=True)
+    else:
+        st.info("🎯 No goals set yet. Use the form above to add your first financial goal!")
+
+
+@timed_fragment
+def _goal_solver():
+    """Solve every goal for its horizon, required return or lump sum from the SIP the user can invest"""
+    st.markdown("### 🧮 Goal Solver")
+    goals = st.session_state.goals
+    targets = np.array([g['amount'] for g in goals], dtype=float)
+    timelines = np.array([g['years'] for g in goals], dtype=float)
+    returns = np.array([g['return'] for g in goals], dtype=float)
+
+    mode = st.radio('Solve for', ['⏳ Time to reach goal', '📈 Return needed', '💰 Lump sum needed today'],
+                    horizontal=True, key='solver_mode')
+    inputs = pd.DataFrame({
+        'Goal': [g['name'] for g in goals],
+        'Monthly SIP (₹)': np.round(required_sip(targets, timelines, returns), -2),
+        'Saved so far (₹)': 0.0
+    })
+    # Keyed on the goals, so edits reset when a goal is added or removed
+    edited = st.data_editor(inputs, disabled=['Goal'], hide_index=True, use_container_width=True,
+                            key=f"solver_inputs_{content_hash(goals)}")
+    sips = edited['Monthly SIP (₹)'].to_numpy(dtype=float)
+    saved = edited['Saved so far (₹)'].to_numpy(dtype=float)
+
+    result = pd.DataFrame({'Goal': inputs['Goal'], 'Target': [format_currency(t) for t in targets]})
+    if mode.endswith('Time to reach goal'):
+        years_needed = required_years(targets, sips, returns, saved)
+        result['Years Needed'] = ['Not reachable at this SIP' if np.isinf(y) else f"{y:.1f} years" for y in years_needed]
+        result['Planned'] = [f"{y:g} years" for y in timelines]
+    elif mode.endswith('Return needed'):
+        solution = required_return(targets, sips, timelines, saved)
+        result['Return Needed'] = ['Out of reach' if np.isnan(r) else f"{r:.2f}%" for r in solution.value]
+        result['Planned'] = [f"{r:g}%" for r in returns]
+        solved = np.isfinite(solution.value)
+        st.caption(f"Safeguarded Newton solved {int(solution.converged.sum())}/{len(goals)} goals in at most "
+                   f"{int(solution.iterations.max())} iterations; largest residual "
+                   f"{format_currency(np.abs(solution.residual[solved]).max()) if solved.any() else 'n/a'}")
+    else:
+        lumpsums = required_lumpsum(targets, sips, timelines, returns)
+        result['Lump Sum Needed Today'] = [format_currency(max(l - s, 0)) for l, s in zip(lumpsums, saved)]
+    st.dataframe(result, hide_index=True, use_container_width=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _surplus_curves(goals_hash, _goals):
+    """Break-even SIP curves of every goal; goals_hash is the cache key, _goals is not hashed"""
+    return goal_curves([g['amount'] for g in _goals], [g['years'] for g in _goals],
+                       [g.get('return', 8) for g in _goals])
+
+
+@timed_fragment
+def _surplus_allocator():
+    """Split the monthly surplus across all goals instead of planning each one against all of it"""
+    st.markdown("### 🧩 Surplus Allocator")
+    goals = st.session_state.goals
+    surplus = max(float(snapshot_graph().value('monthly_savings')), 0.0)
+    alloc_cols = st.columns([1, 2])
+    with alloc_cols[0]:
+        budget = st.number_input('Monthly surplus to split (₹)', min_value=0.0, value=surplus, step=1000.0,
+                                 key='allocator_budget')
+    with alloc_cols[1]:
+        objective = st.radio('Optimise for', OBJECTIVES, horizontal=True, key='allocator_objective',
+                             format_func={'goals_met': '🎯 Most goals met',
+                                          'shortfall': '📉 Smallest shortfall'}.__getitem__)
+    if budget <= 0:
+        st.info("No monthly surplus to split. Reduce expenses in your snapshot or enter an amount above.")
+        return
+
+    curves = _surplus_curves(content_hash(goals), goals)
+    allocation = allocate_from_curves(curves, budget, objective=objective)
+    equal = evaluate_split(curves, np.full(len(goals), budget / len(goals)))
+    alone = evaluate_split(curves, np.full(len(goals), budget))
+
+    metric_cols = st.columns(3)
+    with metric_cols[0]:
+        st.metric("Expected Goals Met", f"{allocation.expected_goals_met:.2f} / {len(goals)}",
+                  f"{allocation.expected_goals_met - equal.expected_goals_met:+.2f} vs equal split")
+    with metric_cols[1]:
+        st.metric("Expected Shortfall", format_currency(allocation.expected_shortfall.sum()),
+                  format_currency(allocation.expected_shortfall.sum() - equal.expected_shortfall.sum()),
+                  delta_color='inverse')
+    with metric_cols[2]:
+        st.metric("Surplus Allocated", format_currency(allocation.sip.sum()))
+
+    st.dataframe(pd.DataFrame({
+        'Goal': [g['name'] for g in goals],
+        'Monthly SIP': [format_currency(s) for s in allocation.sip],
+        'Success Probability': [f"{p:.1%}" for p in allocation.probability],
+        'Expected Shortfall': [format_currency(s) for s in allocation.expected_shortfall],
+        'If It Had the Whole Surplus': [f"{p:.1%}" for p in alone.probability]
+    }), hide_index=True, use_container_width=True)
+    st.caption("Probabilities come from 10,000 simulated market paths per goal. Existing savings are not "
+               "assigned to goals; the whole surplus is always split.")
+
+
+def render():
+    st.header('🎯 Goals & SIP Planner')
+    
+    if not st.session_state.user_data:
+        st.warning("🚨 Please create a financial snapshot first to set meaningful goals!")
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Goal Planning Made Personal!</h3>
+            <p>Complete your financial snapshot to set goals that align with your income, expenses, and savings capacity.</p>
+            <p><strong>🔒 Your goals are stored locally and private</strong></p>
+            <p><strong>👇 Scroll down and click on "📊 Snapshot" to enter your details!</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Show navigation reminder
+        st.markdown("---")
+        st.markdown("### 🚀 Quick Navigation")
+        nav_cols = st.columns(3)
+        with nav_cols[1]:
+            if st.button("📊 Go to Snapshot", use_container_width=True):
+                st.session_state.current_page = "📊 Snapshot"
+                st.rerun()
+    else:
+        # Privacy Notice
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>🔒 Your Goals are Private!</h3>
+            <p>All your financial goals are stored locally and only visible to you.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Add Goal Form
+        with st.form('goal_add'):
+            st.markdown("### 🎯 Add New Financial Goal")
+            
+            goal_cols = st.columns([2, 1, 1])
+            with goal_cols[0]:
+                g_name = st.text_input('Goal Name', placeholder='e.g., Dream House, Car, Vacation, Education')
+            with goal_cols[1]:
+                g_amount = st.number_input('Target Amount (₹)', min_value=0.0, value=500000.0, step=1000.0)
+            with goal_cols[2]:
+                g_years = st.number_input('Years to Achieve', min_value=1, value=5)
+            
+            g_return = st.slider('Expected Annual Return (%)', 0, 20, 8, 
+                               help='Conservative: 6-8%, Moderate: 8-12%, Aggressive: 12-15%+')
+            
+            add = st.form_submit_button('🚀 Add Goal', use_container_width=True)
+            
+        if add and g_name:
+            new_goal = {
+                'name': g_name,
+                'amount': g_amount,
+                'years': g_years,
+                'return': g_return,
+                'created_date': datetime.now().strftime('%Y-%m-%d')
+            }
+            st.session_state.goals.append(storage.add_goal(new_goal))
+            st.success(f'🎯 Goal "{g_name}" added successfully!')
+            st.balloons()
+
+        _goals_list()
+        if st.session_state.goals:
+            _goal_solver()
+            _surplus_allocator()
@@ -0,0 +1,220 @@
+"""💹 Investment Center: lump sum, SIP and fund comparison"""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from core.fund_metrics import ROLLING_YEARS
+from core.fund_universe import FUND_UNIVERSE_FILE, file_version
+from core.nav_store import store_version
+from core.projection import cash_flow_projection, lumpsum_projection
+from core.sensitivity import corpus_grid, sip_corpus, tornado
+from ui.common import format_currency, snapshot_graph
+from ui.fragments import timed_fragment
+from ui.sensitivity import sensitivity_heatmap, tornado_chart
+from ui.market_data import get_fund_comparison, get_mutual_fund_data
+from ui.theme import apply_plotly_theme
+
+
+# --- Investment Calculators ---
+@timed_fragment
+def _lumpsum_calculator(funds):
+    """Lump sum inputs and projection; reruns on its own when an input changes"""
+    st.subheader("Lump Sum Investment Simulation")
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        category = st.selectbox('Fund Category', funds.categories, key='lumpsum_category')
+        fund_name = st.selectbox('Select Fund', funds.funds_in(category), key='lumpsum_fund')
+        invest_amt = st.number_input('Investment Amount (₹)', min_value=1000.0, value=50000.0, step=1000.0, key='lumpsum_amt')
+        years = st.slider('Investment Period (Years)', 1, 20, 5, key='lumpsum_years')
+
+        selected_fund = funds.fund(fund_name)
+        st.write(f"**Risk Level:** {selected_fund['Risk']}")
+        st.write(f"**⭐ Rating:** {'★' * int(selected_fund['Rating'])}")
+
+    with col2:
+        st.subheader(f"Projection for {format_currency(invest_amt)} in {fund_name}")
+
+        # Calculate projections for different periods; the 10-year figure uses the
+        # median rolling 10Y CAGR from NAV history when the fund has one
+        comparison = get_fund_comparison(file_version(FUND_UNIVERSE_FILE), store_version())
+        ten_year = comparison.loc[fund_name].get('10Y CAGR Median', np.nan)
+        periods = [1, 3, 5, 10]
+        returns = [selected_fund['1Y Return'], selected_fund['3Y CAGR'], selected_fund['5Y CAGR'],
+                   selected_fund['5Y CAGR'] if pd.isna(ten_year) else ten_year]
+        future_values, _, profits = lumpsum_projection(invest_amt, periods, returns)
+
+        # Visualization
+        fig = go.Figure()
+        fig.add_trace(go.Bar(name='Initial Investment', x=[str(p) + 'Y' for p in periods], 
+                            y=[invest_amt]*len(periods), marker_color='#94a3b8'))
+        fig.add_trace(go.Bar(name='Projected Profit', x=[str(p) + 'Y' for p in periods], 
+                            y=profits, marker_color='#10b981'))
+        fig.update_layout(barmode='stack', title='Investment Growth Projection', 
+                        showlegend=True)
+        fig = apply_plotly_theme(fig)
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Detailed returns table
+        returns_df = pd.DataFrame({
+            'Period': [f'{p} Year{"s" if p>1 else ""}' for p in periods],
+            'Expected Return %': returns,
+            'Future Value': [format_currency(fv) for fv in future_values],
+            'Profit': [format_currency(p) for p in profits]
+        })
+        st.dataframe(returns_df.style.format({
+            'Expected Return %': '{:.1f}%'
+        }), use_container_width=True)
+
+
+@timed_fragment
+def _sip_calculator():
+    """SIP inputs and projection; reruns on its own when an input changes"""
+    st.subheader("SIP (Systematic Investment Plan) Calculator")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        monthly_sip = st.number_input('Monthly SIP Amount (₹)', min_value=500.0, value=5000.0, step=500.0, key='sip_amt')
+        sip_years = st.slider('Investment Period (Years)', 1, 30, 10, key='sip_years')
+        expected_return = st.slider('Expected Annual Return (%)', 5, 25, 12, key='sip_return')
+        step_up = st.slider('Annual SIP Step-up (%)', 0, 25, 0, key='sip_step_up',
+                            help='Raise the SIP by this much at the start of every year')
+        inflation = st.slider('Inflation (%)', 0.0, 10.0, 6.0, step=0.5, key='sip_inflation')
+
+    with col2:
+        # Month-by-month projection; the last month gives the summary figures
+        flows = cash_flow_projection(monthly_sip, sip_years, expected_return, step_up, inflation)
+        future_value, total_invested = flows.balance[0, -1], flows.invested[0, -1]
+        real_value = flows.real_value[0, -1]
+        profit = future_value - total_invested
+
+        st.markdown(f"""
+        <div class='metric-card'>
+            <h3>📊 SIP Projection Results</h3>
+            <p><strong>Monthly SIP:</strong> {format_currency(monthly_sip)}{f' rising {step_up}% a year' if step_up else ''}</p>
+            <p><strong>Investment Period:</strong> {sip_years} years</p>
+            <p><strong>Total Invested:</strong> {format_currency(total_invested)}</p>
+            <p><strong>Future Value:</strong> {format_currency(future_value)}</p>
+            <p><strong>Value in Today's Money:</strong> {format_currency(real_value)}</p>
+            <p><strong>Estimated Profit:</strong> {format_currency(profit)}</p>
+            <p><strong>Return on Investment:</strong> {(profit/total_invested)*100:.1f}%</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    fig = go.Figure()
+    years_axis = flows.month / 12
+    fig.add_trace(go.Scatter(x=years_axis, y=flows.invested[0], name='Invested', line=dict(color='#94a3b8')))
+    fig.add_trace(go.Scatter(x=years_axis, y=flows.balance[0], name='Balance', line=dict(color='#10b981')))
+    fig.add_trace(go.Scatter(x=years_axis, y=flows.real_value[0], name="Today's Money", line=dict(color='#6366f1', dash='dot')))
+    fig.update_layout(title='Month-by-month SIP Growth', xaxis_title='Years', yaxis_title='₹', showlegend=True)
+    st.plotly_chart(apply_plotly_theme(fig), use_container_width=True)
+
+    with st.expander('🔬 Sensitivity: returns x years x step-up'):
+        base = {'monthly_investment': monthly_sip, 'expected_return': expected_return,
+                'years': sip_years, 'step_up': step_up}
+        sens_cols = st.columns(2)
+        with sens_cols[0]:
+            st.plotly_chart(sensitivity_heatmap(corpus_grid(monthly_sip), step_up, expected_return, sip_years,
+                                                'Final Corpus', 'Corpus (₹)'), use_container_width=True)
+        with sens_cols[1]:
+            bars = tornado(sip_corpus, base, ['expected_return', 'years', 'step_up'])
+            st.plotly_chart(tornado_chart(bars, future_value, 'What Moves the Corpus Most'), use_container_width=True)
+
+
+def render():
+    st.header('💹 Investment Center')
+    
+    if not st.session_state.user_data:
+        st.warning("🚨 Please create a financial snapshot first to get personalized investment recommendations!")
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Personalized Investment Center Awaits!</h3>
+            <p>Complete your financial snapshot to get investment recommendations tailored to your risk profile and goals.</p>
+            <p><strong>🔒 Your investment data remains private</strong></p>
+            <p><strong>👇 Scroll down and click on "📊 Snapshot" to enter your details!</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Show navigation reminder
+        st.markdown("---")
+        st.markdown("### 🚀 Quick Navigation")
+        nav_cols = st.columns(3)
+        with nav_cols[1]:
+            if st.button("📊 Go to Snapshot", use_container_width=True):
+                st.session_state.current_page = "📊 Snapshot"
+                st.rerun()
+    else:
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Smart Investing Made Simple</h3>
+            <p>Explore mutual funds, simulate growth, and plan your SIP investments with ML-powered insights.</p>
+            <p><strong>🔒 All calculations are done locally on your device</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Investment Recommendations based on user profile
+        risk_profile, _, risk_score, _, _ = snapshot_graph().value('risk_profile')
+        
+        st.markdown("### 💡 Personalized Investment Strategy")
+        st.markdown(f"""
+        <div class='recommendation-card'>
+            <h4>Based on Your {risk_profile} Profile (Score: {risk_score:.1f}/10)</h4>
+            <p>Your risk tolerance suggests a {risk_profile.lower()} investment approach. Consider the following:</p>
+            <ul>
+                <li>Start with systematic investment plans (SIPs)</li>
+                <li>Diversify across asset classes</li>
+                <li>Focus on long-term wealth creation</li>
+                <li>Regularly review and rebalance your portfolio</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        funds = get_mutual_fund_data()
+        
+        # Two main sections: Lump Sum and SIP
+        tab1, tab2, tab3 = st.tabs(["💰 Lump Sum Investment", "📅 SIP Calculator", "📊 Fund Comparison"])
+        
+        with tab1:
+            _lumpsum_calculator(funds)
+
+        with tab2:
+            _sip_calculator()
+
+        with tab3:
+            st.subheader("Fund Comparison")
+            comparison = get_fund_comparison(file_version(FUND_UNIVERSE_FILE), store_version())
+            # The lump sum category lives in the calculator fragment; read it from its widget key
+            default_funds = funds.funds_in(st.session_state.get('lumpsum_category', funds.categories[0]))
+            selected_funds = st.multiselect('Funds to Compare', list(comparison.index),
+                                            default=default_funds, key='compare_funds')
+            
+            if selected_funds:
+                compared = comparison.loc[selected_funds]
+                has_history = 'Volatility' in compared and compared['Volatility'].notna().any()
+                columns = ['Category', '1Y Return', '3Y CAGR', '5Y CAGR', 'Risk', 'Expense Ratio']
+                if has_history:
+                    columns += [f'{y}Y CAGR Median' for y in ROLLING_YEARS] + ['Volatility', 'Max Drawdown', 'Sharpe', 'Sortino']
+                st.dataframe(compared[columns].style.format({
+                    column: '{:.2f}' if column in ('Sharpe', 'Sortino') else '{:.1f}%'
+                    for column in columns if column not in ('Category', 'Risk')
+                }, na_rep='-'), use_container_width=True)
+                
+                if has_history:
+                    # Spread of rolling CAGRs: median with the 5th-95th percentile range
+                    fig = go.Figure()
+                    for years in ROLLING_YEARS:
+                        median = compared[f'{years}Y CAGR Median']
+                        fig.add_trace(go.Bar(
+                            name=f'{years}Y', x=selected_funds, y=median,
+                            error_y=dict(type='data', symmetric=False,
+                                         array=compared[f'{years}Y CAGR P95'] - median,
+                                         arrayminus=median - compared[f'{years}Y CAGR P5'])
+                        ))
+                    fig.update_layout(barmode='group', title='Rolling CAGR: Median with 5th-95th Percentile Range',
+                                      yaxis_title='CAGR (%)')
+                    fig = apply_plotly_theme(fig)
+                    st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.info("📈 Rolling returns, volatility, drawdown, Sharpe and Sortino appear here once NAV "
+                            "history is loaded with `python -m core.nav_store ingest NAVAll.txt`.")
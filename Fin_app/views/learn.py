@@ -0,0 +1,69 @@
+"""📚 Financial education centre"""
+import streamlit as st
+
+from ui.engines import get_educator
+
+
+def render():
+    st.header('📚 Financial Education Center')
+    
+    educator = get_educator()
+    
+    st.markdown("""
+    <div class='financial-sticker'>
+        <h3>Master Your Financial Knowledge</h3>
+        <p>Learn essential financial concepts to make informed investment decisions.</p>
+        <p><strong>💡 Hover over concepts throughout the app for quick tips!</strong></p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Educational Concepts
+    concepts = educator.concepts
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        for key, concept in list(concepts.items())[:3]:
+            with st.expander(f"📖 {concept['title']}", expanded=True):
+                st.markdown(concept['content'])
+                st.info(f"**💡 Pro Tip:** {concept['tip']}")
+    
+    with col2:
+        for key, concept in list(concepts.items())[3:]:
+            with st.expander(f"📖 {concept['title']}", expanded=True):
+                st.markdown(concept['content'])
+                st.info(f"**💡 Pro Tip:** {concept['tip']}")
+    
+    # Interactive Quiz
+    st.markdown("### 🎯 Quick Knowledge Check")
+    
+    quiz_questions = [
+        {
+            'question': 'What is the main benefit of SIP investing?',
+            'options': ['Higher returns guaranteed', 'Rupee cost averaging', 'No market risk', 'Instant liquidity'],
+            'correct': 1,
+            'explanation': 'SIP benefits from rupee cost averaging, which reduces the impact of market timing.'
+        },
+        {
+            'question': 'Which tax-saving instrument has the shortest lock-in period?',
+            'options': ['PPF', 'ELSS', 'Tax Saver FD', 'NPS'],
+            'correct': 1,
+            'explanation': 'ELSS has only 3-year lock-in, while PPF is 15 years and Tax Saver FD is 5 years.'
+        },
+        {
+            'question': 'What does "asset allocation" mean?',
+            'options': ['Buying only stocks', 'Dividing investments across categories', 'Selling all investments', 'Keeping only cash'],
+            'correct': 1,
+            'explanation': 'Asset allocation means dividing your investments across different categories like equity, debt, gold, etc.'
+        }
+    ]
+    
+    for i, q in enumerate(quiz_questions):
+        st.markdown(f"**Q{i+1}: {q['question']}**")
+        selected = st.radio(f"Select answer for Q{i+1}", q['options'], key=f"edu_quiz_{i}")
+        
+        if st.button(f"Check Answer {i+1}", key=f"check_{i}"):
+            if q['options'].index(selected) == q['correct']:
+                st.success("✅ Correct! " + q['explanation'])
+            else:
+                st.error("❌ Incorrect. " + q['explanation'])
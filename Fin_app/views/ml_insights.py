@@ -0,0 +1,125 @@
+"""🤖 ML Insights: risk profile, goal probabilities and recommendations"""
+import numpy as np
+import streamlit as st
+
+from core.montecarlo import shortfall_summary
+from ui.common import format_currency, snapshot_graph
+from ui.engines import get_predictor
+from ui.fragments import timed_fragment
+
+
+@timed_fragment
+def _goal_cards(analyzer, user_data, graph):
+    """Monte Carlo success probability card for every goal"""
+    st.markdown("### 🎯 ML Goal Success Probability")
+    # What-if savings only re-simulate this fragment, not the whole page
+    extra_savings = st.slider('What-if: extra monthly savings (₹)', 0, 50000, 0, step=1000,
+                              key='whatif_savings')
+    if extra_savings:
+        finances = dict(user_data, monthly_savings=max(graph.value('monthly_savings'), 0) + extra_savings)
+        simulation = analyzer.simulate_goals(st.session_state.goals, finances)
+    else:
+        # One batched Monte Carlo run covers every goal; rerun only after savings or goals change
+        simulation = graph.value('goal_simulation')
+    st.caption("Each goal is scored as if it received the whole monthly surplus; the Goals Planner's "
+               "Surplus Allocator splits it across goals.")
+    shortfalls = shortfall_summary(simulation)
+    median_index = simulation.percentiles.index(50)
+    for g, goal in enumerate(st.session_state.goals):
+        probability = simulation.probability[g]
+        confidence, color = analyzer.describe_confidence(probability)
+        median_outcome = simulation.percentile_paths[g, median_index]
+        median_outcome = median_outcome[~np.isnan(median_outcome)][-1]
+
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.markdown(f"""
+            <div class='metric-card'>
+                <h4>🎯 {goal['name']}</h4>
+                <p>Target: {format_currency(goal['amount'])} in {goal['years']} years | Expected Return: {goal.get('return', 8)}%</p>
+                <div style='background: #e2e8f0; border-radius: 12px; height: 30px; margin: 15px 0;'>
+                    <div style='background: {color}; 
+                              width: {probability*100}%; height: 100%; border-radius: 12px; 
+                              text-align: center; color: white; font-weight: bold; line-height: 30px; font-size: 1.1rem;'>
+                        {probability*100:.1f}% Success Probability
+                    </div>
+                </div>
+                <p style='font-size: 1.1rem;'><strong>ML Assessment:</strong> {confidence}</p>
+                <p>Median outcome: <strong>{format_currency(median_outcome)}</strong> | 
+                   Expected shortfall if missed: <strong>{format_currency(shortfalls['expected_when_missed'][g])}</strong></p>
+            </div>
+            """, unsafe_allow_html=True)
+
+
+def render():
+    st.header('🤖 Advanced ML Insights')
+    
+    if not st.session_state.user_data:
+        st.warning("🚨 Please create a financial snapshot first to get ML insights!")
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>ML Insights Await Your Data!</h3>
+            <p>Complete your financial snapshot to unlock advanced machine learning insights including:</p>
+            <ul>
+                <li>🤖 Risk Profile Analysis</li>
+                <li>🎯 Goal Success Probability</li>
+                <li>📊 Behavioral Patterns</li>
+                <li>💡 Personalized Recommendations</li>
+            </ul>
+            <p><strong>🔒 Your data remains 100% private</strong></p>
+            <p><strong>👇 Scroll down and click on "📊 Snapshot" to enter your details!</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Show navigation reminder
+        st.markdown("---")
+        st.markdown("### 🚀 Quick Navigation")
+        nav_cols = st.columns(3)
+        with nav_cols[1]:
+            if st.button("📊 Go to Snapshot", use_container_width=True):
+                st.session_state.current_page = "📊 Snapshot"
+                st.rerun()
+    else:
+        user_data = st.session_state.user_data
+        analyzer = get_predictor()
+        graph = snapshot_graph()
+        
+        # Enhanced Risk Analysis
+        st.markdown("### 🎯 Deep Risk Analysis")
+        risk_profile, risk_allocation, risk_score, risk_explanation, risk_factors = graph.value('risk_profile')
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown(f"""
+            <div class='metric-card'>
+                <h3>🤖 ML Risk Assessment</h3>
+                <div style='text-align: center;'>
+                    <h1 style='color: #7c3aed; font-size: 2.5rem;'>{risk_profile}</h1>
+                    <p style='font-size: 1.2rem;'><strong>Risk Score:</strong> {risk_score:.1f}/10</p>
+                    <p style='font-size: 1.1rem;'>{risk_explanation}</p>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Risk Factors Breakdown
+            st.markdown("### 📊 Risk Factor Analysis")
+            for factor, score in risk_factors.items():
+                normalized_score = max(0.0, min(score / 10.0, 1.0))
+                st.progress(normalized_score, text=f"{factor}: {score:.2f}")
+        
+        with col2:
+            # Goal Success Predictions
+            if st.session_state.goals:
+                _goal_cards(analyzer, user_data, graph)
+            else:
+                st.info("🎯 No goals set yet. Visit the Goals Planner to set your financial goals!")
+        
+        # ML Recommendations
+        st.markdown("### 💡 ML-Powered Recommendations")
+        recommendations = graph.value('recommendations')
+        for rec in recommendations:
+            st.markdown(f"""
+            <div class='ml-insight'>
+                {rec}
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,157 @@
+"""💼 Portfolio manager: manual entry, CSV import and NAV revaluation"""
+from datetime import datetime
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from core.integrations import CSVImportError
+from core.nav_store import revalue_holdings, store_version
+from ui.common import format_currency, storage
+from ui.engines import get_integrator
+from ui.market_data import get_nav_store
+from ui.theme import apply_plotly_theme
+
+
+def render():
+    st.header('💼 Portfolio Manager')
+    
+    if not st.session_state.user_data:
+        st.warning("🚨 Please create a financial snapshot first to track your portfolio effectively!")
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Portfolio Tracking Made Easy!</h3>
+            <p>Complete your financial snapshot to get personalized portfolio recommendations and tracking.</p>
+            <p><strong>🔒 Your portfolio data remains private</strong></p>
+            <p><strong>👇 Scroll down and click on "📊 Snapshot" to enter your details!</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Show navigation reminder
+        st.markdown("---")
+        st.markdown("### 🚀 Quick Navigation")
+        nav_cols = st.columns(3)
+        with nav_cols[1]:
+            if st.button("📊 Go to Snapshot", use_container_width=True):
+                st.session_state.current_page = "📊 Snapshot"
+                st.rerun()
+    else:
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Track Your Investments</h3>
+            <p>Add your current holdings and visualize your portfolio allocation.</p>
+            <p><strong>🔒 Your investment data is stored locally</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Portfolio Integration Section
+        st.markdown("### 🔗 Portfolio Integration")
+        integrator = get_integrator()
+        
+        tab1, tab2, tab3 = st.tabs(["📤 Manual Entry", "📁 CSV Import", "🔗 Broker Integration"])
+        
+        with tab1:
+            with st.form('portfolio_form'):
+                cols = st.columns(3)
+                name = cols[0].text_input('Holding Name', placeholder='e.g., Reliance Stocks, SBI Mutual Fund')
+                amt = cols[1].number_input('Amount (₹)', min_value=0.0, value=0.0, step=1000.0)
+                category = cols[2].selectbox('Category', ['Stocks', 'Mutual Funds', 'FD/RD', 'Gold', 'Real Estate', 'Other'])
+                
+                add = cols[2].form_submit_button('➕ Add Holding')
+                
+                if add and name and amt>0:
+                    st.session_state.portfolio.append(
+                        storage.add_holding({'name': name, 'amount': amt, 'category': category})
+                    )
+                    st.success('✅ Holding added successfully!')
+        
+        with tab2:
+            st.markdown("### 📁 Import Portfolio via CSV")
+            uploaded_file = st.file_uploader("Upload Portfolio CSV", type=['csv'])
+            
+            if uploaded_file is not None:
+                detected_format = integrator.detect_csv_format(uploaded_file)
+                # The preview streams the file; only the import below reads all of it into storage
+                try:
+                    preview = integrator.preview_csv_upload(uploaded_file)
+                except CSVImportError as e:
+                    st.error(str(e))
+                    preview = None
+                if preview is not None and preview.count:
+                    st.success(f"✅ Processed {preview.count} holdings from CSV")
+                    st.caption(f"Detected format: {detected_format or 'Generic CSV'}")
+                    st.dataframe(preview.head, use_container_width=True, hide_index=True)
+                    
+                    if st.button("Add to Portfolio", use_container_width=True):
+                        # Large exports go to storage a chunk at a time rather than as one list of rows
+                        try:
+                            integrator.import_csv_upload(uploaded_file, storage)
+                        except CSVImportError as e:
+                            st.error(str(e))
+                        else:
+                            st.session_state.portfolio = storage.load_portfolio()
+                            st.success("✅ Portfolio updated with CSV data!")
+                            st.rerun()
+        
+        with tab3:
+            st.markdown("### 🔗 Broker & Bank Integration")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("#### 📊 Stock Brokers")
+                selected_broker = st.selectbox("Select Broker", 
+                                             [f"{details['name']} ({key})" 
+                                              for key, details in integrator.supported_brokers.items()])
+                
+                broker_key = selected_broker.split('(')[-1].replace(')', '')
+                broker_details = integrator.supported_brokers.get(broker_key, {})
+                
+                if broker_details:
+                    st.markdown(integrator.get_integration_instructions('broker', broker_details['name']))
+            
+            with col2:
+                st.markdown("#### 🏦 Banks")
+                selected_bank = st.selectbox("Select Bank", 
+                                           [f"{details['name']} ({key})" 
+                                            for key, details in integrator.supported_banks.items()])
+                
+                bank_key = selected_bank.split('(')[-1].replace(')', '')
+                bank_details = integrator.supported_banks.get(bank_key, {})
+                
+                if bank_details:
+                    st.markdown(integrator.get_integration_instructions('bank', bank_details['name']))
+
+        if st.session_state.portfolio:
+            pfdf = pd.DataFrame(st.session_state.portfolio).drop(columns='id', errors='ignore')
+            nav_store = get_nav_store(store_version())
+            if len(nav_store):
+                valuation_date = st.date_input('📅 Valuation Date', value=datetime.now().date(), key='valuation_date')
+                revalued = revalue_holdings(nav_store, st.session_state.portfolio, valuation_date)
+                pfdf['amount'] = revalued['value'].to_numpy()
+                pfdf['nav'] = revalued['nav'].to_numpy()
+                st.caption(f"Revalued {int(revalued['nav'].notna().sum())} of {len(pfdf)} holdings "
+                           f"at the latest NAV on or before {valuation_date:%d %b %Y}")
+            total_portfolio = pfdf['amount'].sum()
+            pfdf['pct'] = (pfdf['amount'] / total_portfolio) * 100
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader('Portfolio Holdings')
+                st.dataframe(pfdf.style.format({
+                    'amount': '₹{:,.0f}',
+                    'pct': '{:.1f}%',
+                    'nav': '{:,.4f}'
+                }, subset=[c for c in ('amount', 'pct', 'nav') if c in pfdf], na_rep='-'), use_container_width=True)
+                
+                # Portfolio summary
+                st.metric("Total Portfolio Value", format_currency(total_portfolio))
+                
+            with col2:
+                st.subheader('Portfolio Allocation')
+                fig = go.Figure(go.Pie(labels=pfdf['category'], values=pfdf['amount']))
+                fig.update_layout(title='Investment Allocation by Category')
+                fig = apply_plotly_theme(fig)
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("💼 No portfolio holdings added yet. Use the form above to add your first investment!")
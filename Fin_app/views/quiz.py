@@ -0,0 +1,188 @@
+"""🧠 Behaviour quiz and investor profile"""
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from ui.engines import get_quiz
+from ui.theme import apply_plotly_theme
+
+
+def render():
+    st.header('🧠 Financial Behavior Quiz')
+    
+    if not st.session_state.user_data:
+        st.warning("🚨 Please create a financial snapshot first to get personalized quiz results!")
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Personalized Quiz Awaits Your Profile!</h3>
+            <p>Complete your financial snapshot to get quiz results tailored to your specific financial situation.</p>
+            <p><strong>🔒 Your quiz responses remain private</strong></p>
+            <p><strong>👇 Scroll down and click on "📊 Snapshot" to enter your details!</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Show navigation reminder
+        st.markdown("---")
+        st.markdown("### 🚀 Quick Navigation")
+        nav_cols = st.columns(3)
+        with nav_cols[1]:
+            if st.button("📊 Go to Snapshot", use_container_width=True):
+                st.session_state.current_page = "📊 Snapshot"
+                st.rerun()
+    else:
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Discover Your Investment Personality</h3>
+            <p>This quiz will help us understand your financial behavior and provide personalized investment recommendations.</p>
+            <p><strong>🔒 Your responses are completely private</strong></p>
+            <p><strong>Time:</strong> 5-7 minutes | <strong>Questions:</strong> 8</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        quiz = get_quiz()
+        
+        if not st.session_state.quiz_completed:
+            # Show current question
+            current_q = quiz.questions[st.session_state.current_question]
+            
+            st.markdown(f"""
+            <div class='quiz-question'>
+                <h3>Question {st.session_state.current_question + 1} of {len(quiz.questions)}</h3>
+                <h4>{current_q['question']}</h4>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Display options
+            selected_option = None
+            
+            for i, option in enumerate(current_q['options']):
+                is_selected = st.session_state.quiz_answers.get(current_q['id']) == i
+                css_class = "quiz-option selected" if is_selected else "quiz-option"
+                
+                st.markdown(f"""
+                <div class='{css_class}'>
+                    {option['text']}
+                </div>
+                """, unsafe_allow_html=True)
+                
+                if st.button(f"Select Option {i+1}", key=f"opt_{current_q['id']}_{i}", use_container_width=True):
+                    st.session_state.quiz_answers[current_q['id']] = i
+                    st.rerun()
+            
+            # Navigation buttons
+            col1, col2, col3 = st.columns([1, 1, 1])
+            
+            with col1:
+                if st.session_state.current_question > 0:
+                    if st.button("⬅️ Previous", use_container_width=True):
+                        st.session_state.current_question -= 1
+                        st.rerun()
+            
+            with col2:
+                progress = (st.session_state.current_question + 1) / len(quiz.questions)
+                st.progress(progress, text=f"Progress: {int(progress*100)}%")
+            
+            with col3:
+                if st.session_state.current_question < len(quiz.questions) - 1:
+                    if st.button("Next ➡️", use_container_width=True):
+                        if current_q['id'] in st.session_state.quiz_answers:
+                            st.session_state.current_question += 1
+                            st.rerun()
+                        else:
+                            st.warning("Please select an option before proceeding.")
+                else:
+                    if st.button("Complete Quiz 🎯", type="primary", use_container_width=True):
+                        if current_q['id'] in st.session_state.quiz_answers:
+                            st.session_state.quiz_completed = True
+                            st.rerun()
+                        else:
+                            st.warning("Please select an option to complete the quiz.")
+        
+        else:
+            # Quiz completed - show results
+            st.balloons()
+            st.success("🎉 Quiz Completed! Here's Your Investment Personality Analysis")
+            
+            # Calculate results
+            quiz = get_quiz()
+            answers_with_scores = {}
+            
+            for q_id, option_index in st.session_state.quiz_answers.items():
+                question = next(q for q in quiz.questions if q['id'] == q_id)
+                selected_option = question['options'][option_index]
+                answers_with_scores[q_id] = selected_option['score']
+            
+            personality_result = quiz.calculate_personality(answers_with_scores)
+            recommendations = quiz.get_recommendations(personality_result)
+            
+            # Display Personality Results
+            st.markdown("### 🎯 Your Investment Personality")
+            
+            personality_class = ""
+            if "Conservative" in personality_result['personality']:
+                personality_class = "personality-conservative"
+            elif "Cautious" in personality_result['personality']:
+                personality_class = "personality-moderate"
+            elif "Balanced" in personality_result['personality']:
+                personality_class = "personality-balanced"
+            else:
+                personality_class = "personality-aggressive"
+            
+            st.markdown(f"""
+            <div class='{personality_class}'>
+                <h2 style='font-size: 2.5rem; margin-bottom: 1rem;'>{personality_result['personality']}</h2>
+                <h3 style='font-size: 1.8rem; color: {personality_result["color"]};'>Risk Level: {personality_result['risk_level']}</h3>
+                <p style='font-size: 1.3rem; line-height: 1.8;'>{personality_result['description']}</p>
+                <p style='font-size: 1.2rem;'><strong>Personality Score:</strong> {personality_result['score']} ({personality_result['score_percentage']:.1f}%)</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Display Recommendations
+            st.markdown("### 💡 Personalized Investment Recommendations")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("#### 📊 Recommended Asset Allocation")
+                allocation_data = []
+                for asset, percentage in recommendations['asset_allocation'].items():
+                    allocation_data.append([asset, percentage])
+                
+                allocation_df = pd.DataFrame(allocation_data, columns=['Asset Class', 'Allocation'])
+                st.dataframe(allocation_df.style.set_properties(**{
+                    'font-size': '1.2rem',
+                    'text-align': 'center'
+                }), use_container_width=True)
+                
+                # Asset allocation pie chart
+                fig = go.Figure(go.Pie(values=allocation_df['Allocation'], labels=allocation_df['Asset Class']))
+                fig.update_layout(title='Recommended Portfolio Allocation')
+                fig = apply_plotly_theme(fig)
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                st.markdown("#### 🏆 Recommended Funds")
+                for i, fund in enumerate(recommendations['recommended_funds'], 1):
+                    st.markdown(f"**{i}. {fund}**")
+                
+                st.markdown("#### 🎯 Investment Strategy")
+                st.markdown(f"""
+                <div class='ai-prediction'>
+                    <p style='font-size: 1.2rem;'>{recommendations['strategy']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.markdown("#### 💡 Actionable Suggestions")
+                for suggestion in recommendations['suggestions']:
+                    st.markdown(f"• {suggestion}")
+            
+            # Store quiz results for PDF
+            st.session_state.quiz_results = personality_result
+            
+            # Reset quiz button
+            st.markdown("---")
+            if st.button("🔄 Take Quiz Again", use_container_width=True):
+                st.session_state.quiz_answers = {}
+                st.session_state.current_question = 0
+                st.session_state.quiz_completed = False
+                st.rerun()
@@ -0,0 +1,121 @@
+"""📊 Financial snapshot form"""
+import streamlit as st
+
+from ui.common import storage
+
+
+def render():
+    st.header('📊 Financial Snapshot')
+    
+    if not st.session_state.user_data:
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>🎯 Let's Build Your Financial Profile!</h3>
+            <p>Complete this detailed snapshot to unlock personalized AI-powered financial insights and recommendations.</p>
+            <p><strong>🔒 Privacy Note:</strong> All your data stays 100% private on your device.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>✅ Your Financial Profile is Ready!</h3>
+            <p>You can update your information below or explore other features using the navigation menu.</p>
+            <p><strong>🔒 Your data is securely stored locally.</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Pre-fill the form with the hydrated snapshot so returning users don't re-enter it
+    saved = st.session_state.user_data
+    saved_expenses = saved.get('expenses', {})
+    saved_assets = saved.get('assets', {})
+    saved_liabilities = saved.get('liabilities', {})
+    
+    with st.form('snapshot_form'):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 💰 Income & Profile")
+            monthly_income = st.number_input('Monthly Take-Home Income (₹)', min_value=0.0, 
+                                           value=float(saved.get('monthly_income', 0.0)), 
+                                           step=1000.0, key='monthly_income')
+            current_savings = st.number_input('Current Savings & Emergency Fund (₹)', min_value=0.0, 
+                                            value=float(saved.get('current_savings', 0.0)), 
+                                            step=5000.0, key='current_savings')
+            investment_percentage = st.slider('% of Income to Invest Monthly', 0, 100, 
+                                            int(saved.get('investment_percentage', 0)), 
+                                            key='investment_percentage')
+            
+            st.markdown("### 🤖 ML Profile Data")
+            age = st.number_input('Your Age', min_value=18, max_value=80, 
+                                value=int(saved.get('age', 30)), key='age')
+            investment_experience = st.slider('Investment Experience Level (1-5)', 1, 5, 
+                                            int(saved.get('investment_experience', 2)),
+                                            help="1: Beginner, 2: Some knowledge, 3: Intermediate, 4: Experienced, 5: Expert")
+            
+        with col2:
+            st.markdown("### 💸 Monthly Expenses")
+            rent_emi = st.number_input('🏠 Rent / Home Loan EMI (₹)', 0.0, 
+                                     value=float(saved_expenses.get('Rent/EMI', 0.0)), step=1000.0, key='rent_emi')
+            groceries = st.number_input('🛒 Groceries & Household (₹)', 0.0, 
+                                      value=float(saved_expenses.get('Groceries', 0.0)), step=500.0, key='groceries')
+            utilities = st.number_input('⚡ Utilities (Electricity, Water, Gas) (₹)', 0.0, 
+                                      value=float(saved_expenses.get('Utilities', 0.0)), step=200.0, key='utilities')
+            transportation = st.number_input('🚗 Transportation (Fuel, Maintenance) (₹)', 0.0, 
+                                           value=float(saved_expenses.get('Transportation', 0.0)), step=500.0, key='transportation')
+            dining_entertainment = st.number_input('🍽️ Dining & Entertainment (₹)', 0.0, 
+                                                 value=float(saved_expenses.get('Dining & Entertainment', 0.0)), step=500.0, key='dining')
+            miscellaneous = st.number_input('📦 Miscellaneous Expenses (₹)', 0.0, 
+                                          value=float(saved_expenses.get('Miscellaneous', 0.0)), step=200.0, key='miscellaneous')
+
+        # Assets & Liabilities Section
+        st.markdown("### 🏦 Assets & Liabilities")
+        col3, col4 = st.columns(2)
+        
+        with col3:
+            st.markdown("#### 💎 Assets")
+            cash_balance = st.number_input('💵 Cash & Bank Balance (₹)', 0.0, 
+                                         value=float(saved_assets.get('Cash', 0.0)), step=5000.0, key='cash')
+            stocks_mf = st.number_input('📈 Stocks & Mutual Funds (₹)', 0.0, 
+                                      value=float(saved_assets.get('Stocks/MF', 0.0)), step=10000.0, key='stocks')
+            property_value = st.number_input('🏠 Property Value (₹)', 0.0, 
+                                           value=float(saved_assets.get('Property', 0.0)), step=50000.0, key='property')
+        
+        with col4:
+            st.markdown("#### 📄 Liabilities")
+            home_loan = st.number_input('🏦 Home Loan Outstanding (₹)', 0.0, 
+                                      value=float(saved_liabilities.get('Home Loan', 0.0)), step=10000.0, key='home_loan')
+            personal_loan = st.number_input('💳 Personal Loan Outstanding (₹)', 0.0, 
+                                          value=float(saved_liabilities.get('Personal Loan', 0.0)), step=5000.0, key='personal_loan')
+            other_debt = st.number_input('📝 Other Debt (₹)', 0.0, 
+                                       value=float(saved_liabilities.get('Other Debt', 0.0)), step=5000.0, key='other_debt')
+
+        if st.form_submit_button('💾 Save Financial Snapshot', use_container_width=True):
+            user_data = {
+                'monthly_income': monthly_income,
+                'current_savings': current_savings,
+                'investment_percentage': investment_percentage,
+                'age': age,
+                'investment_experience': investment_experience,
+                'expenses': {
+                    'Rent/EMI': rent_emi,
+                    'Groceries': groceries,
+                    'Utilities': utilities,
+                    'Transportation': transportation,
+                    'Dining & Entertainment': dining_entertainment,
+                    'Miscellaneous': miscellaneous
+                },
+                'assets': {
+                    'Cash': cash_balance,
+                    'Stocks/MF': stocks_mf,
+                    'Property': property_value
+                },
+                'liabilities': {
+                    'Home Loan': home_loan,
+                    'Personal Loan': personal_loan,
+                    'Other Debt': other_debt
+                }
+            }
+            st.session_state.user_data = user_data
+            storage.save_snapshot(user_data)
+            st.success('✅ Financial Snapshot saved successfully!')
+            st.balloons()
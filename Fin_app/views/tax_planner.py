@@ -0,0 +1,165 @@
+"""🏦 Tax planner"""
+import pandas as pd
+import streamlit as st
+
+from core.income_tax import LATEST_YEAR, TAX_YEARS, break_even_deductions, hra_exemption
+from core.tax import SECTION_80C_OPTIONS
+from ui.common import format_currency, snapshot_graph
+from ui.engines import get_tax_planner
+
+
+def render():
+    st.header('🏦 Tax Planning Center')
+    
+    if not st.session_state.user_data:
+        st.warning("🚨 Please create a financial snapshot first for personalized tax planning!")
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Smart Tax Planning Awaits!</h3>
+            <p>Complete your financial snapshot to get tax-saving recommendations based on your income and goals.</p>
+            <p><strong>🔒 Your tax data remains private</strong></p>
+            <p><strong>👇 Scroll down and click on "📊 Snapshot" to enter your details!</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Show navigation reminder
+        st.markdown("---")
+        st.markdown("### 🚀 Quick Navigation")
+        nav_cols = st.columns(3)
+        with nav_cols[1]:
+            if st.button("📊 Go to Snapshot", use_container_width=True):
+                st.session_state.current_page = "📊 Snapshot"
+                st.rerun()
+    else:
+        st.markdown("""
+        <div class='financial-sticker'>
+            <h3>Save Tax, Build Wealth</h3>
+            <p>Optimize your tax savings with AI-powered recommendations and goal-linked tax planning.</p>
+            <p><strong>🔒 All tax calculations are done locally</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        tax_planner = get_tax_planner()
+        user_data = st.session_state.user_data
+        annual_income = user_data.get('monthly_income', 0) * 12
+        
+        # Tax Recommendations
+        st.markdown("### 💡 Personalized Tax Recommendations")
+        tax_recommendations = snapshot_graph().value('tax_recommendations')
+        for rec in tax_recommendations:
+            st.markdown(f"""
+            <div class='recommendation-card'>
+                {rec}
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Tax Saving Options
+        st.markdown("### 📊 Tax Saving Instruments")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 🎯 Section 80C Options (₹1.5 Lakh Limit)")
+            tax_options = SECTION_80C_OPTIONS
+            
+            for option in tax_options:
+                details = tax_planner.tax_saving_options[option]
+                with st.expander(f"📈 {details['name']}"):
+                    st.write(f"**Lock-in:** {details['lockin']}")
+                    st.write(f"**Expected Returns:** {details['returns']}")
+                    st.write(f"**Risk:** {details['risk']}")
+                    st.write(f"**Description:** {details['description']}")
+                    
+                    investment = st.number_input(f"Investment in {details['name']} (₹)", 
+                                               min_value=0, 
+                                               max_value=150000,
+                                               value=0,
+                                               key=f"tax_{option}")
+                    
+                    st.session_state.tax_investments[option] = investment
+        
+        with col2:
+            st.markdown("#### 🏠 Other Tax Benefits")
+            other_options = ['NPS', 'HealthInsurance', 'HRA', 'HomeLoan']
+            
+            for option in other_options:
+                details = tax_planner.tax_saving_options[option]
+                with st.expander(f"💼 {details['name']}"):
+                    st.write(f"**Max Deduction:** {details['max_deduction']}")
+                    st.write(f"**Description:** {details['description']}")
+                    
+                    if option == 'NPS':
+                        investment = st.number_input(f"Additional NPS Investment (₹)", 
+                                                   min_value=0, 
+                                                   max_value=50000,
+                                                   value=0,
+                                                   key=f"tax_{option}")
+                        st.session_state.tax_investments[option] = investment
+                    elif option == 'HRA':
+                        # Section 10(13A): the exemption follows from salary, allowance and rent, not a typed-in claim
+                        hra_cols = st.columns(2)
+                        basic_salary = hra_cols[0].number_input("Annual Basic Salary + DA (₹)", min_value=0, value=0,
+                                                                step=10000, key='tax_HRA_basic')
+                        hra_received = hra_cols[1].number_input("Annual HRA Received (₹)", min_value=0, value=0,
+                                                                step=1000, key='tax_HRA_received')
+                        rent_paid = hra_cols[0].number_input("Annual Rent Paid (₹)", min_value=0, value=0,
+                                                             step=1000, key='tax_HRA_rent')
+                        metro = hra_cols[1].checkbox("Metro city (Delhi, Mumbai, Kolkata, Chennai)",
+                                                     key='tax_HRA_metro')
+                        exemption = float(hra_exemption(basic_salary, hra_received, rent_paid, metro))
+                        st.session_state.tax_investments[option] = exemption
+                        st.caption(f"HRA exemption: {format_currency(exemption)} — the least of the HRA received, "
+                                   f"rent above 10% of basic, and {'50' if metro else '40'}% of basic.")
+                    else:
+                        label = {'HealthInsurance': "Health Insurance Premium Paid (₹)",
+                                 'HomeLoan': "Home Loan Interest Paid (₹)"}[option]
+                        st.session_state.tax_investments[option] = st.number_input(
+                            label, min_value=0, value=0, step=1000, key=f"tax_{option}")
+        
+        # Tax Savings Calculation
+        st.markdown("### 🧮 Tax Savings Calculator")
+        years = list(TAX_YEARS)
+        year = st.selectbox('Financial Year', years, index=years.index(LATEST_YEAR), key='tax_year')
+        if st.button("Calculate Tax Savings", use_container_width=True):
+            total_80c_investment = sum(st.session_state.tax_investments.get(opt, 0) for opt in SECTION_80C_OPTIONS)
+            nps_extra = st.session_state.tax_investments.get('NPS', 0)
+            age = user_data.get('age', 30)
+            
+            tax_saved, max_deduction = tax_planner.calculate_tax_savings(
+                st.session_state.tax_investments, annual_income, age, year
+            )
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total 80C Investment", format_currency(total_80c_investment))
+            with col2:
+                st.metric("NPS Additional", format_currency(nps_extra))
+            with col3:
+                st.metric("Estimated Tax Saved", format_currency(tax_saved))
+            
+            # Progress towards 80C limit
+            progress = min(total_80c_investment / 150000, 1.0)
+            st.progress(progress, text=f"Section 80C Utilization: {total_80c_investment:,}/150,000")
+            
+            if total_80c_investment < 150000:
+                st.info(f"💡 You can invest additional {format_currency(150000 - total_80c_investment)} to maximize 80C benefits")
+            
+            # Old vs New Regime
+            st.markdown("### ⚖️ Old vs New Tax Regime")
+            comparison = tax_planner.compare_regimes(st.session_state.tax_investments, annual_income, age, year)
+            st.dataframe(pd.DataFrame({
+                'Regime': ['Old Regime', 'New Regime'],
+                **{column: [format_currency(getattr(breakdown, field)) for breakdown in (comparison.old, comparison.new)]
+                   for column, field in [('Taxable Income', 'taxable_income'), ('Slab Tax', 'slab_tax'),
+                                         ('87A Rebate', 'rebate'), ('Surcharge', 'surcharge'),
+                                         ('Cess (4%)', 'cess'), ('Total Tax', 'total')]}
+            }), hide_index=True, use_container_width=True)
+            better = 'Old' if comparison.better == 'old' else 'New'
+            st.success(f"✅ The **{better} Regime** saves you {format_currency(comparison.saving)} for {year}.")
+            break_even = float(break_even_deductions(annual_income, age, year)[0])
+            if better == 'New' and break_even > 0:
+                st.caption(f"The old regime would need at least {format_currency(break_even)} of deductions "
+                           f"and exemptions to match the new one." if break_even != float('inf') else
+                           "No amount of deductions makes the old regime cheaper at this income.")
+            st.caption("Income is taken as twelve times your monthly income and taxed as salary, "
+                       "so the standard deduction applies under both regimes.")